@@ -0,0 +1,92 @@
+"""
+Comparație memorie / viteză între `src/scalar.py` și o implementare de referință.
+
+Referința se citește dintr-un fișier (`--referinta cale/scalar.py`) sau dintr-o
+revizie git (`--rev <commit>`), de exemplu versiunea cu `__dict__`, `set` de
+părinți și closure per nod:
+
+    python benchmarks/compara_scalar.py --rev 63c7c4d --noduri 200000
+"""
+import argparse
+import gc
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import ModuleType
+
+RADACINA = Path(__file__).resolve().parent.parent
+
+
+def incarca_modul(nume: str, cale: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(nume, cale)
+    modul = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modul)
+    return modul
+
+
+def sursa_din_git(rev: str) -> Path:
+    sursa = subprocess.run(
+        ['git', 'show', f'{rev}:src/scalar.py'],
+        cwd=RADACINA, check=True, capture_output=True, text=True,
+    ).stdout
+    fisier = Path(tempfile.mkdtemp()) / 'scalar_referinta.py'
+    fisier.write_text(sursa)
+    return fisier
+
+
+def construieste(Scalar, n: int):
+    """Lanț de tip neuron: s = b + Σ w_i · x_i, apoi tanh (≈ 2n noduri)."""
+    s = Scalar(0.0)
+    for i in range(n):
+        s = s + Scalar(0.001 * i) * Scalar(1.0)
+    return s.tanh()
+
+
+def masoara(Scalar, n: int) -> dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    rad = construieste(Scalar, n)
+    t_inainte = time.perf_counter() - t0
+    _, varf = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    rad.retroprop()
+    t_inapoi = time.perf_counter() - t0
+
+    return {
+        'octeti_per_nod': varf / (3 * n),
+        'inainte_s': t_inainte,
+        'inapoi_s': t_inapoi,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    grup = parser.add_mutually_exclusive_group(required=True)
+    grup.add_argument('--referinta', type=Path)
+    grup.add_argument('--rev')
+    parser.add_argument('--noduri', type=int, default=100_000)
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * args.noduri))
+    cale_ref = args.referinta or sursa_din_git(args.rev)
+    referinta = incarca_modul('scalar_referinta', cale_ref)
+    curent = incarca_modul('scalar_curent', RADACINA / 'src' / 'scalar.py')
+
+    rez_ref = masoara(referinta.Scalar, args.noduri)
+    rez_cur = masoara(curent.Scalar, args.noduri)
+
+    print(f"{'metrică':<16}{'referință':>14}{'curent':>14}{'raport':>10}")
+    for cheie in rez_ref:
+        r, c = rez_ref[cheie], rez_cur[cheie]
+        print(f'{cheie:<16}{r:>14.4f}{c:>14.4f}{r / c:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+"""
+Suită de benchmark-uri pentru căile critice: `Scalar`, `Neuron`, `NN`.
+
+Fiecare benchmark măsoară timpul (minim și median din `--repetari` rulări) și
+vârful de memorie alocată (tracemalloc, într-o rulare separată). Rezultatele
+se scriu ca JSON și se pot compara cu o rulare anterioară; scriptul iese cu
+cod 1 dacă o metrică depășește referința cu mai mult de `--prag`:
+
+    python benchmarks/suita.py --iesire referinta.json
+    python benchmarks/suita.py --referinta referinta.json --prag 0.25
+
+`--filtru nn/` rulează doar benchmark-urile al căror nume conține textul dat;
+`--rapid` sare peste arhitecturile mari.
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator
+
+RADACINA = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RADACINA / 'src'))
+
+from neuron import Neuron  # noqa: E402
+from nn import NN  # noqa: E402
+from optim import SGD  # noqa: E402
+from scalar import Scalar  # noqa: E402
+
+# Un benchmark: pregătirea (nemăsurată) întoarce pasul care se cronometrează.
+Pas = Callable[[], object]
+Benchmark = tuple[str, Callable[[], Pas]]
+
+ARHITECTURI = ([2, 4, 1], [16, 16, 1], [64, 64, 1], [256, 256, 256, 1])
+ARHITECTURI_MARI = ([256, 256, 256, 1],)
+BATCH = 4
+
+
+def _operatii(n: int) -> Pas:
+    """n operații (înmulțire + adunare) construite în lanț."""
+    x = Scalar(0.5)
+
+    def pas() -> Scalar:
+        s = Scalar(1.0)
+        for _ in range(n // 2):
+            s = s * 0.5 + x
+        return s
+    return pas
+
+
+def _adancime(n: int) -> Pas:
+    """Retropropagare printr-un lanț de n noduri tanh."""
+    s = Scalar(0.1)
+    for _ in range(n):
+        s = s.tanh()
+    return s.retroprop
+
+
+def _latime(n: int) -> Pas:
+    """Retropropagare printr-o sumă de n produse care împart aceeași frunză."""
+    x = Scalar(0.1)
+    s = Scalar.sum(x * (0.001 * i) for i in range(n))
+    return s.retroprop
+
+
+def _neuron(intrari: int, apeluri: int = 100) -> Pas:
+    neuron = Neuron(intrari)
+    x = [Scalar(random.uniform(-1.0, 1.0)) for _ in range(intrari)]
+
+    def pas() -> None:
+        for _ in range(apeluri):
+            neuron(x)
+    return pas
+
+
+def _date(dimensiuni: list[int]) -> tuple[list[list[float]], list[list[float]]]:
+    X = [[random.uniform(-1.0, 1.0) for _ in range(dimensiuni[0])] for _ in range(BATCH)]
+    Y = [[random.uniform(-1.0, 1.0) for _ in range(dimensiuni[-1])] for _ in range(BATCH)]
+    return X, Y
+
+
+def _nn_forward(dimensiuni: list[int]) -> Pas:
+    net = NN(dimensiuni)
+    X, Y = _date(dimensiuni)
+    return lambda: net.pierdere_batch(X, Y)
+
+
+def _nn_backward(dimensiuni: list[int]) -> Pas:
+    net = NN(dimensiuni)
+    X, Y = _date(dimensiuni)
+    return net.pierdere_batch(X, Y).retroprop
+
+
+def _nn_pas(dimensiuni: list[int]) -> Pas:
+    """Un pas complet de antrenare: zero_grad, forward + backward, SGD."""
+    net = NN(dimensiuni)
+    X, Y = _date(dimensiuni)
+    optim = SGD(net.parametri(), lr=0.01)
+
+    def pas() -> None:
+        optim.zero_grad()
+        net.retroprop_batch(X, Y)
+        optim.step()
+    return pas
+
+
+def benchmarkuri(rapid: bool = False) -> Iterator[Benchmark]:
+    for n in (1_000, 10_000, 100_000):
+        yield f'scalar/operatii/{n}', lambda n=n: _operatii(n)
+    for n in (100, 1_000, 10_000):
+        yield f'scalar/retroprop/adancime/{n}', lambda n=n: _adancime(n)
+    for n in (100, 1_000, 10_000):
+        yield f'scalar/retroprop/latime/{n}', lambda n=n: _latime(n)
+    for n in (4, 64, 512):
+        yield f'neuron/apel/{n}', lambda n=n: _neuron(n)
+    for dim in ARHITECTURI:
+        if rapid and dim in ARHITECTURI_MARI:
+            continue
+        nume = '-'.join(map(str, dim))
+        yield f'nn/forward/{nume}', lambda dim=dim: _nn_forward(dim)
+        yield f'nn/backward/{nume}', lambda dim=dim: _nn_backward(dim)
+        yield f'nn/pas/{nume}', lambda dim=dim: _nn_pas(dim)
+
+
+def masoara(pregatire: Callable[[], Pas], repetari: int) -> dict[str, float]:
+    """
+    Timpul pasului în `repetari` rulări, fiecare cu o pregătire proaspătă și
+    cu garbage collector-ul oprit (ca `timeit`), plus vârful de memorie.
+    """
+    timpi = []
+    for _ in range(repetari):
+        pas = pregatire()
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            pas()
+            timpi.append(time.perf_counter() - t0)
+        finally:
+            gc.enable()
+
+    pas = pregatire()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        pas()
+        _, varf = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'timp_min_s': min(timpi),
+        'timp_median_s': statistics.median(timpi),
+        'memorie_varf_o': varf,
+    }
+
+
+def ruleaza(repetari: int = 5, filtru: str = '', rapid: bool = False, seed: int = 0) -> dict:
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100_000))
+    rezultate = {}
+    for nume, pregatire in benchmarkuri(rapid):
+        if filtru not in nume:
+            continue
+        random.seed(seed)
+        rezultate[nume] = masoara(pregatire, repetari)
+    return {
+        'meta': {
+            'data': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platforma': platform.platform(),
+            'repetari': repetari,
+        },
+        'rezultate': rezultate,
+    }
+
+
+# Metricile comparate cu referința: timpul minim e cel mai puțin zgomotos
+METRICI = ('timp_min_s', 'memorie_varf_o')
+
+
+def compara(curent: dict, referinta: dict, prag: float) -> list[tuple[str, str, float, float, bool]]:
+    """
+    Pentru fiecare benchmark prezent în ambele rulări: (nume, metrică,
+    referință, curent, regresie), unde regresie înseamnă curent > referință · (1 + prag).
+    """
+    rand = []
+    ref = referinta['rezultate']
+    for nume, valori in curent['rezultate'].items():
+        if nume not in ref:
+            continue
+        for metrica in METRICI:
+            r, c = ref[nume][metrica], valori[metrica]
+            rand.append((nume, metrica, r, c, c > r * (1.0 + prag)))
+    return rand
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iesire', type=Path, help='fișierul JSON cu rezultatele')
+    parser.add_argument('--referinta', type=Path, help='rezultatele unei rulări anterioare')
+    parser.add_argument('--prag', type=float, default=0.2,
+                        help='creșterea relativă tolerată față de referință (implicit 0.2)')
+    parser.add_argument('--repetari', type=int, default=5)
+    parser.add_argument('--filtru', default='')
+    parser.add_argument('--rapid', action='store_true')
+    args = parser.parse_args(argv)
+
+    rezultat = ruleaza(args.repetari, args.filtru, args.rapid)
+    print(f"{'benchmark':<34}{'min (ms)':>12}{'median (ms)':>14}{'memorie (KiB)':>16}")
+    for nume, r in rezultat['rezultate'].items():
+        print(f"{nume:<34}{r['timp_min_s'] * 1e3:>12.3f}{r['timp_median_s'] * 1e3:>14.3f}"
+              f"{r['memorie_varf_o'] / 1024:>16.1f}")
+    if args.iesire is not None:
+        args.iesire.write_text(json.dumps(rezultat, indent=2))
+
+    if args.referinta is None:
+        return 0
+    regresii = 0
+    print(f"\n{'benchmark':<34}{'metrică':<16}{'raport':>8}")
+    for nume, metrica, r, c, regresie in compara(rezultat, json.loads(args.referinta.read_text()), args.prag):
+        regresii += regresie
+        raport = c / r if r else float('inf')
+        print(f"{nume:<34}{metrica:<16}{raport:>7.2f}x{'  REGRESIE' if regresie else ''}")
+    print(f'\n{regresii} regresii peste pragul de {args.prag:.0%}')
+    return 1 if regresii else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import math
+from typing import Callable, Iterable
+
+from nn import NN
+from optim import SGD, Optimizator
+
+
+class Trainer:
+    """
+    Bucla de antrenare pentru `NN`: pentru fiecare mini-batch golește
+    gradientele, calculează pierderea MSE și o retropropagă
+    (`NN.retroprop_batch`), apoi face un pas de optimizare.
+
+    `gradient` poate înlocui calculul gradientului cu orice obiect care are
+    `retroprop_batch(X, Y)` și scrie în `net.tampon` (de ex. `GradientParalel`).
+    """
+
+    def __init__(
+        self,
+        net: NN,
+        optimizator: Optimizator | None = None,
+        gradient: object | None = None,
+    ) -> None:
+        self.net = net
+        self.optimizator: Optimizator = optimizator or SGD(net.parametri(), lr=0.05)
+        self.gradient = gradient if gradient is not None else net
+        self.istoric: list[float] = []
+
+    def pas(self, X: list[list[float]], Y: list) -> float:
+        self.optimizator.zero_grad()
+        pierdere = self.gradient.retroprop_batch(X, Y)
+        self.optimizator.step()
+        return pierdere
+
+    def epoca(self, date: Iterable[tuple[list[list[float]], list]]) -> float:
+        """O trecere prin `date`; întoarce pierderea medie pe exemplu."""
+        suma, exemple = 0.0, 0
+        for X, Y in date:
+            suma += self.pas(X, Y) * len(X)
+            exemple += len(X)
+        if exemple == 0:
+            raise ValueError('Sursa de date nu a produs niciun exemplu')
+        return suma / exemple
+
+    def antreneaza(
+        self,
+        date: Iterable[tuple[list[list[float]], list]],
+        epoci: int,
+        la_final_de_epoca: Callable[[int, float], None] | None = None,
+    ) -> list[float]:
+        """Rulează `epoci` epoci; `date` este reiterat la fiecare (de ex. un `DataLoader`)."""
+        for e in range(epoci):
+            pierdere = self.epoca(date)
+            if not math.isfinite(pierdere):
+                raise ValueError(f'Pierdere non-finită în epoca {e}')
+            self.istoric.append(pierdere)
+            if la_final_de_epoca is not None:
+                la_final_de_epoca(e, pierdere)
+        return self.istoric
@@ -0,0 +1,269 @@
+import math
+from array import array
+from typing import Self, Sequence
+
+# Coduri de operație pe bandă
+OP_FRUNZA = 0
+OP_ADD = 1
+OP_MUL = 2
+OP_POW = 3
+OP_TANH = 4
+OP_RELU = 5
+OP_DOT_TANH = 6
+
+
+class Banda:
+    """
+    Bandă de calcul (listă Wengert) ca alternativă la graful de obiecte `Scalar`.
+
+    Fiecare operație adaugă o înregistrare în tablouri contigue: codul
+    operației, indicii operanzilor, argumentul (exponentul la '**') și
+    valoarea. Retropropagarea este o singură parcurgere inversă a benzii.
+    Un neuron întreg (`dot_tanh`) e o singură înregistrare: ponderile și
+    bias-ul sunt un bloc de parametri, iar indicii intrărilor stau în
+    `operanzi`.
+
+    Parametrii se creează înaintea oricărui calcul și ocupă prefixul benzii;
+    `goleste()` păstrează prefixul și elimină restul înregistrărilor, iar
+    după aceea orice operație cu nodurile eliminate ridică RuntimeError.
+    `NN` golește banda la primul forward de după o retropropagare
+    (`retropropagata`), deci o buclă de antrenare nu o face să crească.
+    """
+
+    def __init__(self) -> None:
+        self.operatii = array('b')
+        self.stanga = array('l')
+        self.dreapta = array('l')
+        self.arg = array('d')
+        self.valori = array('d')
+        self.gradienti = array('d')
+        self.operanzi = array('l')  # intrările înregistrărilor `dot_tanh`
+        self.nr_parametri: int = 0
+        self.generatie: int = 0
+        self.retropropagata: bool = False
+        self.intact: bool = True  # ca la `TamponParametri`
+
+    def __len__(self) -> int:
+        return len(self.valori)
+
+    def _adauga(self, op: int, a: int, b: int, arg: float, valoare: float) -> 'NodBanda':
+        if not -math.inf < valoare < math.inf:
+            raise ValueError("Valoarea nu poate fi NaN sau inf")
+
+        self.operatii.append(op)
+        self.stanga.append(a)
+        self.dreapta.append(b)
+        self.arg.append(arg)
+        self.valori.append(valoare)
+        self.gradienti.append(0.0)
+        return NodBanda(self, len(self.valori) - 1)
+
+    def parametru(self, valoare: float) -> 'NodBanda':
+        """Frunză persistentă (pondere/bias); supraviețuiește lui `goleste()`."""
+        if len(self.valori) != self.nr_parametri:
+            raise RuntimeError('Parametrii trebuie creați înaintea oricărei operații pe bandă')
+        nod = self._adauga(OP_FRUNZA, -1, -1, 0.0, float(valoare))
+        self.nr_parametri += 1
+        return nod
+
+    def constanta(self, valoare: float) -> 'NodBanda':
+        """Frunză temporară (intrare, țintă); dispare la `goleste()`."""
+        return self._adauga(OP_FRUNZA, -1, -1, 0.0, float(valoare))
+
+    def goleste(self) -> None:
+        """Elimină tot ce s-a înregistrat după parametri."""
+        p = self.nr_parametri
+        for tablou in (self.operatii, self.stanga, self.dreapta,
+                       self.arg, self.valori, self.gradienti):
+            del tablou[p:]
+        del self.operanzi[:]
+        self.generatie += 1
+        self.retropropagata = False
+
+    def dot_tanh(self, start: int, n: int, intrari: Sequence['NodBanda | float']) -> 'NodBanda':
+        """
+        tanh(b + Σ w_i · x_i) ca o singură înregistrare, ca `Scalar.dot_tanh`:
+        ponderile sunt parametrii [start, start + n), bias-ul start + n.
+        """
+        if len(intrari) != n:
+            raise ValueError(f"Produs scalar între vectori de lungimi {n} și {len(intrari)}")
+        indici = []
+        for x in intrari:
+            if isinstance(x, NodBanda):
+                if x.banda is not self:
+                    raise ValueError('Operanzii aparțin unor benzi diferite')
+                x._verifica()
+                indici.append(x.index)
+            else:
+                indici.append(self.constanta(x).index)
+
+        val = self.valori
+        s = val[start + n]
+        for w, i in zip(val[start:start + n], indici):
+            s += w * val[i]
+        k = len(self.operanzi)
+        self.operanzi.extend(indici)
+        return self._adauga(OP_DOT_TANH, start, k, n, math.tanh(s))
+
+    def retroprop(self, index: int) -> None:
+        """dL/d(index) = 1, apoi o parcurgere inversă până la prefixul de parametri."""
+        p = self.nr_parametri
+        n = len(self.valori)
+        g = self.gradienti
+        g[p:n] = array('d', bytes(8 * (n - p)))
+        g[index] = 1.0
+        self.retropropagata = True
+
+        op, st, dr = self.operatii, self.stanga, self.dreapta
+        val, arg, opz = self.valori, self.arg, self.operanzi
+        for i in range(index, p - 1, -1):
+            gi = g[i]
+            if gi == 0.0:
+                continue
+            o = op[i]
+            if o == OP_DOT_TANH:
+                t = val[i]
+                dz = (1.0 - t * t) * gi
+                w, k, n = st[i], dr[i], int(arg[i])
+                for j in range(n):
+                    x = opz[k + j]
+                    g[w + j] += val[x] * dz
+                    g[x] += val[w + j] * dz
+                g[w + n] += dz
+            elif o == OP_ADD:
+                g[st[i]] += gi
+                g[dr[i]] += gi
+            elif o == OP_MUL:
+                a, b = st[i], dr[i]
+                g[a] += val[b] * gi
+                g[b] += val[a] * gi
+            elif o == OP_TANH:
+                t = val[i]
+                g[st[i]] += (1.0 - t * t) * gi
+            elif o == OP_POW:
+                a, exp = st[i], arg[i]
+                g[a] += exp * (val[a] ** (exp - 1)) * gi
+            elif o == OP_RELU:
+                a = st[i]
+                if val[a] > 0:
+                    g[a] += gi
+
+
+class NodBanda:
+    """Referință (bandă, index) la o înregistrare; oferă aceeași interfață ca `Scalar`."""
+
+    __slots__ = ('banda', 'index', 'generatie')
+
+    def __init__(self, banda: Banda, index: int) -> None:
+        self.banda = banda
+        self.index = index
+        self.generatie = banda.generatie
+
+    @property
+    def tampon(self) -> Banda:
+        """Interfața comună cu `Parametru`: tabloul în care stă nodul."""
+        return self.banda
+
+    def _verifica(self) -> None:
+        if self.index >= self.banda.nr_parametri and self.generatie != self.banda.generatie:
+            raise RuntimeError('Nodul aparține unei benzi golite între timp')
+
+    @property
+    def valoare(self) -> float:
+        self._verifica()
+        return self.banda.valori[self.index]
+
+    @valoare.setter
+    def valoare(self, v: float) -> None:
+        self._verifica()
+        self.banda.valori[self.index] = v
+
+    @property
+    def derivata(self) -> float:
+        self._verifica()
+        return self.banda.gradienti[self.index]
+
+    @derivata.setter
+    def derivata(self, g: float) -> None:
+        self._verifica()
+        self.banda.gradienti[self.index] = g
+
+    def _operand(self, alt: Self | float) -> int:
+        """Indicele celui de-al doilea operand; ambii trebuie să fie pe banda curentă."""
+        self._verifica()
+        if isinstance(alt, NodBanda):
+            if alt.banda is not self.banda:
+                raise ValueError('Operanzii aparțin unor benzi diferite')
+            alt._verifica()
+            return alt.index
+        return self.banda.constanta(alt).index
+
+    # Adunare
+    def __add__(self, alt: Self | float) -> Self:
+        b = self._operand(alt)
+        val = self.banda.valori
+        return self.banda._adauga(OP_ADD, self.index, b, 0.0, val[self.index] + val[b])
+
+    # Adunare inversă
+    def __radd__(self, alt: float) -> Self:
+        return self + alt
+
+    # Negativ
+    def __neg__(self) -> Self:
+        return self * -1.0
+
+    # Scădere
+    def __sub__(self, alt: Self | float) -> Self:
+        return self + (-alt)
+
+    # Multiplicare
+    def __mul__(self, alt: Self | float) -> Self:
+        b = self._operand(alt)
+        val = self.banda.valori
+        return self.banda._adauga(OP_MUL, self.index, b, 0.0, val[self.index] * val[b])
+
+    # Multiplicare inversă
+    def __rmul__(self, alt: float) -> Self:
+        return self * alt
+
+    # Împărțire
+    def __truediv__(self, alt: Self | float) -> Self:
+        if not isinstance(alt, NodBanda):
+            alt = self.banda.constanta(alt)
+        return self * alt ** -1
+
+    # Împărțire inversă
+    def __rtruediv__(self, alt: float) -> Self:
+        return self.banda.constanta(alt) / self
+
+    # Exponențiere
+    def __pow__(self, exp: float) -> Self:
+        self._verifica()
+        baza = self.banda.valori[self.index]
+        if baza < 0 and not float(exp).is_integer():
+            raise ValueError("Negative base with non-integer exponent not supported")
+
+        if baza == 0.0 and exp < 0:
+            raise ZeroDivisionError("0 cannot be raised to a negative power")
+
+        return self.banda._adauga(OP_POW, self.index, -1, exp, baza ** exp)
+
+    # Activări element-wise
+    def relu(self) -> Self:
+        self._verifica()
+        v = self.banda.valori[self.index]
+        return self.banda._adauga(OP_RELU, self.index, -1, 0.0, v if v > 0 else 0.0)
+
+    def tanh(self) -> Self:
+        self._verifica()
+        v = self.banda.valori[self.index]
+        return self.banda._adauga(OP_TANH, self.index, -1, 0.0, math.tanh(v))
+
+    # Propagare înapoi
+    def retroprop(self) -> None:
+        """Pornește retropropagarea pe bandă (setează dL/dself = 1)."""
+        self._verifica()
+        self.banda.retroprop(self.index)
+
+    def __repr__(self) -> str:
+        return f'NodBanda(valoare={self.valoare:.4f}, deriv={self.derivata:.4f})'
@@ -0,0 +1,332 @@
+import math
+from array import array
+from typing import List, Sequence
+
+from nn import NN
+from scalar import Scalar
+
+# Instrucțiune: (operație, slot ieșire, sloturi operanzi, argument)
+Instructiune = tuple[str, int, tuple[int, ...], float]
+
+# Operațiile pe care graful capturat le știe executa; 'dot_tanh_bloc' devine 'dot_tanh'.
+# 'sub', 'neg' și 'div' nu apar în graful `Scalar`; le introduce `optimizare_graf`.
+OPERATII = ('+', '*', '**', 'tanh', 'ReLU', 'sum', 'dot', 'dot_tanh', 'sub', 'neg', 'div')
+
+
+class Graf:
+    """
+    Un graf `Scalar` urmărit o dată și transformat într-o listă plată de
+    instrucțiuni peste sloturile unui tablou de valori:
+
+        [0, P)          parametrii, în ordinea din `parametri`;
+        [P, P + I)      intrările (substituenții din `intrari`);
+        restul          constantele și nodurile interne, în ordine topologică.
+
+    Orice altă frunză devine constantă, cu valoarea din momentul capturii.
+    Reexecutarea (`_inainte`, `_inapoi`) face aceleași operații, în aceeași
+    ordine, ca graful original, deci dă exact aceleași valori.
+    """
+
+    def __init__(
+        self,
+        iesire: Scalar,
+        intrari: Sequence[Scalar],
+        parametri: Sequence[Scalar],
+        iesiri: Sequence[Scalar] = (),
+    ) -> None:
+        self.nr_parametri: int = len(parametri)
+        self.nr_intrari: int = len(intrari)
+        self.instructiuni: list[Instructiune] = []
+
+        slot: dict[int, int] = {}
+        for i, frunza in enumerate((*parametri, *intrari)):
+            slot[id(frunza)] = i
+        valori = array('d', [p.valoare for p in parametri])
+        valori.extend(x.valoare for x in intrari)
+
+        for nod in iesire.ordine_topologica():
+            if id(nod) in slot:
+                continue
+            slot[id(nod)] = len(valori)
+            valori.append(nod.valoare)
+            if not nod._parinti:
+                continue  # constantă
+
+            op = 'dot_tanh' if nod._operatie == 'dot_tanh_bloc' else nod._operatie
+            if op not in OPERATII:
+                raise ValueError(f'Operația {nod._operatie!r} nu poate fi capturată')
+            operanzi = tuple(slot[id(p)] for p in nod._parinti)
+            self.instructiuni.append((op, slot[id(nod)], operanzi, nod._arg))
+
+        self.valori = valori
+        self.gradienti = array('d', bytes(8 * len(valori)))
+        self.pierdere: int = slot[id(iesire)]
+        self.iesiri: list[int] = [slot[id(y)] for y in iesiri]
+        self._programeaza()
+
+    def _programeaza(self) -> None:
+        """
+        Pregătește pașii de execuție: operanzii lui 'dot'/'dot_tanh' grupați pe
+        perechi (w, x); înapoi rămân doar instrucțiunile care depind de parametri.
+        """
+        cu_gradient = self.cu_gradient()
+        pasi = []
+        for op, i, a, arg in self.instructiuni:
+            if op in ('dot', 'dot_tanh'):
+                n = int(arg)
+                k = 1 if op == 'dot_tanh' else 0
+                a = (a[0] if k else -1, tuple(zip(a[k:k + n], a[k + n:])))
+            pasi.append((op, i, a, arg))
+        self._pasi = pasi
+        self._pasi_inapoi = [pas for pas in reversed(pasi) if pas[1] in cu_gradient]
+        self._zero = array('d', bytes(8 * (len(self.valori) - self.nr_parametri)))
+
+    def cu_gradient(self) -> set[int]:
+        """Sloturile prin care gradientul poate ajunge la un parametru."""
+        sloturi = set(range(self.nr_parametri))
+        for _, i, a, _ in self.instructiuni:
+            if not sloturi.isdisjoint(a):
+                sloturi.add(i)
+        return sloturi
+
+    def constante(self) -> dict[int, float]:
+        """Sloturile folosite care nu sunt nici parametri, nici intrări, nici rezultate."""
+        folosite = {self.pierdere, *self.iesiri}
+        for _, _, a, _ in self.instructiuni:
+            folosite.update(a)
+        folosite.difference_update(i for _, i, _, _ in self.instructiuni)
+        start = self.nr_parametri + self.nr_intrari
+        return {i: self.valori[i] for i in sorted(folosite) if i >= start}
+
+    def semnatura(self) -> tuple:
+        """Identifică structura grafului (inclusiv valorile constantelor)."""
+        return (
+            self.nr_parametri, self.nr_intrari, self.pierdere, tuple(self.iesiri),
+            tuple(self.instructiuni), tuple(self.constante().items()),
+        )
+
+    def __len__(self) -> int:
+        return len(self.instructiuni)
+
+    def _inainte(self) -> None:
+        v = self.valori
+        tanh = math.tanh
+        for op, i, a, arg in self._pasi:
+            if op == 'dot_tanh':
+                b, perechi = a
+                s = v[b]
+                for w, x in perechi:
+                    s += v[w] * v[x]
+                v[i] = tanh(s)
+            elif op == '+':
+                v[i] = v[a[0]] + v[a[1]]
+            elif op == '*':
+                v[i] = v[a[0]] * v[a[1]]
+            elif op == 'sub':
+                v[i] = v[a[0]] - v[a[1]]
+            elif op == 'neg':
+                v[i] = -v[a[0]]
+            elif op == 'div':
+                v[i] = v[a[0]] / v[a[1]]
+            elif op == '**':
+                v[i] = v[a[0]] ** arg
+            elif op == 'sum':
+                s = 0.0
+                for p in a:
+                    s += v[p]
+                v[i] = s
+            elif op == 'dot':
+                s = 0.0
+                for w, x in a[1]:
+                    s += v[w] * v[x]
+                v[i] = s
+            elif op == 'tanh':
+                v[i] = tanh(v[a[0]])
+            elif op == 'ReLU':
+                x = v[a[0]]
+                v[i] = x if x > 0 else 0.0
+
+        if not -math.inf < v[self.pierdere] < math.inf:
+            raise ValueError("Valoarea nu poate fi NaN sau inf")
+
+    def _inapoi(self) -> None:
+        """Retropropagare din `pierdere`; gradientele parametrilor (g[:P]) se cumulează."""
+        v, g = self.valori, self.gradienti
+        g[self.nr_parametri:] = self._zero
+        g[self.pierdere] += 1.0
+
+        for op, i, a, arg in self._pasi_inapoi:
+            gi = g[i]
+            if gi == 0.0:
+                continue
+            if op == 'dot_tanh':
+                b, perechi = a
+                t = v[i]
+                dz = (1.0 - t * t) * gi
+                g[b] += dz
+                for w, x in perechi:
+                    g[w] += v[x] * dz
+                    g[x] += v[w] * dz
+            elif op == '+':
+                g[a[0]] += gi
+                g[a[1]] += gi
+            elif op == '*':
+                x, y = a
+                g[x] += v[y] * gi
+                g[y] += v[x] * gi
+            elif op == 'sub':
+                g[a[0]] += gi
+                g[a[1]] -= gi
+            elif op == 'neg':
+                g[a[0]] -= gi
+            elif op == 'div':
+                x, y = a
+                g[x] += gi / v[y]
+                g[y] -= v[i] / v[y] * gi
+            elif op == '**':
+                x = a[0]
+                g[x] += arg * (v[x] ** (arg - 1)) * gi
+            elif op == 'sum':
+                for p in a:
+                    g[p] += gi
+            elif op == 'dot':
+                for w, x in a[1]:
+                    g[w] += v[x] * gi
+                    g[x] += v[w] * gi
+            elif op == 'tanh':
+                t = v[i]
+                g[a[0]] += (1.0 - t * t) * gi
+            elif op == 'ReLU':
+                if v[a[0]] > 0:
+                    g[a[0]] += gi
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({len(self.instructiuni)} instrucțiuni, {len(self.valori)} sloturi)'
+
+
+class PlanStatic(Graf):
+    """
+    Graful forward/backward al unei rețele `NN`, capturat o singură dată.
+
+    Pentru o arhitectură fixă graful are aceeași formă la fiecare exemplu;
+    se schimbă doar valorile intrărilor. Planul urmărește o trecere a
+    rețelei pe intrări și ținte substituent (pierdere MSE, ca în
+    `NN.pierdere_batch`); parametrii ocupă sloturile [0, P) în ordinea din
+    `net.tampon`, urmați de intrări (batch × dimensiuni[0]) și de ținte
+    (batch × dimensiuni[-1]).
+
+    Un apel ulterior doar copiază parametrii și datele în sloturi și
+    reexecută instrucțiunile înainte, apoi înapoi: nu se alocă noduri și nu
+    se mai face sortarea topologică. Rezultatele sunt identice cu ale
+    grafului `Scalar`.
+
+    Planul rămâne valid cât timp structura rețelei nu se schimbă; valorile
+    parametrilor se citesc din tampon la fiecare apel (prin obiecte, dacă
+    tamponul nu e intact). Dacă parametrii sunt înlocuiți după captură,
+    planul ridică RuntimeError și trebuie recapturat. Cu `optimizat=True`
+    graful trece prin `optimizare_graf.optimizeaza_graf`, iar raportul
+    rămâne în `raport`.
+    """
+
+    def __init__(self, net: NN, batch: int = 1, optimizat: bool = False) -> None:
+        if net.backend != 'scalar':
+            raise ValueError(f"Captura necesită backend-ul 'scalar', nu {net.backend!r}")
+        if batch < 1:
+            raise ValueError(f'Dimensiunea batch-ului trebuie să fie ≥ 1, nu {batch}')
+        self.net = net
+        self.batch: int = batch
+
+        n, m = net.dimensiuni[0], net.dimensiuni[-1]
+        intrari = [Scalar(0.0) for _ in range(batch * n)]
+        tinte = [Scalar(0.0) for _ in range(batch * m)]
+
+        # aceleași operații ca NN._forward + NN.pierdere_batch
+        iesiri: list[Scalar] = []
+        termeni = []
+        for r in range(batch):
+            activari = intrari[r * n:(r + 1) * n]
+            for layer in net.layers:
+                activari = layer(activari)
+            iesiri.extend(activari)
+            termeni.extend((y - t) ** 2 for y, t in zip(activari, tinte[r * m:(r + 1) * m]))
+        pierdere = Scalar.sum(termeni) * (1.0 / batch)
+
+        self._parametri = net.parametri()
+        super().__init__(pierdere, [*intrari, *tinte], self._parametri, iesiri)
+        self.raport: dict[str, int] | None = None
+        if optimizat:
+            from optimizare_graf import optimizeaza_graf
+            self.raport = optimizeaza_graf(self)
+
+    def _incarca(self, X: List[List[float]], Y: List[float] | List[List[float]]) -> None:
+        if len(X) != self.batch or len(Y) != self.batch:
+            raise ValueError(f'Planul a fost capturat pentru batch {self.batch}, nu {len(X)}')
+        date = array('d')
+        for x in X:
+            date.extend(x)
+        for t in Y:
+            if isinstance(t, (list, tuple)):
+                date.extend(t)
+            else:
+                date.append(t)
+        if len(date) != self.nr_intrari:
+            raise ValueError('Dimensiunile intrărilor sau ale țintelor diferă de cele ale rețelei')
+
+        v, P = self.valori, self.nr_parametri
+        parametri = self._parametri_obiecte()
+        if parametri is None:
+            v[:P] = self.net.tampon.valori[:P]
+        else:
+            v[:P] = array('d', [p.valoare for p in parametri])
+        v[P:P + self.nr_intrari] = date
+
+    def _parametri_obiecte(self) -> list[Scalar] | None:
+        """
+        None dacă parametrii sunt exact tamponul rețelei (citire și scriere în
+        bloc); altfel obiectele capturate, dacă rețeaua le folosește încă.
+        """
+        if self.net.tampon.intact:
+            return None
+        parametri = self.net.parametri()
+        if len(parametri) != self.nr_parametri or any(a is not b for a, b in zip(parametri, self._parametri)):
+            raise RuntimeError('Parametrii rețelei au fost înlocuiți după captură; planul trebuie recapturat')
+        return parametri
+
+    def _gradienti_retea(self) -> array:
+        parametri = self._parametri_obiecte()
+        if parametri is None:
+            return self.net.tampon.gradienti[:self.nr_parametri]
+        return array('d', [p.derivata for p in parametri])
+
+    def _scrie_gradienti(self, gradienti: Sequence[float]) -> None:
+        parametri = self._parametri_obiecte()
+        if parametri is None:
+            self.net.tampon.gradienti[:self.nr_parametri] = array('d', gradienti)
+            return
+        for p, g in zip(parametri, gradienti):
+            p.derivata = g
+
+    def forward(self, X: List[List[float]], Y: List[float] | List[List[float]]) -> float:
+        """Reexecută doar forward-ul; întoarce pierderea (ieșirile rămân în `valori[iesiri]`)."""
+        self._incarca(X, Y)
+        self._inainte()
+        return self.valori[self.pierdere]
+
+    def retroprop_batch(self, X: List[List[float]], Y: List[float] | List[List[float]]) -> float:
+        """
+        Ca `NN.retroprop_batch`: gradientele se cumulează în `net.tampon`.
+        Un batch de altă mărime (de ex. ultimul dintr-o epocă) trece prin
+        graful obișnuit al rețelei.
+        """
+        if len(X) != self.batch:
+            return self.net.retroprop_batch(X, Y)
+        self._incarca(X, Y)
+        self._inainte()
+        P = self.nr_parametri
+        self.gradienti[:P] = self._gradienti_retea()
+        self._inapoi()
+        self._scrie_gradienti(self.gradienti[:P])
+        return self.valori[self.pierdere]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({len(self.instructiuni)} instrucțiuni, {len(self.valori)} sloturi, batch {self.batch})'
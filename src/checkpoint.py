@@ -0,0 +1,149 @@
+import mmap
+import os
+import stat
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from nn import NN
+
+# Antet: semnătură, versiune, tip de date ('d' = float64, 'f' = float32), număr de dimensiuni
+_SEMNATURA = b'NNTS'
+_VERSIUNE = 1
+_ANTET = struct.Struct('<4sBcxxI')
+TIPURI = ('d', 'f')
+
+
+def _aliniat(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _dimensiuni_parametri(dimensiuni: List[int]) -> int:
+    return sum((dimensiuni[i] + 1) * dimensiuni[i + 1] for i in range(len(dimensiuni) - 1))
+
+
+def serializeaza(dimensiuni: List[int], valori: array, tip: str = 'd') -> bytes:
+    """
+    Formatul checkpoint-ului (little-endian):
+
+        antet       'NNTS', versiune, tip ('d'/'f'), număr de dimensiuni;
+        dimensiuni  uint32 fiecare, apoi completare până la multiplu de 8 octeți;
+        parametri   un singur tablou contiguu, în ordinea lui `NN.parametri()`:
+                    stratul 0, apoi stratul 1 etc., câte [w_1..w_n, b] pe neuron.
+    """
+    if tip not in TIPURI:
+        raise ValueError(f'Tip de date necunoscut: {tip!r} (disponibile: {", ".join(TIPURI)})')
+    parametri = array(tip, valori)
+    if sys.byteorder != 'little':
+        parametri.byteswap()
+    antet = _ANTET.pack(_SEMNATURA, _VERSIUNE, tip.encode(), len(dimensiuni))
+    antet += struct.pack(f'<{len(dimensiuni)}I', *dimensiuni)
+    return antet.ljust(_aliniat(len(antet)), b'\0') + parametri.tobytes()
+
+
+def _citeste_antet(buf: memoryview) -> tuple[list[int], str, int]:
+    """Dimensiunile, tipul și poziția tabloului de parametri; validează lungimea."""
+    if len(buf) < _ANTET.size:
+        raise ValueError('Fișier prea scurt pentru un checkpoint')
+    semnatura, versiune, tip, k = _ANTET.unpack_from(buf)
+    if semnatura != _SEMNATURA:
+        raise ValueError('Fișierul nu este un checkpoint NN')
+    if versiune != _VERSIUNE:
+        raise ValueError(f'Versiune de checkpoint nesuportată: {versiune}')
+    tip = tip.decode()
+    if tip not in TIPURI:
+        raise ValueError(f'Tip de date necunoscut în checkpoint: {tip!r}')
+
+    start = _aliniat(_ANTET.size + 4 * k)
+    if len(buf) < start:
+        raise ValueError('Checkpoint trunchiat')
+    dimensiuni = list(struct.unpack_from(f'<{k}I', buf, _ANTET.size))
+    asteptat = start + array(tip).itemsize * _dimensiuni_parametri(dimensiuni)
+    if len(buf) != asteptat:
+        raise ValueError(f'Checkpoint de {len(buf)} octeți; pentru {dimensiuni} se așteptau {asteptat}')
+    return dimensiuni, tip, start
+
+
+def _mod_fisier(cale: Path) -> int:
+    """Permisiunile pe care le-ar avea `cale` scrisă direct: ale fișierului existent, altfel 0o666 fără umask."""
+    try:
+        return stat.S_IMODE(os.stat(cale).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def scrie_atomic(cale: str | os.PathLike, continut: bytes) -> None:
+    """
+    Scrie într-un fișier temporar din același director, îl sincronizează pe
+    disc și abia apoi îl redenumește peste `cale` (`os.replace` e atomic):
+    o întrerupere lasă fie fișierul vechi, fie pe cel nou, niciodată unul parțial.
+    `mkstemp` creează fișierul cu 0600, așa că i se dau permisiunile obișnuite.
+    """
+    cale = Path(cale)
+    fd, temporar = tempfile.mkstemp(dir=cale.parent, prefix=f'.{cale.name}.', suffix='.tmp')
+    try:
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, _mod_fisier(cale))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(continut)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporar, cale)
+    except BaseException:
+        os.unlink(temporar)
+        raise
+    if hasattr(os, 'O_DIRECTORY'):
+        # și redenumirea trebuie să ajungă pe disc
+        d = os.open(cale.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(d)
+        finally:
+            os.close(d)
+
+
+def salveaza(net: 'NN', cale: str | os.PathLike, tip: str = 'd') -> None:
+    scrie_atomic(cale, serializeaza(net.dimensiuni, net.citeste_parametri(), tip))
+
+
+def mapeaza(cale: str | os.PathLike) -> tuple[list[int], memoryview]:
+    """
+    Dimensiunile și parametrii unui checkpoint, ca vedere doar-citire asupra
+    fișierului mapat în memorie: nu se copiază nimic, iar paginile sunt
+    partajate între procesele care mapează același fișier. Vederea (de tip
+    'd' sau 'f') rămâne validă cât timp există referințe la ea.
+    """
+    with open(cale, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    buf = memoryview(mm)
+    dimensiuni, tip, start = _citeste_antet(buf)
+    if sys.byteorder != 'little':
+        raise ValueError('Maparea directă necesită o platformă little-endian; folosiți `incarca`')
+    return dimensiuni, buf[start:].cast(tip)
+
+
+def incarca(cale: str | os.PathLike, backend: str = 'scalar') -> 'NN':
+    """
+    Rețea nouă cu arhitectura și parametrii din checkpoint. Fișierul se
+    mapează în memorie, iar parametrii se copiază în tamponul rețelei
+    într-o singură operație.
+    """
+    from nn import NN
+
+    with open(cale, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as buf:
+            dimensiuni, tip, start = _citeste_antet(buf)
+            parametri = array(tip)
+            with buf[start:] as date:
+                parametri.frombytes(date)
+    if sys.byteorder != 'little':
+        parametri.byteswap()
+
+    net = NN(dimensiuni, backend=backend)
+    net.scrie_parametri(parametri)
+    return net
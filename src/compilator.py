@@ -0,0 +1,257 @@
+import math
+from array import array
+from collections import OrderedDict
+from typing import Callable, List, Sequence
+
+from captura import Graf, PlanStatic
+from nn import NN
+from scalar import Scalar, no_grad
+
+# Funcțiile generate, după semnătura grafului: (forward, forward + retroprop).
+# Cel mult _CACHE_MAXIM intrări; la depășire se elimină cea folosită cel mai demult.
+_CACHE: OrderedDict[tuple, tuple[Callable, Callable]] = OrderedDict()
+_CACHE_MAXIM = 32
+
+# Cel mult atâția termeni într-o expresie (compilatorul Python e recursiv pe adâncimea AST)
+_TERMENI_PE_EXPRESIE = 64
+
+
+def _suma(tinta: str, termeni: list[str], linii: list[str], prefix: str = '') -> None:
+    """`tinta = t_1 + t_2 + ...` (asociere la stânga), împărțită în instrucțiuni scurte."""
+    primul = termeni[:_TERMENI_PE_EXPRESIE]
+    linii.append(f'    {tinta} = {prefix}{" + ".join(primul)}')
+    for k in range(_TERMENI_PE_EXPRESIE, len(termeni), _TERMENI_PE_EXPRESIE):
+        linii.append(f'    {tinta} = {tinta} + {" + ".join(termeni[k:k + _TERMENI_PE_EXPRESIE])}')
+
+
+def genereaza_sursa(graf: Graf) -> str:
+    """
+    Sursa Python a două funcții fără bucle, peste variabile locale float:
+
+        inainte(v)              -> pierderea; scrie ieșirile în v
+        inainte_inapoi(v, G)    -> (pierderea, gradientele parametrilor)
+
+    `v` conține valorile parametrilor și ale intrărilor (sloturile [0, P + I)
+    ale grafului), `G` gradientele curente ale parametrilor, la care se
+    adaugă cele noi. Constantele sunt scrise direct în cod, între paranteze
+    (altfel o bază negativă ar da `-3.0 ** 2` = −9).
+    """
+    P, I = graf.nr_parametri, graf.nr_intrari
+    const = graf.constante()
+
+    def s(i: int) -> str:
+        return f'({const[i]!r})' if i in const else f's{i}'
+
+    inainte: list[str] = []
+    if P + I:
+        frunze = ', '.join(f's{i}' for i in range(P + I))
+        inainte.append(f'    {frunze}, = v[:{P + I}]')
+    for op, i, a, arg in graf.instructiuni:
+        if op == 'dot_tanh':
+            n = int(arg)
+            _suma(f's{i}', [s(a[0])] + [f'{s(w)} * {s(x)}' for w, x in zip(a[1:n + 1], a[n + 1:])], inainte)
+            inainte.append(f'    s{i} = tanh(s{i})')
+        elif op == 'dot':
+            n = int(arg)
+            _suma(f's{i}', [f'{s(w)} * {s(x)}' for w, x in zip(a[:n], a[n:])], inainte, '0.0 + ')
+        elif op == 'sum':
+            _suma(f's{i}', [s(p) for p in a], inainte, '0.0 + ')
+        elif op == '+':
+            inainte.append(f'    s{i} = {s(a[0])} + {s(a[1])}')
+        elif op == '*':
+            inainte.append(f'    s{i} = {s(a[0])} * {s(a[1])}')
+        elif op == 'sub':
+            inainte.append(f'    s{i} = {s(a[0])} - {s(a[1])}')
+        elif op == 'neg':
+            inainte.append(f'    s{i} = -{s(a[0])}')
+        elif op == 'div':
+            inainte.append(f'    s{i} = {s(a[0])} / {s(a[1])}')
+        elif op == '**':
+            inainte.append(f'    s{i} = {s(a[0])} ** {arg!r}')
+        elif op == 'tanh':
+            inainte.append(f'    s{i} = tanh({s(a[0])})')
+        elif op == 'ReLU':
+            inainte.append(f'    s{i} = {s(a[0])} if {s(a[0])} > 0 else 0.0')
+    L = s(graf.pierdere)
+    inainte.append(f'    if not -inf < {L} < inf:')
+    inainte.append('        raise ValueError("Valoarea nu poate fi NaN sau inf")')
+
+    # gradientele: g_i doar pentru sloturile care duc la un parametru
+    cu_gradient = graf.cu_gradient()
+    initializat = set(range(P))
+
+    def adauga(j: int, expresie: str) -> None:
+        if j in cu_gradient:
+            inapoi.append(f'    g{j} {"+=" if j in initializat else "="} {expresie}')
+            initializat.add(j)
+
+    inapoi: list[str] = []
+    if P:
+        inapoi.append(f'    {", ".join(f"g{j}" for j in range(P))}, = G')
+    adauga(graf.pierdere, '1.0')
+    for op, i, a, arg in reversed(graf.instructiuni):
+        if i not in cu_gradient:
+            continue
+        if op == 'dot_tanh':
+            n = int(arg)
+            inapoi.append(f'    dz = (1.0 - s{i} * s{i}) * g{i}')
+            adauga(a[0], 'dz')
+            for w, x in zip(a[1:n + 1], a[n + 1:]):
+                adauga(w, f'{s(x)} * dz')
+                adauga(x, f'{s(w)} * dz')
+        elif op == 'dot':
+            n = int(arg)
+            for w, x in zip(a[:n], a[n:]):
+                adauga(w, f'{s(x)} * g{i}')
+                adauga(x, f'{s(w)} * g{i}')
+        elif op == 'sum':
+            for p in a:
+                adauga(p, f'g{i}')
+        elif op == '+':
+            adauga(a[0], f'g{i}')
+            adauga(a[1], f'g{i}')
+        elif op == '*':
+            adauga(a[0], f'{s(a[1])} * g{i}')
+            adauga(a[1], f'{s(a[0])} * g{i}')
+        elif op == 'sub':
+            adauga(a[0], f'g{i}')
+            adauga(a[1], f'-g{i}')
+        elif op == 'neg':
+            adauga(a[0], f'-g{i}')
+        elif op == 'div':
+            adauga(a[0], f'g{i} / {s(a[1])}')
+            adauga(a[1], f'-(s{i} / {s(a[1])} * g{i})')
+        elif op == '**':
+            adauga(a[0], f'{arg!r} * ({s(a[0])} ** {arg - 1!r}) * g{i}')
+        elif op == 'tanh':
+            adauga(a[0], f'(1.0 - s{i} * s{i}) * g{i}')
+        elif op == 'ReLU':
+            adauga(a[0], f'(g{i} if {s(a[0])} > 0 else 0.0)')
+
+    iesiri = [f'    v[{y}] = {s(y)}' for y in graf.iesiri]
+    gradienti = ', '.join(f'g{j}' for j in range(P))
+    return '\n'.join([
+        'def inainte(v):',
+        *inainte,
+        *iesiri,
+        f'    return {L}',
+        '',
+        'def inainte_inapoi(v, G):',
+        *inainte,
+        *inapoi,
+        f'    return {L}, ({gradienti}{"," if P else ""})',
+        '',
+    ])
+
+
+def compileaza_graf(graf: Graf) -> tuple[Callable, Callable]:
+    """Funcțiile `(inainte, inainte_inapoi)` ale grafului; o singură compilare pe semnătură (LRU)."""
+    cheie = graf.semnatura()
+    functii = _CACHE.get(cheie)
+    if functii is not None:
+        _CACHE.move_to_end(cheie)
+        return functii
+
+    spatiu = {'tanh': math.tanh, 'inf': math.inf}
+    exec(compile(genereaza_sursa(graf), f'<graf {len(graf)} instrucțiuni>', 'exec'), spatiu)
+    functii = _CACHE[cheie] = (spatiu['inainte'], spatiu['inainte_inapoi'])
+    if len(_CACHE) > _CACHE_MAXIM:
+        _CACHE.popitem(last=False)
+    return functii
+
+
+class FunctieCompilata:
+    """
+    Un graf `Scalar` deja construit (de ex. `(net(x) - tinta) ** 2`), compilat
+    într-o funcție Python fără bucle și fără noduri.
+
+    `intrari` sunt frunzele ale căror valori se dau la fiecare apel,
+    `parametri` frunzele pentru care se calculează gradientul (cumulat în
+    `derivata`, ca la `retroprop`). Celelalte frunze rămân constante. Cu
+    `optimizat=True` graful se simplifică înainte de generare
+    (`optimizare_graf.optimizeaza_graf`).
+
+    `functie(intrari) -> iesire`, dacă e dată, construiește același graf pe
+    alte frunze de intrare; un apel cu alt număr de intrări trece atunci
+    prin graful `Scalar` construit de ea, ca fără compilare. Fără `functie`,
+    un număr diferit de intrări ridică ValueError.
+    """
+
+    def __init__(
+        self,
+        iesire: Scalar,
+        intrari: Sequence[Scalar],
+        parametri: Sequence[Scalar],
+        optimizat: bool = False,
+        functie: Callable[[list[Scalar]], Scalar] | None = None,
+    ) -> None:
+        self.parametri = list(parametri)
+        self.functie = functie
+        self.graf = Graf(iesire, intrari, self.parametri)
+        self.raport: dict[str, int] | None = None
+        if optimizat:
+            from optimizare_graf import optimizeaza_graf
+            self.raport = optimizeaza_graf(self.graf)
+        self._inainte, self._inainte_inapoi = compileaza_graf(self.graf)
+
+    def _compilat(self, intrari: Sequence[float]) -> bool:
+        """True dacă apelul se potrivește grafului compilat, False pentru graful `Scalar`."""
+        if len(intrari) == self.graf.nr_intrari:
+            return True
+        if self.functie is None:
+            raise ValueError(f'Se așteptau {self.graf.nr_intrari} intrări, nu {len(intrari)}')
+        return False
+
+    def _valori(self, intrari: Sequence[float]) -> array:
+        v = array('d', [p.valoare for p in self.parametri])
+        v.extend(intrari)
+        return v
+
+    def __call__(self, intrari: Sequence[float]) -> float:
+        """Doar valoarea ieșirii."""
+        if not self._compilat(intrari):
+            with no_grad():
+                return self.functie([Scalar(x) for x in intrari]).valoare
+        return self._inainte(self._valori(intrari))
+
+    def retroprop(self, intrari: Sequence[float]) -> float:
+        """Valoarea ieșirii; gradientele se adaugă la `derivata` parametrilor."""
+        if not self._compilat(intrari):
+            iesire = self.functie([Scalar(x) for x in intrari])
+            iesire.retroprop()
+            return iesire.valoare
+        pierdere, gradienti = self._inainte_inapoi(
+            self._valori(intrari), [p.derivata for p in self.parametri]
+        )
+        for p, g in zip(self.parametri, gradienti):
+            p.derivata = g
+        return pierdere
+
+
+class PlanCompilat(PlanStatic):
+    """
+    `PlanStatic` executat prin cod Python generat (`genereaza_sursa`) în locul
+    interpretorului de instrucțiuni. Funcțiile se compilează o singură dată
+    pentru fiecare semnătură de graf și se refolosesc între planuri; un batch
+    de altă mărime trece prin graful obișnuit al rețelei (și la `forward`,
+    unde atunci `valori[iesiri]` nu se actualizează).
+    """
+
+    def __init__(self, net: NN, batch: int = 1, optimizat: bool = False) -> None:
+        super().__init__(net, batch, optimizat)
+        self._inainte_compilat, self._inainte_inapoi_compilat = compileaza_graf(self)
+
+    def forward(self, X: List[List[float]], Y: List[float] | List[List[float]]) -> float:
+        if len(X) != self.batch:
+            with no_grad():
+                return self.net.pierdere_batch(X, Y).valoare
+        self._incarca(X, Y)
+        return self._inainte_compilat(self.valori)
+
+    def retroprop_batch(self, X: List[List[float]], Y: List[float] | List[List[float]]) -> float:
+        if len(X) != self.batch:
+            return self.net.retroprop_batch(X, Y)
+        self._incarca(X, Y)
+        pierdere, noi = self._inainte_inapoi_compilat(self.valori, self._gradienti_retea())
+        self._scrie_gradienti(noi)
+        return pierdere
@@ -0,0 +1,109 @@
+from array import array
+from math import tanh
+from operator import mul
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from nn import NN
+
+TIPURI = ('int8', 'float32')
+
+
+class NNCuantizat:
+    """
+    Copie doar pentru inferență a unei rețele `NN`, cu ponderile în tablouri compacte:
+
+        'float32'  ponderi și bias-uri float32 (4 octeți pe parametru);
+        'int8'     ponderi int8 cu câte o scară float32 pe neuron
+                   (w ≈ q · scara, scara = max|w| / 127), bias-uri float32.
+
+    Pentru fiecare strat, `ponderi[k]` e matricea neuroni × intrări pe rânduri,
+    `bias[k]` și (la int8) `scari[k]` au câte o valoare pe neuron. Un neuron
+    calculează tanh(scara · Σ q_i · x_i + b), respectiv tanh(b + Σ w_i · x_i).
+    """
+
+    def __init__(self, net: 'NN', tip: str = 'int8') -> None:
+        if tip not in TIPURI:
+            raise ValueError(f'Tip de cuantizare necunoscut: {tip!r} (disponibile: {", ".join(TIPURI)})')
+        self.tip: str = tip
+        self.dimensiuni: list[int] = list(net.dimensiuni)
+        self.ponderi: list[array] = []
+        self.bias: list[array] = []
+        self.scari: list[array] = []
+
+        parametri = net.citeste_parametri()
+        start = 0
+        for n, m in zip(self.dimensiuni, self.dimensiuni[1:]):
+            randuri = [parametri[start + j * (n + 1):start + (j + 1) * (n + 1)] for j in range(m)]
+            start += (n + 1) * m
+            self.bias.append(array('f', (r[n] for r in randuri)))
+            if tip == 'float32':
+                self.ponderi.append(array('f', (w for r in randuri for w in r[:n])))
+                continue
+
+            ponderi, scari = array('b'), array('f')
+            for r in randuri:
+                maxim = max((abs(w) for w in r[:n]), default=0.0)
+                scara = maxim / 127.0 if maxim > 0.0 else 1.0
+                ponderi.extend(max(-127, min(127, round(w / scara))) for w in r[:n])
+                scari.append(scara)
+            self.ponderi.append(ponderi)
+            self.scari.append(scari)
+
+        # rândurile fiecărui strat, ca vederi: (ponderi, scară, bias) pe neuron
+        self._straturi: list[tuple[tuple[memoryview, float, float], ...]] = []
+        for k, (n, m) in enumerate(zip(self.dimensiuni, self.dimensiuni[1:])):
+            v = memoryview(self.ponderi[k])
+            scari = self.scari[k] if tip == 'int8' else [1.0] * m
+            self._straturi.append(tuple(
+                (v[j * n:(j + 1) * n], scari[j], self.bias[k][j]) for j in range(m)
+            ))
+
+    def predict(self, valori: List[float]) -> float | list[float]:
+        """Ca `NN.predict`, pe ponderile cuantizate."""
+        if len(valori) != self.dimensiuni[0]:
+            raise ValueError(f'Lungime input {len(valori)} diferită de {self.dimensiuni[0]}')
+        x = valori
+        for strat in self._straturi:
+            x = [tanh(sum(map(mul, w, x)) * s + b) for w, s, b in strat]
+        return x[0] if len(x) == 1 else x
+
+    def predict_batch(self, X: List[List[float]]) -> list[float | list[float]]:
+        return [self.predict(x) for x in X]
+
+    def octeti(self) -> int:
+        """Memoria ocupată de tablourile cu parametri."""
+        return sum(len(t) * t.itemsize for t in (*self.ponderi, *self.bias, *self.scari))
+
+    def __repr__(self) -> str:
+        return f'NNCuantizat({self.dimensiuni}, {self.tip}, {self.octeti()} octeți)'
+
+
+def raport_cuantizare(net: 'NN', cuantizat: NNCuantizat, X: List[List[float]]) -> dict[str, float]:
+    """
+    Precizia lui `cuantizat` față de `net` (ieșirile lui `NN.__call__`) pe
+    exemplele din X, plus memoria ocupată de parametri:
+
+        eroare_max, eroare_medie   |y_cuantizat − y| pe toate ieșirile;
+        octeti, octeti_cuantizat   8 octeți pe parametru în tamponul rețelei,
+                                   respectiv `cuantizat.octeti()`;
+        compresie                  octeti / octeti_cuantizat.
+    """
+    if not X:
+        raise ValueError('Raportul necesită cel puțin un exemplu')
+    erori: list[float] = []
+    for x in X:
+        y = net(x)
+        y = [y.valoare] if not isinstance(y, list) else [v.valoare for v in y]
+        q = cuantizat.predict(x)
+        q = q if isinstance(q, list) else [q]
+        erori.extend(abs(a - b) for a, b in zip(q, y))
+
+    octeti = 8 * net.tampon.nr_parametri
+    return {
+        'eroare_max': max(erori),
+        'eroare_medie': sum(erori) / len(erori),
+        'octeti': octeti,
+        'octeti_cuantizat': cuantizat.octeti(),
+        'compresie': octeti / cuantizat.octeti(),
+    }
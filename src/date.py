@@ -0,0 +1,137 @@
+import csv
+import random
+from array import array
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+Exemplu = tuple[list[float], float | list[float]]
+
+
+def _exemplu(rand: Iterable[float], nr_intrari: int) -> Exemplu:
+    valori = [float(v) for v in rand]
+    x, y = valori[:nr_intrari], valori[nr_intrari:]
+    if not y:
+        raise ValueError(f'Rândul are doar {len(valori)} valori, fără țintă după {nr_intrari} intrări')
+    return x, y[0] if len(y) == 1 else y
+
+
+def sursa_csv(
+    cale: str | Path,
+    nr_intrari: int,
+    delimitator: str = ',',
+    antet: bool = False,
+    dimensiune_bucata: int = 1024,
+) -> Callable[[], Iterator[Exemplu]]:
+    """
+    Sursă de exemple dintr-un CSV: primele `nr_intrari` coloane sunt intrarea,
+    restul ținta. Fișierul se citește în bucăți de `dimensiune_bucata` rânduri.
+    """
+
+    def genereaza() -> Iterator[Exemplu]:
+        with open(cale, newline='') as f:
+            cititor = csv.reader(f, delimiter=delimitator)
+            if antet:
+                next(cititor, None)
+            bucata: list[list[str]] = []
+            for rand in cititor:
+                if not rand:
+                    continue
+                bucata.append(rand)
+                if len(bucata) == dimensiune_bucata:
+                    yield from (_exemplu(r, nr_intrari) for r in bucata)
+                    bucata = []
+            yield from (_exemplu(r, nr_intrari) for r in bucata)
+
+    return genereaza
+
+
+def sursa_binara(
+    cale: str | Path,
+    nr_intrari: int,
+    nr_iesiri: int = 1,
+    dimensiune_bucata: int = 1024,
+) -> Callable[[], Iterator[Exemplu]]:
+    """
+    Sursă de exemple dintr-un fișier binar de float64 (ordinea octeților
+    nativă), câte `nr_intrari + nr_iesiri` valori pe exemplu, ca în `scrie_binar`.
+    """
+    latime = nr_intrari + nr_iesiri
+
+    def genereaza() -> Iterator[Exemplu]:
+        with open(cale, 'rb') as f:
+            while True:
+                bucata = array('d')
+                try:
+                    bucata.fromfile(f, latime * dimensiune_bucata)
+                except EOFError:
+                    pass  # ultima bucată e incompletă; `bucata` are ce s-a citit
+                if len(bucata) % latime:
+                    raise ValueError(f'Fișier trunchiat: {len(bucata) % latime} valori în plus')
+                for i in range(0, len(bucata), latime):
+                    yield _exemplu(bucata[i:i + latime], nr_intrari)
+                if len(bucata) < latime * dimensiune_bucata:
+                    return
+
+    return genereaza
+
+
+def scrie_binar(cale: str | Path, exemple: Iterable[Exemplu]) -> int:
+    """Scrie exemple (x, y) în formatul citit de `sursa_binara`; întoarce numărul lor."""
+    n = 0
+    with open(cale, 'wb') as f:
+        for x, y in exemple:
+            array('d', [*x, *(y if isinstance(y, (list, tuple)) else [y])]).tofile(f)
+            n += 1
+    return n
+
+
+class DataLoader:
+    """
+    Mini-batch-uri dintr-o sursă de exemple, fără a încărca setul în memorie.
+
+    Amestecarea se face într-un tampon de cel mult `amestecare` exemple:
+    fiecare exemplu nou ia locul unuia ales aleator, care este emis. Memoria
+    ocupată depinde doar de `amestecare` și `batch`, nu de mărimea fișierului.
+    """
+
+    def __init__(
+        self,
+        sursa: Callable[[], Iterator[Exemplu]],
+        batch: int = 32,
+        amestecare: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        if batch < 1:
+            raise ValueError(f'Dimensiunea batch-ului trebuie să fie ≥ 1, nu {batch}')
+        self.sursa = sursa
+        self.batch: int = batch
+        self.amestecare: int = amestecare
+        self._rng = random.Random(seed)
+
+    def _exemple(self) -> Iterator[Exemplu]:
+        if self.amestecare <= 1:
+            yield from self.sursa()
+            return
+
+        tampon: list[Exemplu] = []
+        for ex in self.sursa():
+            if len(tampon) < self.amestecare:
+                tampon.append(ex)
+                continue
+            i = self._rng.randrange(self.amestecare)
+            yield tampon[i]
+            tampon[i] = ex
+        self._rng.shuffle(tampon)
+        yield from tampon
+
+    def __iter__(self) -> Iterator[tuple[list[list[float]], list[float | list[float]]]]:
+        X: list[list[float]] = []
+        Y: list[float | list[float]] = []
+        for x, y in self._exemple():
+            X.append(x)
+            Y.append(y)
+            if len(X) == self.batch:
+                yield X, Y
+                X, Y = [], []
+        if X:
+            yield X, Y
@@ -0,0 +1,117 @@
+import math
+from typing import Iterable, Self, Sequence
+
+_INF = math.inf
+
+
+class Dual:
+    """
+    Număr dual v + t·ε (ε² = 0) pentru diferențiere în mod înainte.
+
+    `tangenta` este derivata direcțională a valorii: la fiecare operație se
+    propagă odată cu valoarea, deci o singură trecere înainte dă produsul
+    Jacobian–vector (JVP) pe direcția dată de tangentele intrărilor. Nu se
+    reține niciun graf. Oferă aceleași operații ca `Scalar`, așa că o
+    funcție scrisă pentru `Scalar` primește și `Dual`.
+    """
+
+    __slots__ = ('valoare', 'tangenta')
+
+    def __init__(self, valoare: float, tangenta: float = 0.0) -> None:
+        if not -_INF < valoare < _INF:
+            raise ValueError("Valoarea nu poate fi NaN sau inf")
+        self.valoare: float = float(valoare)
+        self.tangenta: float = float(tangenta)
+
+    # Adunare
+    def __add__(self, alt: Self | float) -> Self:
+        if isinstance(alt, Dual):
+            return Dual(self.valoare + alt.valoare, self.tangenta + alt.tangenta)
+        return Dual(self.valoare + alt, self.tangenta)
+
+    # Adunare inversă
+    def __radd__(self, alt: float) -> Self:
+        return self + alt
+
+    # Negativ
+    def __neg__(self) -> Self:
+        return Dual(-self.valoare, -self.tangenta)
+
+    # Scădere
+    def __sub__(self, alt: Self | float) -> Self:
+        return self + (-alt)
+
+    # Scădere inversă
+    def __rsub__(self, alt: float) -> Self:
+        return (-self) + alt
+
+    # Multiplicare: (a·b)' = a'·b + a·b'
+    def __mul__(self, alt: Self | float) -> Self:
+        if isinstance(alt, Dual):
+            return Dual(self.valoare * alt.valoare,
+                        self.tangenta * alt.valoare + self.valoare * alt.tangenta)
+        return Dual(self.valoare * alt, self.tangenta * alt)
+
+    # Multiplicare inversă
+    def __rmul__(self, alt: float) -> Self:
+        return self * alt
+
+    # Împărțire
+    def __truediv__(self, alt: Self | float) -> Self:
+        alt = alt if isinstance(alt, Dual) else Dual(alt)
+        return self * alt ** -1
+
+    # Împărțire inversă
+    def __rtruediv__(self, alt: float) -> Self:
+        return Dual(alt) / self
+
+    # Exponențiere: (a^k)' = k·a^(k−1)·a'
+    def __pow__(self, exp: float) -> Self:
+        if self.valoare < 0 and not float(exp).is_integer():
+            raise ValueError("Negative base with non-integer exponent not supported")
+
+        if self.valoare == 0.0 and exp < 0:
+            raise ZeroDivisionError("0 cannot be raised to a negative power")
+
+        return Dual(self.valoare ** exp, exp * self.valoare ** (exp - 1) * self.tangenta)
+
+    # Activări element-wise
+    def relu(self) -> Self:
+        return self if self.valoare > 0 else Dual(0.0)
+
+    def tanh(self) -> Self:
+        t = math.tanh(self.valoare)
+        return Dual(t, (1.0 - t * t) * self.tangenta)
+
+    # Operații n-are, ca la `Scalar`
+    @staticmethod
+    def sum(termeni: Iterable['Dual | float']) -> 'Dual':
+        v = d = 0.0
+        for t in termeni:
+            if isinstance(t, Dual):
+                v += t.valoare
+                d += t.tangenta
+            else:
+                v += t
+        return Dual(v, d)
+
+    @staticmethod
+    def dot(ponderi: Sequence['Dual | float'], intrari: Sequence['Dual | float']) -> 'Dual':
+        if len(ponderi) != len(intrari):
+            raise ValueError(f"Produs scalar între vectori de lungimi {len(ponderi)} și {len(intrari)}")
+        return Dual.sum(w * x for w, x in zip(ponderi, intrari))
+
+    @staticmethod
+    def dot_tanh(ponderi: Sequence['Dual | float'], intrari: Sequence['Dual | float'], bias: 'Dual | float') -> 'Dual':
+        """tanh(b + Σ w_i · x_i) fără obiecte intermediare; oricare termen poate fi float (tangentă 0)."""
+        v, d = (bias.valoare, bias.tangenta) if isinstance(bias, Dual) else (bias, 0.0)
+        for w, x in zip(ponderi, intrari):
+            wv, wd = (w.valoare, w.tangenta) if isinstance(w, Dual) else (w, 0.0)
+            xv, xd = (x.valoare, x.tangenta) if isinstance(x, Dual) else (x, 0.0)
+            v += wv * xv
+            d += wd * xv + wv * xd
+        t = math.tanh(v)
+        return Dual(t, (1.0 - t * t) * d)
+
+    def __repr__(self) -> str:
+        return f'Dual(valoare={self.valoare:.4f}, tangenta={self.tangenta:.4f})'
@@ -0,0 +1,82 @@
+import base64
+import os
+import sys
+from typing import TYPE_CHECKING
+
+from checkpoint import scrie_atomic
+
+if TYPE_CHECKING:
+    from nn import NN
+
+
+def genereaza_modul(net: 'NN') -> str:
+    """
+    Sursa unui modul Python de inferență pentru `net`, independent de restul
+    proiectului (doar biblioteca standard):
+
+        DIMENSIUNI, ACTIVARE    arhitectura exportată;
+        PONDERI                 toți parametrii, `array('d')` în ordinea lui
+                                `NN.parametri()` (inclus ca base64);
+        predict(x)              ca `NN.predict`: float sau listă de float-uri;
+        predict_batch(X)        `predict` pe fiecare rând din X.
+
+    Fiecare strat e o linie de cod cu dimensiunile scrise direct; un neuron
+    este `tanh(sum(map(mul, w, x), b))`, cu `w` o vedere asupra lui `PONDERI`,
+    deci același calcul (și aceeași ordine a adunărilor) ca `Neuron.predict`.
+    """
+    dimensiuni = net.dimensiuni
+    parametri = net.citeste_parametri()
+    if sys.byteorder != 'little':
+        parametri.byteswap()
+    date = base64.encodebytes(parametri.tobytes()).decode('ascii')
+
+    straturi: list[str] = []
+    start = 0
+    for k, (n, m) in enumerate(zip(dimensiuni, dimensiuni[1:])):
+        straturi.append(f'_S{k} = _neuroni({start}, {n}, {m})')
+        start += (n + 1) * m
+    pasi = [f'    x = [tanh(sum(map(mul, w, x), b)) for w, b in _S{k}]' for k in range(len(dimensiuni) - 1)]
+    iesire = 'x[0]' if dimensiuni[-1] == 1 else 'x'
+
+    return '\n'.join([
+        f'"""Inferență pentru NN({dimensiuni}), exportată de `export.genereaza_modul`."""',
+        'import sys',
+        'from array import array',
+        'from base64 import decodebytes',
+        'from math import tanh',
+        'from operator import mul',
+        '',
+        f'DIMENSIUNI = {tuple(dimensiuni)!r}',
+        "ACTIVARE = 'tanh'",
+        '',
+        "PONDERI = array('d')",
+        f'PONDERI.frombytes(decodebytes(b"""\n{date}"""))',
+        "if sys.byteorder != 'little':",
+        '    PONDERI.byteswap()',
+        '',
+        '',
+        'def _neuroni(start, n, m):',
+        '    """Câte (ponderi, bias) pentru fiecare neuron al unui strat n -> m."""',
+        '    v = memoryview(PONDERI)',
+        '    return tuple((v[k:k + n], PONDERI[k + n]) for k in range(start, start + (n + 1) * m, n + 1))',
+        '',
+        '',
+        *straturi,
+        '',
+        '',
+        'def predict(x):',
+        f'    if len(x) != {dimensiuni[0]}:',
+        f"        raise ValueError(f'Lungime input {{len(x)}} diferită de {dimensiuni[0]}')",
+        *pasi,
+        f'    return {iesire}',
+        '',
+        '',
+        'def predict_batch(X):',
+        '    return [predict(x) for x in X]',
+        '',
+    ])
+
+
+def exporta(net: 'NN', cale: str | os.PathLike) -> None:
+    """Scrie (atomic) modulul generat de `genereaza_modul` în fișierul `cale`."""
+    scrie_atomic(cale, genereaza_modul(net).encode('utf-8'))
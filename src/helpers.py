@@ -1,5 +1,17 @@
+import math
+import multiprocessing
+import random
+from array import array
+from typing import TYPE_CHECKING, Sequence
+
 from scalar import Scalar
 
+if TYPE_CHECKING:
+    from nn import NN
+
+# Direcție rară: perechi (indice în `parametri()`, componentă)
+Directie = list[tuple[int, float]]
+
 constants = dict(
     TOL=1e-6,  # toleranța în comparații
 )
@@ -30,3 +42,114 @@ def numeric_grad(expr_fn, param: Scalar, eps: float = 1e-4) -> float:
     param.valoare = original
 
     return (plus - minus) / (2 * eps)
+
+
+def _pierdere_fara_graf(net: 'NN', X: Sequence[Sequence[float]], Y: Sequence) -> float:
+    """MSE pe batch ca în `NN.pierdere_batch`, dar prin `predict` (fără graf)."""
+    total = 0.0
+    for x, t in zip(X, Y):
+        y = net.predict(x)
+        y = y if isinstance(y, list) else [y]
+        t = t if isinstance(t, (list, tuple)) else [t]
+        total += sum((yj - tj) ** 2 for yj, tj in zip(y, t))
+    return total / len(X)
+
+
+class _ValoriObiecte:
+    """`valori[i] = x` pe obiectele din `parametri()`, când tamponul rețelei nu e intact."""
+
+    def __init__(self, parametri: Sequence[Scalar]) -> None:
+        self.parametri = parametri
+
+    def __setitem__(self, i: int, x: float) -> None:
+        self.parametri[i].valoare = x
+
+
+def _derivata_numerica(net: 'NN', theta: array, X, Y, eps: float, directie: Directie) -> float:
+    """(L(θ + ε·v) − L(θ − ε·v)) / 2ε; doar componentele din `directie` se modifică."""
+    valori = net.tampon.valori if net.tampon.intact else _ValoriObiecte(net.parametri())
+    rezultate = []
+    for semn in (1.0, -1.0):
+        for i, v in directie:
+            valori[i] = theta[i] + semn * eps * v
+        rezultate.append(_pierdere_fara_graf(net, X, Y))
+    for i, _ in directie:
+        valori[i] = theta[i]
+    return (rezultate[0] - rezultate[1]) / (2 * eps)
+
+
+# Starea proceselor lucrătoare din `verifica_gradient(procese=...)`
+_verificare: tuple | None = None
+
+
+def _initializeaza_verificare(dimensiuni, backend, theta, X, Y, eps) -> None:
+    global _verificare
+    from nn import NN
+
+    net = NN(dimensiuni, backend=backend)
+    net.scrie_parametri(theta)
+    _verificare = (net, net.citeste_parametri(), X, Y, eps)
+
+
+def _derivata_in_proces(directie: Directie) -> float:
+    net, theta, X, Y, eps = _verificare
+    return _derivata_numerica(net, theta, X, Y, eps, directie)
+
+
+def verifica_gradient(
+    net: 'NN',
+    X: Sequence[Sequence[float]],
+    Y: Sequence,
+    directii: int = 3,
+    eps: float = 1e-5,
+    complet: bool = False,
+    procese: int | None = None,
+    seed: int | None = 0,
+) -> dict[str, float]:
+    """
+    Compară gradientul pierderii MSE pe batch (`NN.retroprop_batch`) cu
+    diferențe finite centrate, pentru toți parametrii rețelei.
+
+    Implicit, pentru fiecare strat se aleg `directii` direcții aleatoare v
+    (gaussiene, doar pe parametrii stratului) și se compară g·v cu derivata
+    direcțională numerică: 2·directii evaluări ale pierderii pe strat, indiferent
+    de numărul de parametri. Cu `complet=True` fiecare parametru este o
+    direcție separată (ca `numeric_grad`). Evaluările numerice folosesc
+    `predict` (fără graf); cu `procese` se împart între procese.
+
+    Întoarce eroarea relativă maximă pe strat, |a − n| / max(|a| + |n|, 1e-8),
+    cu cheile 'strat 0', 'strat 1', ... Parametrii și gradientele rețelei
+    rămân neschimbate.
+    """
+    theta = net.citeste_parametri()
+    anterior = net.citeste_gradienti()
+    net.reset_deriv()
+    net.retroprop_batch(X, Y)
+    g = net.citeste_gradienti()
+    net.scrie_gradienti(anterior)
+
+    rng = random.Random(seed)
+    sarcini: list[tuple[int, Directie]] = []
+    start = 0
+    for k, (a, b) in enumerate(zip(net.dimensiuni, net.dimensiuni[1:])):
+        indici = range(start, start + (a + 1) * b)
+        if complet:
+            sarcini.extend((k, [(i, 1.0)]) for i in indici)
+        else:
+            sarcini.extend((k, [(i, rng.gauss(0.0, 1.0)) for i in indici]) for _ in range(directii))
+        start = indici.stop
+
+    if procese:
+        initargs = (net.dimensiuni, net.backend, theta, X, Y, eps)
+        with multiprocessing.Pool(procese, _initializeaza_verificare, initargs) as pool:
+            numerice = pool.map(_derivata_in_proces, [d for _, d in sarcini],
+                                chunksize=max(1, len(sarcini) // (4 * procese)))
+    else:
+        numerice = [_derivata_numerica(net, theta, X, Y, eps, d) for _, d in sarcini]
+
+    raport: dict[str, float] = {}
+    for (k, directie), numeric in zip(sarcini, numerice):
+        analitic = math.fsum(g[i] * v for i, v in directie)
+        eroare = abs(analitic - numeric) / max(abs(analitic) + abs(numeric), 1e-8)
+        raport[f'strat {k}'] = max(raport.get(f'strat {k}', 0.0), eroare)
+    return raport
@@ -1,20 +1,40 @@
 from typing import Sequence
 
+from banda import Banda
+from dual import Dual
 from neuron import Neuron
 from scalar import Scalar
+from tampon import TamponParametri
 
 
 class Layer:
     """Colecție de neuroni care împart aceeași intrare."""
 
-    def __init__(self, intrari: int, neuroni: int) -> None:
+    def __init__(
+        self,
+        intrari: int,
+        neuroni: int,
+        alocator: Banda | TamponParametri | None = None,
+    ) -> None:
         self.neuroni: list[Neuron] = [
-            Neuron(intrari) for _ in range(neuroni)
+            Neuron(intrari, alocator) for _ in range(neuroni)
         ]
 
     def __call__(self, x: Sequence[Scalar]) -> list[Scalar]:
         return [n(x) for n in self.neuroni]
 
+    def predict(self, x: Sequence[float]) -> list[float]:
+        return [n.predict(x) for n in self.neuroni]
+
+    def jvp(self, x: Sequence[Dual | float], tangente: Sequence[float] | None = None) -> list[Dual]:
+        """`Neuron.jvp` pentru fiecare neuron; `tangente` urmează ordinea lui `parametri()`."""
+        if tangente is None:
+            return [n.jvp(x) for n in self.neuroni]
+        k = len(x) + 1
+        if len(tangente) != k * len(self.neuroni):
+            raise ValueError(f"Se așteptau {k * len(self.neuroni)} tangente, nu {len(tangente)}")
+        return [n.jvp(x, tangente[i * k:(i + 1) * k]) for i, n in enumerate(self.neuroni)]
+
     def parametri(self) -> list[Scalar]:
         res: list[Scalar] = []
         for n in self.neuroni:
@@ -0,0 +1,155 @@
+import random
+from typing import Self, Sequence
+
+import numpy as np
+
+from scalar import Scalar, inregistreaza_retro
+from tampon import Parametru, TamponParametri
+
+
+class NodVector(Scalar):
+    """
+    Nod vectorial în graful `Scalar`: ieșirea unui strat întreg.
+
+    `vector` ține activările, `grad_vector` acumulează dL/dvector. Nodul
+    se leagă de restul grafului prin nodurile scalare create de `scalari()`.
+    """
+
+    __slots__ = ('vector', 'grad_vector', 'strat')
+
+    def __init__(
+        self,
+        vector: np.ndarray,
+        parinti: Sequence[Self] = (),
+        strat: 'LayerNumpy | None' = None,
+    ) -> None:
+        if not np.isfinite(vector).all():
+            raise ValueError("Valoarea nu poate fi NaN sau inf")
+        super().__init__(0.0, parinti, 'strat' if strat is not None else '')
+        self.vector: np.ndarray = vector
+        self.grad_vector: np.ndarray = np.zeros_like(vector)
+        self.strat = strat
+
+    def scalari(self) -> Scalar | list[Scalar] | list[Scalar | list[Scalar]]:
+        """
+        Câte un `Scalar` pentru fiecare componentă, derivabil înapoi în vector.
+        Pentru un batch (matrice) întoarce câte o ieșire pe rând; o ieșire
+        cu o singură componentă devine `Scalar`, ca în `NN.__call__`.
+        """
+        randuri = np.atleast_2d(self.vector)
+        m = randuri.shape[1]
+        iesiri = []
+        for r, rand in enumerate(randuri.tolist()):
+            s = [Scalar(v, (self,), 'index', r * m + j) for j, v in enumerate(rand)]
+            iesiri.append(s[0] if m == 1 else s)
+        return iesiri if self.vector.ndim == 2 else iesiri[0]
+
+    def __repr__(self) -> str:
+        return f'NodVector(dim={self.vector.shape[-1]})'
+
+
+class NodPierdere(Scalar):
+    """MSE pe batch calculat vectorial: media pe rânduri a sumei (y − t)²."""
+
+    __slots__ = ('tinta',)
+
+    def __init__(self, iesire: NodVector, tinta: Sequence[float] | Sequence[Sequence[float]]) -> None:
+        y = np.atleast_2d(iesire.vector)
+        self.tinta: np.ndarray = np.asarray(tinta, dtype=np.float64).reshape(y.shape)
+        super().__init__(float(((y - self.tinta) ** 2).sum() / y.shape[0]), (iesire,), 'mse')
+
+
+class LayerNumpy:
+    """
+    Strat dens cu matrice de ponderi și vector de bias; forward = tanh(W·x + b).
+    Acceptă un singur exemplu (vector) sau un batch (matrice, câte un exemplu pe rând).
+    """
+
+    def __init__(self, intrari: int, neuroni: int, tampon: TamponParametri | None = None) -> None:
+        # blocul stratului: câte un rând [w_1..w_n, b] pe neuron, ca în Layer.parametri()
+        if tampon is None:
+            tampon = TamponParametri((intrari + 1) * neuroni)
+        self.tampon: TamponParametri = tampon
+        self.start: int = self.tampon.bloc((intrari + 1) * neuroni)
+        M = self._vedere(self.tampon.valori, intrari, neuroni)
+        dM = self._vedere(self.tampon.gradienti, intrari, neuroni)
+
+        # aceeași inițializare ca Neuron
+        M[:, :intrari] = [[random.randint(-1, 1) for _ in range(intrari)] for _ in range(neuroni)]
+        M[:, intrari] = 0.0
+        self.W: np.ndarray = M[:, :intrari]
+        self.b: np.ndarray = M[:, intrari]
+        self.dW: np.ndarray = dM[:, :intrari]
+        self.db: np.ndarray = dM[:, intrari]
+
+    def _vedere(self, tablou, intrari: int, neuroni: int) -> np.ndarray:
+        return np.frombuffer(
+            tablou, dtype=np.float64, count=(intrari + 1) * neuroni, offset=8 * self.start,
+        ).reshape(neuroni, intrari + 1)
+
+    def __call__(self, x: NodVector) -> NodVector:
+        if x.vector.shape[-1] != self.W.shape[1]:
+            raise ValueError(
+                f"Lungime input {x.vector.shape[-1]} diferită de numărul de ponderi {self.W.shape[1]}"
+            )
+        return NodVector(np.tanh(x.vector @ self.W.T + self.b), (x,), self)
+
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        if x.shape[-1] != self.W.shape[1]:
+            raise ValueError(
+                f"Lungime input {x.shape[-1]} diferită de numărul de ponderi {self.W.shape[1]}"
+            )
+        return np.tanh(x @ self.W.T + self.b)
+
+    def jvp(
+        self, x: np.ndarray, dx: np.ndarray, tangente: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (y, dy) pentru y = tanh(W·x + b): dy = (1 − y²) ⊙ (W·dx + dW·x + db),
+        unde [dW | db] sunt `tangente` (ca blocul stratului) sau zero.
+        """
+        y = self.predict(x)
+        dz = dx @ self.W.T
+        if tangente is not None:
+            dM = np.asarray(tangente, dtype=np.float64).reshape(self.W.shape[0], self.W.shape[1] + 1)
+            dz = dz + x @ dM[:, :-1].T + dM[:, -1]
+        return y, (1.0 - y * y) * dz
+
+    def parametri(self) -> list[Parametru]:
+        n = self.W.size + self.b.size
+        return [Parametru(self.tampon, i) for i in range(self.start, self.start + n)]
+
+    def reset_deriv(self) -> None:
+        self.dW.fill(0.0)
+        self.db.fill(0.0)
+
+    def __repr__(self) -> str:
+        return f'LayerNumpy({self.W.shape[0]}×{self.W.shape[1]})'
+
+
+# Gradient analitic pe matrice: dz = g ⊙ (1 − y²), dW += dzᵀ·x, db += Σ dz, dx += dz·W
+def _retro_strat(nod: NodVector, g: float) -> None:
+    x, = nod._parinti
+    strat = nod.strat
+    dz = nod.grad_vector * (1.0 - nod.vector * nod.vector)
+    # consumat: o nouă retropropagare a aceluiași graf pornește de la zero, ca `derivata`
+    nod.grad_vector.fill(0.0)
+    strat.dW += np.atleast_2d(dz).T @ np.atleast_2d(x.vector)
+    strat.db += dz if dz.ndim == 1 else dz.sum(axis=0)
+    x.grad_vector += dz @ strat.W
+
+
+def _retro_index(nod: Scalar, g: float) -> None:
+    v, = nod._parinti
+    v.grad_vector.flat[int(nod._arg)] += g
+
+
+def _retro_mse(nod: NodPierdere, g: float) -> None:
+    y, = nod._parinti
+    rand = np.atleast_2d(y.vector)
+    y.grad_vector += (2.0 * g / rand.shape[0]) * (rand - nod.tinta).reshape(y.vector.shape)
+
+
+inregistreaza_retro('strat', _retro_strat)
+inregistreaza_retro('index', _retro_index)
+inregistreaza_retro('mse', _retro_mse)
@@ -2,19 +2,59 @@ import math
 import random
 from typing import Sequence
 
+from banda import Banda
+from dual import Dual
 from scalar import Scalar
+from tampon import ListaParametri, TamponParametri, dot_tanh_bloc
 
 
 class Neuron:
-    """Perceptron cu activare ReLU/tanh și inițializare He."""
+    """
+    Perceptron cu activare ReLU/tanh și inițializare He.
 
-    def __init__(self, intrari: int) -> None:
+    Cu un alocator (`TamponParametri`, `Banda`), parametrii sunt alocați în
+    tampon; înlocuirea lor (`ponderi = [...]`, `ponderi[i] = ...`,
+    `bias = ...`) marchează tamponul ca neintact (`tampon.intact`), iar
+    neuronul nu mai folosește calea în bloc (`dot_tanh_bloc`, respectiv
+    `Banda.dot_tanh`).
+    """
+
+    def __init__(self, intrari: int, alocator: Banda | TamponParametri | None = None) -> None:
         sigma = math.sqrt(2.0 / intrari)
-        self.ponderi: list[Scalar] = [
-            Scalar(random.randint(-1, 1)) for _ in range(intrari)
-            # Scalar(random.gauss(0.0, sigma)) for _ in range(intrari)
+        self.banda: Banda | None = alocator if isinstance(alocator, Banda) else None
+        self._alocator = alocator
+        parametru = Scalar if alocator is None else alocator.parametru
+        ponderi = [
+            parametru(random.randint(-1, 1)) for _ in range(intrari)
+            # parametru(random.gauss(0.0, sigma)) for _ in range(intrari)
         ]
-        self.bias: Scalar = Scalar(0.0)
+        self._ponderi: list[Scalar] = ponderi if alocator is None else ListaParametri(ponderi, alocator)
+        self._bias: Scalar = parametru(0.0)
+        # ponderile și bias-ul sunt consecutive în tampon cât timp nu sunt înlocuite
+        self._bloc: bool = alocator is not None
+
+    @property
+    def ponderi(self) -> list[Scalar]:
+        return self._ponderi
+
+    @ponderi.setter
+    def ponderi(self, ponderi: list[Scalar]) -> None:
+        self._ponderi = ponderi
+        self._inlocuit()
+
+    @property
+    def bias(self) -> Scalar:
+        return self._bias
+
+    @bias.setter
+    def bias(self, bias: Scalar) -> None:
+        self._bias = bias
+        self._inlocuit()
+
+    def _inlocuit(self) -> None:
+        self._bloc = False
+        if self._alocator is not None:
+            self._alocator.intact = False
 
     def __call__(self, x: Sequence[Scalar]) -> Scalar:
         if len(x) != len(self.ponderi):
@@ -22,6 +62,13 @@ class Neuron:
                 f"Lungime input {len(x)} diferită de numărul de ponderi {len(self.ponderi)}"
             )
 
+        if self._bloc and not self._ponderi.modificata:
+            if self.banda is not None:
+                return self.banda.dot_tanh(self._ponderi[0].index, len(self._ponderi), x)
+            return dot_tanh_bloc(self._ponderi, x, self._bias)
+        if self.banda is None:
+            return Scalar.dot_tanh(self.ponderi, x, self.bias)
+
         s: Scalar = self.bias
         for w, xi in zip(self.ponderi, x):
             s += w * xi
@@ -29,6 +76,34 @@ class Neuron:
         # return s.relu()
         return s.tanh()
 
+    def predict(self, x: Sequence[float]) -> float:
+        """Ieșirea neuronului pe valori float, fără graf de calcul."""
+        if len(x) != len(self.ponderi):
+            raise ValueError(
+                f"Lungime input {len(x)} diferită de numărul de ponderi {len(self.ponderi)}"
+            )
+        s = self.bias.valoare
+        for w, xi in zip(self.ponderi, x):
+            s += w.valoare * xi
+        return math.tanh(s)
+
+    def jvp(self, x: Sequence[Dual | float], tangente: Sequence[float] | None = None) -> Dual:
+        """
+        Ieșirea neuronului ca `Dual`: tangenta este derivata pe direcția dată
+        de tangentele intrărilor și, opțional, de `tangente` pentru parametri
+        (în ordinea lui `parametri()`). Fără graf de calcul.
+        """
+        if len(x) != len(self.ponderi):
+            raise ValueError(
+                f"Lungime input {len(x)} diferită de numărul de ponderi {len(self.ponderi)}"
+            )
+        if tangente is None:
+            return Dual.dot_tanh([w.valoare for w in self.ponderi], x, self.bias.valoare)
+        if len(tangente) != len(self.ponderi) + 1:
+            raise ValueError(f"Se așteptau {len(self.ponderi) + 1} tangente, nu {len(tangente)}")
+        ponderi = [Dual(w.valoare, d) for w, d in zip(self.ponderi, tangente)]
+        return Dual.dot_tanh(ponderi, x, Dual(self.bias.valoare, tangente[-1]))
+
     def parametri(self) -> list[Scalar]:
         return [*self.ponderi, self.bias]
 
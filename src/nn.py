@@ -1,25 +1,85 @@
-from typing import List
+import math
+from array import array
+from typing import List, Sequence
 
+from banda import Banda
+from dual import Dual
 from layer import Layer
 from scalar import Scalar
+from tampon import TamponParametri
 
 
 class NN:
     """
     Rețea perceptron cu mai multe straturi dense și activare ReLU/tanh.
     Ultimul strat nu are softmax; se poate aplica extern.
+
+    Backend-uri:
+        'scalar' – graf de obiecte `Scalar` (implicit);
+        'banda'  – bandă de calcul (`Banda`); apelurile forward adaugă pe
+                   aceeași bandă, care se golește la primul forward de după
+                   o retropropagare (începutul pasului următor), după
+                   `retroprop_batch` și explicit (`goleste_banda()`);
+                   nodurile create înainte de golire devin invalide
+                   (RuntimeError);
+        'numpy'  – straturi `LayerNumpy` (matrice de ponderi, gradient
+                   analitic); necesită NumPy.
+
+    Toți parametrii stau într-un singur tampon contiguu (`tampon.valori`,
+    `tampon.gradienti`, în ordinea lui `parametri()`); pe backend-ul 'banda'
+    tamponul este prefixul benzii. Parametrii se modifică de preferință prin
+    `valoare`; dacă obiectele din neuroni sunt înlocuite (`neuron.ponderi =
+    [...]`, vezi `Neuron`), `tampon.intact` devine False și operațiile în
+    bloc de mai jos trec pe o buclă peste `parametri()`.
     """
 
-    def __init__(self, dimensiuni: List[int]) -> None:
+    BACKENDS = ('scalar', 'banda', 'numpy')
+
+    def __init__(self, dimensiuni: List[int], backend: str = 'scalar') -> None:
         if len(dimensiuni) < 2:
             raise ValueError('Vectorul dimensiuni trebuie să conțină cel puțin două valori.')
-        self.layers: list[Layer] = [
-            Layer(dimensiuni[i], dimensiuni[i + 1])
-            for i in range(len(dimensiuni) - 1)
-        ]
+        if backend not in self.BACKENDS:
+            raise ValueError(f'Backend necunoscut: {backend!r} (disponibile: {", ".join(self.BACKENDS)})')
+        self.backend: str = backend
+        self.dimensiuni: list[int] = list(dimensiuni)
+        self.banda: Banda | None = Banda() if backend == 'banda' else None
+        self.tampon: TamponParametri | Banda = self.banda if self.banda is not None else TamponParametri(
+            sum((dimensiuni[i] + 1) * dimensiuni[i + 1] for i in range(len(dimensiuni) - 1))
+        )
+        if backend == 'numpy':
+            from layer_numpy import LayerNumpy
+            self.layers: list[Layer] = [
+                LayerNumpy(dimensiuni[i], dimensiuni[i + 1], self.tampon)
+                for i in range(len(dimensiuni) - 1)
+            ]
+        else:
+            self.layers = [
+                Layer(dimensiuni[i], dimensiuni[i + 1], self.tampon)
+                for i in range(len(dimensiuni) - 1)
+            ]
 
     def __call__(self, valori: List[float]) -> Scalar | list[Scalar]:
-        activari: list[Scalar] = [Scalar(v) for v in valori]
+        if self.backend == 'numpy':
+            return self._forward_numpy(valori).scalari()
+        return self._forward(valori)
+
+    def goleste_banda(self) -> None:
+        """
+        Pe backend-ul 'banda' elimină nodurile temporare (păstrează parametrii).
+        Forward-ul o face singur după o retropropagare; apelul explicit e util
+        doar pentru forward-uri repetate fără retropropagare (evaluare; de
+        preferat `predict`). Pe celelalte backend-uri nu face nimic.
+        """
+        if self.banda is not None:
+            self.banda.goleste()
+
+    def _forward(self, valori: List[float]) -> Scalar | list[Scalar]:
+        if self.banda is None:
+            activari: list[Scalar] = [Scalar(v) for v in valori]
+        else:
+            if self.banda.retropropagata:
+                self.banda.goleste()  # pas nou: nodurile pasului anterior nu mai sunt necesare
+            activari = [self.banda.constanta(v) for v in valori]
         for layer in self.layers:
             activari = layer(activari)
 
@@ -28,15 +88,217 @@ class NN:
 
         return activari
 
+    def _forward_numpy(self, valori: List[float] | List[List[float]]):
+        import numpy as np
+        from layer_numpy import NodVector
+
+        nod = NodVector(np.asarray(valori, dtype=np.float64))
+        for layer in self.layers:
+            nod = layer(nod)
+        return nod
+
+    # Inferență: doar valori float, niciun nod de graf
+    def predict(self, valori: List[float]) -> float | list[float]:
+        """Aceeași ieșire ca `__call__`, dar ca float-uri și fără a construi graful."""
+        if self.backend == 'numpy':
+            import numpy as np
+
+            activari = np.asarray(valori, dtype=np.float64)
+            for layer in self.layers:
+                activari = layer.predict(activari)
+            activari = activari.tolist()
+        else:
+            activari = list(valori)
+            for layer in self.layers:
+                activari = layer.predict(activari)
+
+        return activari[0] if len(activari) == 1 else activari
+
+    # Mod înainte: produs Jacobian–vector într-o singură trecere
+    def jvp(
+        self,
+        valori: List[float],
+        directie: Sequence[float],
+        directie_parametri: Sequence[float] | None = None,
+    ) -> tuple[float | list[float], float | list[float]]:
+        """
+        Ieșirea rețelei și derivata ei pe direcția `directie` a intrărilor
+        (J·v), plus, opțional, pe `directie_parametri` (în ordinea lui
+        `parametri()`). Folosește numere duale (`Dual`); nu construiește graf.
+        """
+        if len(directie) != len(valori):
+            raise ValueError(f'Direcție de lungime {len(directie)} pentru {len(valori)} intrări')
+        n = self.tampon.nr_parametri
+        if directie_parametri is not None and len(directie_parametri) != n:
+            raise ValueError(f'Se așteptau {n} tangente de parametri, nu {len(directie_parametri)}')
+
+        start = 0
+        if self.backend == 'numpy':
+            import numpy as np
+
+            y = np.asarray(valori, dtype=np.float64)
+            dy = np.asarray(directie, dtype=np.float64)
+            for layer in self.layers:
+                k = layer.W.size + layer.b.size
+                tangente = None if directie_parametri is None else directie_parametri[start:start + k]
+                y, dy = layer.jvp(y, dy, tangente)
+                start += k
+            iesiri, tangente = y.tolist(), dy.tolist()
+        else:
+            activari: list[Dual] = [Dual(v, d) for v, d in zip(valori, directie)]
+            for layer in self.layers:
+                k = (len(activari) + 1) * len(layer.neuroni)
+                tangente = None if directie_parametri is None else directie_parametri[start:start + k]
+                activari = layer.jvp(activari, tangente)
+                start += k
+            iesiri = [a.valoare for a in activari]
+            tangente = [a.tangenta for a in activari]
+
+        if len(iesiri) == 1:
+            return iesiri[0], tangente[0]
+        return iesiri, tangente
+
+    # Mini-batch: un singur graf (o singură bandă) pentru toate exemplele
+    def forward_batch(self, X: List[List[float]]) -> list[Scalar | list[Scalar]]:
+        """Ieșirile rețelei pentru fiecare rând din X, construite într-o singură trecere."""
+        if self.backend == 'numpy':
+            return self._forward_numpy(X).scalari()
+        return [self._forward(x) for x in X]
+
+    def pierdere_batch(self, X: List[List[float]], Y: List[float] | List[List[float]]) -> Scalar:
+        """MSE pe mini-batch: media pe exemple a sumei (y − t)² pe ieșiri."""
+        if len(X) != len(Y):
+            raise ValueError(f'Batch cu {len(X)} intrări și {len(Y)} ținte')
+
+        if self.backend == 'numpy':
+            from layer_numpy import NodPierdere
+            return NodPierdere(self._forward_numpy(X), Y)
+
+        termeni = []
+        for y, t in zip(self.forward_batch(X), Y):
+            y = y if isinstance(y, list) else [y]
+            t = t if isinstance(t, (list, tuple)) else [t]
+            termeni.extend((yj - tj) ** 2 for yj, tj in zip(y, t))
+
+        if self.banda is None:
+            return Scalar.sum(termeni) * (1.0 / len(X))
+
+        suma = termeni[0]
+        for termen in termeni[1:]:
+            suma = suma + termen
+        return suma * (1.0 / len(X))
+
+    def retroprop_batch(self, X: List[List[float]], Y: List[float] | List[List[float]]) -> float:
+        """
+        Forward + retropropagare pe tot batch-ul; gradientele se cumulează în
+        parametri. Pe backend-ul 'banda' golește apoi banda.
+        """
+        pierdere = self.pierdere_batch(X, Y)
+        pierdere.retroprop()
+        valoare = pierdere.valoare
+        self.goleste_banda()
+        return valoare
+
+    def hvp(self, X: List[List[float]], Y: List[float] | List[List[float]], v: Sequence[float]) -> list[float]:
+        """
+        Hessiana pierderii MSE pe batch, înmulțită cu `v` (în ordinea lui
+        `parametri()`), prin dublă retropropagare (`scalar.hvp`). Doar pe
+        backend-ul 'scalar'.
+        """
+        if self.backend != 'scalar':
+            raise ValueError(f"Produsul Hessiană–vector necesită backend-ul 'scalar', nu {self.backend!r}")
+        from scalar import hvp
+        return hvp(self.pierdere_batch(X, Y), self.parametri(), v)
+
+    def captureaza(self, batch: int = 1, optimizat: bool = False):
+        """Plan static (`captura.PlanStatic`) pentru forward + retroprop pe batch-uri de mărime `batch`."""
+        from captura import PlanStatic
+        return PlanStatic(self, batch, optimizat)
+
+    def compileaza(self, batch: int = 1, optimizat: bool = False):
+        """Ca `captureaza`, dar executat prin cod Python generat (`compilator.PlanCompilat`)."""
+        from compilator import PlanCompilat
+        return PlanCompilat(self, batch, optimizat)
+
+    # Checkpoint binar (`checkpoint`)
+    def save(self, cale: str, tip: str = 'd') -> None:
+        """
+        Salvează arhitectura și parametrii (float64 sau, cu `tip='f'`, float32);
+        scrierea e atomică: un checkpoint existent nu se corupe la o întrerupere.
+        """
+        from checkpoint import salveaza
+        salveaza(self, cale, tip)
+
+    @classmethod
+    def load(cls, cale: str, backend: str = 'scalar') -> 'NN':
+        """Rețea nouă din checkpoint-ul scris de `save`, pe backend-ul dat."""
+        from checkpoint import incarca
+        return incarca(cale, backend)
+
+    def exporta(self, cale: str) -> None:
+        """Modul Python de inferență, fără dependențe de proiect (`export.genereaza_modul`)."""
+        from export import exporta
+        exporta(self, cale)
+
+    def cuantizeaza(self, tip: str = 'int8'):
+        """Copie de inferență cu ponderi int8 sau float32 (`cuantizare.NNCuantizat`)."""
+        from cuantizare import NNCuantizat
+        return NNCuantizat(self, tip)
+
     def parametri(self) -> list[Scalar]:
         p: list[Scalar] = []
         for strat in self.layers:
             p.extend(strat.parametri())
         return p
 
+    # Operații în bloc pe tamponul de parametri (pe obiecte dacă tamponul nu e intact)
     def reset_deriv(self) -> None:
-        for p in self.parametri():
-            p.derivata = 0.0
+        if not self.tampon.intact:
+            for p in self.parametri():
+                p.derivata = 0.0
+            return
+        n = self.tampon.nr_parametri
+        self.tampon.gradienti[:n] = array('d', bytes(8 * n))
+
+    def norma_gradient(self) -> float:
+        """Norma euclidiană a gradientului tuturor parametrilor."""
+        if not self.tampon.intact:
+            return math.sqrt(math.fsum(p.derivata * p.derivata for p in self.parametri()))
+        return math.sqrt(math.fsum(g * g for g in self.tampon.gradienti[:self.tampon.nr_parametri]))
+
+    def citeste_parametri(self) -> array:
+        """Copie a valorilor tuturor parametrilor, în ordinea lui `parametri()`."""
+        if not self.tampon.intact:
+            return array('d', (p.valoare for p in self.parametri()))
+        return self.tampon.valori[:self.tampon.nr_parametri]
+
+    def scrie_parametri(self, valori: Sequence[float]) -> None:
+        parametri = None if self.tampon.intact else self.parametri()
+        n = self.tampon.nr_parametri if parametri is None else len(parametri)
+        if len(valori) != n:
+            raise ValueError(f'Se așteptau {n} valori, nu {len(valori)}')
+        if parametri is not None:
+            for p, v in zip(parametri, valori):
+                p.valoare = v
+            return
+        self.tampon.valori[:n] = array('d', valori)
+
+    def citeste_gradienti(self) -> array:
+        """Copie a gradientelor tuturor parametrilor, în ordinea lui `parametri()`."""
+        if not self.tampon.intact:
+            return array('d', (p.derivata for p in self.parametri()))
+        return self.tampon.gradienti[:self.tampon.nr_parametri]
+
+    def scrie_gradienti(self, gradienti: Sequence[float]) -> None:
+        parametri = None if self.tampon.intact else self.parametri()
+        n = self.tampon.nr_parametri if parametri is None else len(parametri)
+        if len(gradienti) != n:
+            raise ValueError(f'Se așteptau {n} gradiente, nu {len(gradienti)}')
+        if parametri is not None:
+            for p, g in zip(parametri, gradienti):
+                p.derivata = g
+            return
+        self.tampon.gradienti[:n] = array('d', gradienti)
 
     def __repr__(self) -> str:
         info = ' -> '.join(str(s) for s in self.layers)
@@ -0,0 +1,248 @@
+import abc
+import math
+from array import array
+from typing import Callable, Sequence
+
+import numpy as np
+
+from scalar import Scalar, gradient, no_grad
+from tampon import tampon_comun
+
+
+class Optimizator(abc.ABC):
+    """
+    Bază pentru optimizatori. Starea (momente, medii pătratice) stă în
+    tablouri contigue `array('d')`, indexate în ordinea lui `parametri`
+    (de regulă `NN.parametri()`); un pas primește valorile și gradientele
+    ca tablouri NumPy și le actualizează în bloc, pe loc (`_actualizare`).
+
+    Când parametrii sunt exact tamponul unei rețele (`NN.tampon`), valorile
+    și gradientele sunt vederi `np.frombuffer` asupra tamponului: pasul și
+    `zero_grad()` scriu direct în el, fără copieri și fără buclă pe obiecte.
+    Vederile se creează la fiecare apel și nu se păstrează, pentru că banda
+    nu își poate extinde tablourile cât timp sunt exportate.
+    """
+
+    def __init__(self, parametri: Sequence[Scalar], lr: float) -> None:
+        if lr < 0.0:
+            raise ValueError(f'Rata de învățare trebuie să fie ≥ 0, nu {lr}')
+        self.parametri: list[Scalar] = list(parametri)
+        self.lr: float = lr
+        self.tampon = tampon_comun(self.parametri)
+
+    def _stare(self) -> array:
+        return array('d', bytes(8 * len(self.parametri)))
+
+    def _valori(self) -> np.ndarray:
+        """Valorile parametrilor: vedere asupra tamponului sau copie."""
+        if self.tampon is not None:
+            return np.frombuffer(self.tampon.valori, count=len(self.parametri))
+        return np.array([p.valoare for p in self.parametri], dtype=float)
+
+    def _gradienti(self) -> np.ndarray:
+        """Gradientele parametrilor: vedere asupra tamponului sau copie."""
+        if self.tampon is not None:
+            return np.frombuffer(self.tampon.gradienti, count=len(self.parametri))
+        return np.array([p.derivata for p in self.parametri], dtype=float)
+
+    def _scrie(self, valori: np.ndarray) -> None:
+        if self.tampon is not None:
+            np.frombuffer(self.tampon.valori, count=len(self.parametri))[:] = valori
+            return
+        for p, v in zip(self.parametri, valori.tolist()):
+            p.valoare = v
+
+    def zero_grad(self) -> None:
+        if self.tampon is not None:
+            np.frombuffer(self.tampon.gradienti, count=len(self.parametri)).fill(0.0)
+            return
+        for p in self.parametri:
+            p.derivata = 0.0
+
+    def step(self) -> None:
+        valori = self._valori()
+        self._actualizare(valori, self._gradienti())
+        if self.tampon is None:
+            self._scrie(valori)
+
+    @abc.abstractmethod
+    def _actualizare(self, valori: np.ndarray, grad: np.ndarray) -> None:
+        """Actualizează pe loc `valori` (și starea) pe baza gradientelor `grad`."""
+
+
+class SGD(Optimizator):
+    """Coborâre pe gradient, opțional cu momentum (clasic sau Nesterov)."""
+
+    def __init__(
+        self,
+        parametri: Sequence[Scalar],
+        lr: float = 0.01,
+        momentum: float = 0.0,
+        nesterov: bool = False,
+    ) -> None:
+        super().__init__(parametri, lr)
+        if nesterov and momentum <= 0.0:
+            raise ValueError('Nesterov necesită momentum > 0')
+        self.momentum: float = momentum
+        self.nesterov: bool = nesterov
+        self.viteza: array = self._stare()
+
+    def _actualizare(self, valori: np.ndarray, grad: np.ndarray) -> None:
+        lr, mu = self.lr, self.momentum
+        if mu == 0.0:
+            valori -= lr * grad
+            return
+
+        v = np.frombuffer(self.viteza)
+        v *= mu
+        v += grad
+        if self.nesterov:
+            valori -= lr * (grad + mu * v)
+        else:
+            valori -= lr * v
+
+
+class RMSProp(Optimizator):
+    """Pas scalat cu media mobilă a pătratelor gradientului."""
+
+    def __init__(
+        self,
+        parametri: Sequence[Scalar],
+        lr: float = 0.01,
+        rho: float = 0.9,
+        eps: float = 1e-8,
+    ) -> None:
+        super().__init__(parametri, lr)
+        self.rho: float = rho
+        self.eps: float = eps
+        self.medie_patrate: array = self._stare()
+
+    def _actualizare(self, valori: np.ndarray, grad: np.ndarray) -> None:
+        lr, rho, eps = self.lr, self.rho, self.eps
+        s = np.frombuffer(self.medie_patrate)
+        s *= rho
+        s += (1.0 - rho) * grad * grad
+        valori -= lr * grad / (np.sqrt(s) + eps)
+
+
+class Adam(Optimizator):
+    """Adam: momente de ordin 1 și 2 cu corecție de bias."""
+
+    def __init__(
+        self,
+        parametri: Sequence[Scalar],
+        lr: float = 0.001,
+        beta1: float = 0.9,
+        beta2: float = 0.999,
+        eps: float = 1e-8,
+    ) -> None:
+        super().__init__(parametri, lr)
+        self.beta1: float = beta1
+        self.beta2: float = beta2
+        self.eps: float = eps
+        self.m: array = self._stare()
+        self.v: array = self._stare()
+        self.pas: int = 0
+
+    def _actualizare(self, valori: np.ndarray, grad: np.ndarray) -> None:
+        b1, b2, eps = self.beta1, self.beta2, self.eps
+        self.pas += 1
+        m, v = np.frombuffer(self.m), np.frombuffer(self.v)
+        m *= b1
+        m += (1.0 - b1) * grad
+        v *= b2
+        v += (1.0 - b2) * grad * grad
+
+        # corecția de bias, inclusă în rata de învățare
+        lr = self.lr * math.sqrt(1.0 - b2 ** self.pas) / (1.0 - b1 ** self.pas)
+        valori -= lr * m / (np.sqrt(v) + eps)
+
+
+class NewtonCG(Optimizator):
+    """
+    Pas Newton trunchiat: direcția d rezolvă aproximativ (H + λ·I)·d = −g prin
+    gradient conjugat, cu produse Hessiană–vector obținute prin dublă
+    retropropagare (`scalar.gradient`). Nu folosește `derivata`: la fiecare
+    `step()` reconstruiește pierderea cu `pierdere()` (de ex.
+    `lambda: net.pierdere_batch(X, Y)`).
+
+    CG se oprește după `iteratii_cg` pași, când reziduul scade sub
+    `toleranta` sau la curbură nepozitivă; dacă d nu este o direcție de
+    coborâre, se folosește −g. Lungimea pasului pornește de la `lr` și se
+    înjumătățește (cel mult `injumatatiri` ori) până când pierderea scade
+    suficient (condiția Armijo); altfel parametrii rămân neschimbați.
+    """
+
+    def __init__(
+        self,
+        parametri: Sequence[Scalar],
+        pierdere: Callable[[], Scalar],
+        lr: float = 1.0,
+        iteratii_cg: int = 10,
+        amortizare: float = 1e-4,
+        toleranta: float = 1e-10,
+        injumatatiri: int = 10,
+    ) -> None:
+        super().__init__(parametri, lr)
+        self.pierdere = pierdere
+        self.iteratii_cg: int = iteratii_cg
+        self.amortizare: float = amortizare
+        self.toleranta: float = toleranta
+        self.injumatatiri: int = injumatatiri
+        self._pierdere_curenta: Scalar | None = None
+        self._grad: list[Scalar] | None = None
+
+    def _directie(self, grad: list[Scalar]) -> list[float]:
+        lam = self.amortizare
+
+        def H(v: list[float]) -> list[float]:
+            return [h.valoare + lam * vi
+                    for h, vi in zip(gradient(Scalar.dot(grad, v), self.parametri), v)]
+
+        r = [-g.valoare for g in grad]
+        d = [0.0] * len(r)
+        p = list(r)
+        rr = math.fsum(x * x for x in r)
+        for _ in range(self.iteratii_cg):
+            if rr < self.toleranta:
+                break
+            Hp = H(p)
+            pHp = math.fsum(a * b for a, b in zip(p, Hp))
+            if pHp <= 0.0:
+                break
+            alfa = rr / pHp
+            d = [di + alfa * pi for di, pi in zip(d, p)]
+            r = [ri - alfa * hi for ri, hi in zip(r, Hp)]
+            rr_nou = math.fsum(x * x for x in r)
+            p = [ri + (rr_nou / rr) * pi for ri, pi in zip(r, p)]
+            rr = rr_nou
+        return d
+
+    def _gradienti(self) -> np.ndarray:
+        # gradientul pierderii reconstruite; nodurile lui servesc la produsele
+        # Hessiană–vector din `_actualizare`
+        self._pierdere_curenta = self.pierdere()
+        self._grad = gradient(self._pierdere_curenta, self.parametri)
+        return np.array([g.valoare for g in self._grad], dtype=float)
+
+    def _actualizare(self, valori: np.ndarray, grad: np.ndarray) -> None:
+        L, graf = self._pierdere_curenta.valoare, self._grad
+        self._pierdere_curenta = self._grad = None
+        g = grad.tolist()
+        d = self._directie(graf)
+        panta = math.fsum(gi * di for gi, di in zip(g, d))
+        if panta >= 0.0:
+            d = [-gi for gi in g]
+            panta = -math.fsum(gi ** 2 for gi in g)
+
+        initiale, d = valori.copy(), np.array(d)
+        t = self.lr
+        for _ in range(self.injumatatiri + 1):
+            valori[:] = initiale + t * d
+            self._scrie(valori)
+            with no_grad():
+                if self.pierdere().valoare <= L + 1e-4 * t * panta:
+                    return
+            t *= 0.5
+        valori[:] = initiale
+        self._scrie(valori)
@@ -0,0 +1,138 @@
+from captura import Graf, Instructiune
+
+# Operații pentru care ordinea operanzilor nu schimbă rezultatul (nici în virgulă mobilă)
+_COMUTATIVE = ('+', '*')
+
+
+def _noduri(graf: Graf) -> int:
+    """Instrucțiuni + constante: nodurile grafului în afară de parametri și intrări."""
+    return len(graf.instructiuni) + len(graf.constante())
+
+
+def _pliaza_si_uneste(graf: Graf) -> tuple[list[Instructiune], int, int]:
+    """
+    Plierea constantelor și eliminarea subexpresiilor comune, într-o trecere.
+
+    O instrucțiune cu toți operanzii constanți devine constantă: valoarea ei
+    din captură rămâne neschimbată, deci nu trebuie recalculată. Constantele
+    egale și instrucțiunile identice (aceeași operație, aceiași operanzi,
+    același argument) se înlocuiesc cu prima apariție.
+    """
+    const = graf.constante()
+    inloc: dict[int, int] = {}
+    canonic: dict[str, int] = {}
+    pliate = comune = 0
+    for c, valoare in const.items():
+        inloc[c] = canonic.setdefault(repr(valoare), c)
+        comune += inloc[c] != c
+
+    vazute: dict[tuple, int] = {}
+    rezultat: list[Instructiune] = []
+    for op, i, a, arg in graf.instructiuni:
+        a = tuple(inloc.get(x, x) for x in a)
+        if all(x in const for x in a):
+            const[i] = graf.valori[i]
+            inloc[i] = canonic.setdefault(repr(graf.valori[i]), i)
+            pliate += 1
+            continue
+
+        cheie = (op, tuple(sorted(a)) if op in _COMUTATIVE else a, arg)
+        if cheie in vazute:
+            inloc[i] = vazute[cheie]
+            comune += 1
+            continue
+        vazute[cheie] = i
+        rezultat.append((op, i, a, arg))
+
+    graf.pierdere = inloc.get(graf.pierdere, graf.pierdere)
+    graf.iesiri = [inloc.get(y, y) for y in graf.iesiri]
+    return rezultat, pliate, comune
+
+
+def _contopeste(graf: Graf, instructiuni: list[Instructiune]) -> tuple[list[Instructiune], int]:
+    """
+    Operații dedicate în locul expansiunilor din `Scalar`:
+
+        x * -1.0        -> neg(x)
+        x + neg(y)      -> sub(x, y)
+        x * y ** -1     -> div(x, y)
+
+    Nodurile intermediare rămase fără utilizări dispar la `_elimina_moarte`.
+    'neg' și 'sub' dau exact aceleași valori; 'div' poate diferi de
+    x · y⁻¹ cu o unitate pe ultima zecimală.
+    """
+    const = graf.constante()
+    definitie: dict[int, Instructiune] = {}
+    rezultat: list[Instructiune] = []
+    contopite = 0
+    for op, i, a, arg in instructiuni:
+        nou = None
+        if op == '*':
+            x, y = a
+            if const.get(y) == -1.0:
+                nou = ('neg', i, (x,), 0.0)
+            elif const.get(x) == -1.0:
+                nou = ('neg', i, (y,), 0.0)
+            else:
+                for x, y in ((x, y), (y, x)):
+                    d = definitie.get(y)
+                    if d is not None and d[0] == '**' and d[3] == -1:
+                        nou = ('div', i, (x, d[2][0]), 0.0)
+                        break
+        elif op == '+':
+            for x, y in (a, a[::-1]):
+                d = definitie.get(y)
+                if d is not None and d[0] == 'neg':
+                    nou = ('sub', i, (x, d[2][0]), 0.0)
+                    break
+
+        if nou is not None:
+            contopite += 1
+            op, i, a, arg = nou
+        definitie[i] = (op, i, a, arg)
+        rezultat.append((op, i, a, arg))
+    return rezultat, contopite
+
+
+def _elimina_moarte(graf: Graf, instructiuni: list[Instructiune]) -> tuple[list[Instructiune], int]:
+    """Păstrează doar instrucțiunile de care depind pierderea sau ieșirile."""
+    vii = {graf.pierdere, *graf.iesiri}
+    pastrate: list[Instructiune] = []
+    for ins in reversed(instructiuni):
+        if ins[1] in vii:
+            vii.update(ins[2])
+            pastrate.append(ins)
+    pastrate.reverse()
+    return pastrate, len(instructiuni) - len(pastrate)
+
+
+def optimizeaza_graf(graf: Graf) -> dict[str, int]:
+    """
+    Simplifică `graf` pe loc și întoarce un raport cu numărul de noduri
+    (instrucțiuni + constante) înainte și după, plus ce a făcut fiecare trecere:
+
+        pliate      instrucțiuni cu operanzi constanți, devenite constante;
+        comune      subexpresii comune (și constante duplicate) unite;
+        contopite   neg/sub/div în locul lui '* -1.0', '+ neg', '* ** -1';
+        eliminate   instrucțiuni fără efect asupra pierderii sau ieșirilor;
+        fara_gradient  instrucțiuni rămase care nu duc la niciun parametru
+                    (se execută doar înainte, nu și la retropropagare).
+    """
+    inainte = _noduri(graf)
+    instructiuni, pliate, comune = _pliaza_si_uneste(graf)
+    graf.instructiuni = instructiuni
+    instructiuni, contopite = _contopeste(graf, instructiuni)
+    instructiuni, eliminate = _elimina_moarte(graf, instructiuni)
+    graf.instructiuni = instructiuni
+    graf._programeaza()
+
+    cu_gradient = graf.cu_gradient()
+    return {
+        'inainte': inainte,
+        'dupa': _noduri(graf),
+        'pliate': pliate,
+        'comune': comune,
+        'contopite': contopite,
+        'eliminate': eliminate,
+        'fara_gradient': sum(1 for _, i, _, _ in instructiuni if i not in cu_gradient),
+    }
@@ -0,0 +1,115 @@
+import multiprocessing
+from array import array
+from multiprocessing import shared_memory
+from typing import List
+
+import numpy as np
+
+from nn import NN
+
+# Starea fiecărui proces lucrător (inițializată o singură dată, în `_initializeaza`)
+_replica: NN | None = None
+_shm_valori: shared_memory.SharedMemory | None = None
+_shm_gradienti: shared_memory.SharedMemory | None = None
+
+
+def _din_memorie(vedere: memoryview) -> array:
+    tablou = array('d')
+    tablou.frombytes(vedere)
+    return tablou
+
+
+def _initializeaza(dimensiuni: List[int], backend: str, nume_valori: str, nume_gradienti: str) -> None:
+    global _replica, _shm_valori, _shm_gradienti
+    _replica = NN(dimensiuni, backend=backend)
+    _shm_valori = shared_memory.SharedMemory(name=nume_valori)
+    _shm_gradienti = shared_memory.SharedMemory(name=nume_gradienti)
+
+
+def _lucreaza(k: int, X: list, Y: list) -> float:
+    """Forward + retroprop pe fragmentul k; gradientul ajunge în slotul k din memoria partajată."""
+    n = _replica.tampon.nr_parametri
+    _replica.scrie_parametri(_din_memorie(_shm_valori.buf[:8 * n]))
+    _replica.reset_deriv()
+    pierdere = _replica.retroprop_batch(X, Y)
+    with _shm_gradienti.buf.cast('d') as grad:
+        grad[n * k:n * (k + 1)] = _replica.tampon.gradienti[:n]
+    return pierdere
+
+
+class GradientParalel:
+    """
+    Gradient pe mini-batch calculat în paralel, pe date (data-parallel).
+
+    Batch-ul se împarte în `procese` fragmente consecutive; fiecare proces
+    ține o replică a rețelei, citește parametrii din memoria partajată,
+    face forward + retroprop pe fragmentul lui și scrie gradientul plat în
+    propriul slot. Părintele reduce sloturile mereu în aceeași ordine
+    (rezultat determinist), vectorizat peste vederi NumPy ale memoriei
+    partajate, și adaugă gradientul în `net.tampon` (prin obiecte, dacă
+    tamponul nu e intact). Parametrii actualizați se publică la următorul
+    apel, printr-o singură copiere.
+
+    Are aceeași semnătură ca `NN.retroprop_batch`, deci poate înlocui rețeaua
+    în `Trainer`.
+    """
+
+    def __init__(self, net: NN, procese: int | None = None) -> None:
+        self.net = net
+        self.procese: int = procese or multiprocessing.cpu_count()
+        n = net.tampon.nr_parametri
+        self._shm_valori = shared_memory.SharedMemory(create=True, size=max(8 * n, 1))
+        self._shm_gradienti = shared_memory.SharedMemory(create=True, size=max(8 * n * self.procese, 1))
+        self._pool = multiprocessing.Pool(
+            self.procese,
+            initializer=_initializeaza,
+            initargs=(net.dimensiuni, net.backend, self._shm_valori.name, self._shm_gradienti.name),
+        )
+
+    def retroprop_batch(self, X: List[List[float]], Y: list) -> float:
+        if len(X) != len(Y):
+            raise ValueError(f'Batch cu {len(X)} intrări și {len(Y)} ținte')
+
+        n = self.net.tampon.nr_parametri
+        with self._shm_valori.buf.cast('d') as valori:
+            valori[:n] = self.net.citeste_parametri()
+
+        # fragmente consecutive, de mărimi cât mai egale
+        pas, rest = divmod(len(X), self.procese)
+        limite, start = [], 0
+        for k in range(self.procese):
+            capat = start + pas + (1 if k < rest else 0)
+            if capat > start:
+                limite.append((start, capat))
+            start = capat
+
+        pierderi = self._pool.starmap(
+            _lucreaza, [(k, X[a:b], Y[a:b]) for k, (a, b) in enumerate(limite)]
+        )
+
+        # media pe batch = Σ_k (n_k / B) · media pe fragmentul k
+        ponderi = [(b - a) / len(X) for a, b in limite]
+        intact = self.net.tampon.intact
+        total = (np.frombuffer(self.net.tampon.gradienti, count=n) if intact
+                 else np.array(self.net.citeste_gradienti()))
+        grad = np.frombuffer(self._shm_gradienti.buf, count=n * len(ponderi)).reshape(len(ponderi), n)
+        for k, p in enumerate(ponderi):
+            total += p * grad[k]
+        del grad  # vederea nu trebuie să blocheze închiderea memoriei partajate
+        if not intact:
+            self.net.scrie_gradienti(total.tolist())
+
+        return sum(p * l for p, l in zip(ponderi, pierderi))
+
+    def inchide(self) -> None:
+        self._pool.close()
+        self._pool.join()
+        for shm in (self._shm_valori, self._shm_gradienti):
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self) -> 'GradientParalel':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.inchide()
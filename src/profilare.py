@@ -0,0 +1,177 @@
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator
+
+import scalar
+from layer import Layer
+from scalar import Scalar
+
+
+def statistici_graf(radacina: Scalar) -> dict[str, int | float]:
+    """
+    Forma grafului din care provine `radacina`:
+
+        noduri, frunze   numărul de noduri, dintre care fără părinți;
+        adancime         cel mai lung drum de la o frunză la rădăcină;
+        latime           cele mai multe noduri aflate la aceeași adâncime;
+        fan_out_max      cei mai mulți copii ai unui nod;
+        fan_out_mediu    muchii / noduri.
+    """
+    ordine = radacina.ordine_topologica()
+    adancime: dict[int, int] = {}
+    copii: Counter[int] = Counter()
+    for nod in ordine:
+        d = 0
+        for p in nod._parinti:
+            copii[id(p)] += 1
+            d = max(d, adancime[id(p)] + 1)
+        adancime[id(nod)] = d
+
+    return {
+        'noduri': len(ordine),
+        'frunze': sum(1 for nod in ordine if not nod._parinti),
+        'adancime': adancime[id(radacina)],
+        'latime': max(Counter(adancime.values()).values()),
+        'fan_out_max': max(copii.values(), default=0),
+        'fan_out_mediu': sum(copii.values()) / len(ordine),
+    }
+
+
+class Profil:
+    """
+    Ce s-a măsurat într-un context `profilare()`:
+
+        noduri          noduri `Scalar` create, pe cod de operație ('' = frunză);
+        straturi        pe fiecare `Layer` apelat (în ordinea primului apel):
+                        apeluri, secunde în forward și în retropropagare;
+        retroprop       apeluri și secunde totale în `Scalar.retroprop`;
+        graf            `statistici_graf` pentru fiecare graf retropropagat
+                        (ultimul rămâne în `graf`).
+    """
+
+    def __init__(self) -> None:
+        self.noduri: Counter[str] = Counter()
+        self.straturi: dict[str, dict[str, float]] = {}
+        self.retroprop: dict[str, float] = {'apeluri': 0, 'secunde': 0.0}
+        self.grafuri: list[dict[str, int | float]] = []
+
+    @property
+    def graf(self) -> dict[str, int | float] | None:
+        return self.grafuri[-1] if self.grafuri else None
+
+    def raport(self) -> dict:
+        return {
+            'noduri': dict(self.noduri),
+            'straturi': {nume: dict(s) for nume, s in self.straturi.items()},
+            'retroprop': dict(self.retroprop),
+            'graf': self.graf,
+        }
+
+    def __str__(self) -> str:
+        linii = [f"{'operație':<16}{'noduri':>10}"]
+        for op, n in self.noduri.most_common():
+            linii.append(f"{op or 'frunză':<16}{n:>10}")
+        linii.append(f"\n{'strat':<16}{'apeluri':>10}{'forward (ms)':>16}{'retroprop (ms)':>16}")
+        for nume, s in self.straturi.items():
+            linii.append(f"{nume:<16}{s['apeluri']:>10}{s['inainte_s'] * 1e3:>16.3f}{s['inapoi_s'] * 1e3:>16.3f}")
+        r = self.retroprop
+        linii.append(f"\nretroprop: {r['apeluri']} apeluri, {r['secunde'] * 1e3:.3f} ms")
+        if self.graf is not None:
+            linii.append('graf: ' + ', '.join(f'{k}={v:g}' for k, v in self.graf.items()))
+        return '\n'.join(linii)
+
+
+@contextmanager
+def profilare() -> Iterator[Profil]:
+    """
+    Instrumentează temporar `Scalar.__init__`, `Scalar.retroprop`, tabela
+    `_RETRO` și `Layer.__call__` (plus `LayerNumpy.__call__`, dacă modulul
+    e încărcat); la ieșire se pun la loc originalele, deci în afara
+    contextului calea critică nu plătește nimic.
+
+    Retropropagarea unui nod se atribuie stratului în care nodul a fost
+    creat. Un `mod_rapid()`/`detectie_anomalii()` deschis în interior
+    înlocuiește constructorul, iar nodurile lui nu se mai numără.
+    """
+    profil = Profil()
+    perf = time.perf_counter
+    stari: dict[int, tuple[object, dict[str, float]]] = {}   # id(strat) -> (strat, statistici)
+    strat_nod: dict[int, dict[str, float]] = {}              # id(nod) -> statisticile stratului
+    curent: list[dict[str, float] | None] = [None]   # stratul în construcție
+    segment: list = [None, 0.0]                       # stratul retropropagat, începutul segmentului
+
+    init = Scalar.__init__
+    retroprop = Scalar.retroprop
+    retro = dict(scalar._RETRO)
+    clase = [Layer]
+    if 'layer_numpy' in sys.modules:
+        clase.append(sys.modules['layer_numpy'].LayerNumpy)
+    apeluri = {cls: cls.__call__ for cls in clase}
+
+    def init_profilat(self: Scalar, valoare: float, parinti=(), operatie: str = '', arg: float = 0.0) -> None:
+        init(self, valoare, parinti, operatie, arg)
+        profil.noduri[operatie] += 1
+        if curent[0] is not None:
+            strat_nod[id(self)] = curent[0]
+        else:
+            strat_nod.pop(id(self), None)  # id refolosit de un nod din afara straturilor
+
+    def inchide_segment(stare: dict[str, float] | None) -> None:
+        t = perf()
+        if segment[0] is not None:
+            segment[0]['inapoi_s'] += t - segment[1]
+        segment[0], segment[1] = stare, t
+
+    def retro_profilat(functie):
+        def f(nod: Scalar, g: float) -> None:
+            stare = strat_nod.get(id(nod))
+            if stare is not segment[0]:
+                inchide_segment(stare)
+            functie(nod, g)
+        return f
+
+    def retroprop_profilat(self: Scalar, *args, **kwargs) -> None:
+        profil.grafuri.append(statistici_graf(self))
+        t0 = perf()
+        segment[0], segment[1] = None, t0
+        try:
+            retroprop(self, *args, **kwargs)
+        finally:
+            inchide_segment(None)
+            profil.retroprop['apeluri'] += 1
+            profil.retroprop['secunde'] += perf() - t0
+
+    def apel_profilat(original):
+        def __call__(strat, x):
+            if id(strat) not in stari:
+                stari[id(strat)] = (strat, {'apeluri': 0, 'inainte_s': 0.0, 'inapoi_s': 0.0})
+                profil.straturi[f'strat {len(profil.straturi)}'] = stari[id(strat)][1]
+            stare = stari[id(strat)][1]
+            anterior = curent[0]
+            curent[0] = stare
+            t0 = perf()
+            try:
+                return original(strat, x)
+            finally:
+                stare['inainte_s'] += perf() - t0
+                stare['apeluri'] += 1
+                curent[0] = anterior
+        return __call__
+
+    Scalar.__init__ = init_profilat
+    Scalar.retroprop = retroprop_profilat
+    scalar._RETRO.update({op: retro_profilat(f) for op, f in retro.items()})
+    for cls, original in apeluri.items():
+        cls.__call__ = apel_profilat(original)
+    try:
+        yield profil
+    finally:
+        Scalar.__init__ = init
+        Scalar.retroprop = retroprop
+        scalar._RETRO.update(retro)
+        for cls, original in apeluri.items():
+            cls.__call__ = original
+        stari.clear()
+        strat_nod.clear()
@@ -1,34 +1,165 @@
 import math
-from typing import Callable, Iterable, Self
+import os
+import sys
+from contextlib import AbstractContextManager, contextmanager
+from typing import Callable, Iterable, Iterator, Self, Sequence
+
+# False în interiorul lui `no_grad()`: operațiile produc doar valori, fără graf
+_graf_activ: bool = True
+
+# True în interiorul lui `detectie_anomalii()`
+_anomalii: bool = False
+_INF = math.inf
+
+# Codul de operație al nodurilor interne eliberate de `retroprop` (retain_graph=False)
+_ELIBERAT = '<eliberat>'
+
+
+def _graf_eliberat() -> None:
+    raise RuntimeError(
+        'Graful a fost deja eliberat de o retropropagare anterioară; '
+        'folosiți retroprop(retain_graph=True) pentru a-l parcurge din nou'
+    )
+
+
+# Locul creării fiecărui nod, doar în `detectie_anomalii()`; id(nod) -> (nod, loc)
+_provenienta: dict[int, tuple['Scalar', str]] = {}
+
+
+@contextmanager
+def no_grad() -> Iterator[None]:
+    """
+    Mod inferență: nodurile create în context nu rețin părinți și nici cod de
+    operație, deci graful nu se construiește și memoria se eliberează imediat.
+    """
+    global _graf_activ
+    anterior = _graf_activ
+    _graf_activ = False
+    try:
+        yield
+    finally:
+        _graf_activ = anterior
+
+
+@contextmanager
+def _constructor(init: Callable[..., None], anomalii: bool) -> Iterator[None]:
+    """Înlocuiește `Scalar.__init__` cât durează contextul; calea implicită nu plătește nimic."""
+    global _anomalii
+    anterior = Scalar.__init__, _anomalii
+    Scalar.__init__, _anomalii = init, anomalii
+    try:
+        yield
+    finally:
+        Scalar.__init__, _anomalii = anterior
+        if not _anomalii:
+            _provenienta.clear()
+
+
+def mod_rapid() -> AbstractContextManager[None]:
+    """
+    Nodurile create în context nu își mai verifică valoarea: NaN și inf se
+    propagă fără eroare. Pentru rulări de producție deja depanate.
+    """
+    return _constructor(_init_rapid, False)
+
+
+def detectie_anomalii() -> AbstractContextManager[None]:
+    """
+    Mod de depanare: fiecare nod creat în context își reține locul creării
+    (fișier:linie, funcție), iar `retroprop` verifică valorile și gradientele
+    tuturor nodurilor. Prima valoare NaN/inf ridică `AnomalieNumerica`, cu
+    operația care a produs-o și lanțul ei de părinți. Mai lent și ține
+    nodurile în viață până la ieșirea din context.
+    """
+    return _constructor(_init_anomalii, True)
+
+
+class AnomalieNumerica(ValueError):
+    """NaN sau inf apărut într-o valoare sau într-un gradient, cu proveniența lui."""
+
+    def __init__(self, mesaj: str, operatie: str, lant: list[str]) -> None:
+        super().__init__('\n  '.join([mesaj, *lant]))
+        self.operatie = operatie
+        self.lant = lant
+
+
+def _locatie() -> str:
+    """Primul cadru de apel din afara acestui modul."""
+    cadru = sys._getframe(1)
+    while cadru is not None and cadru.f_code.co_filename == __file__:
+        cadru = cadru.f_back
+    if cadru is None:
+        return '?'
+    return f'{os.path.basename(cadru.f_code.co_filename)}:{cadru.f_lineno} în {cadru.f_code.co_name}'
+
+
+def _descrie(nod: 'Scalar') -> str:
+    operatie = nod._operatie or 'frunză'
+    loc = _provenienta.get(id(nod))
+    unde = f', creat la {loc[1]}' if loc is not None and loc[0] is nod else ''
+    return f'{operatie!r} (valoare={nod.valoare!r}{unde})'
+
+
+def _lant(parinti: Sequence['Scalar'], adancime: int = 3) -> list[str]:
+    """Părinții (și părinții lor, până la `adancime` niveluri), câte unul pe rând."""
+    linii: list[str] = []
+    nivel = [(p, 1) for p in parinti]
+    while nivel:
+        nod, d = nivel.pop(0)
+        linii.append(f'{"  " * (d - 1)}← {_descrie(nod)}')
+        if d < adancime:
+            nivel[:0] = [(p, d + 1) for p in nod._parinti]
+    return linii
+
+
+def _valoare_invalida(valoare: float, parinti: Iterable['Scalar'], operatie: str) -> None:
+    if not _anomalii:
+        raise ValueError("Valoarea nu poate fi NaN sau inf")
+    parinti = tuple(parinti)
+    raise AnomalieNumerica(
+        f'Valoarea {valoare!r} produsă de operația {operatie or "frunză"!r} la {_locatie()}',
+        operatie,
+        _lant(parinti),
+    )
 
 
 class Scalar:
+    """
+    Nod în graful de calcul: valoare + derivată.
+
+    Nodul nu păstrează closure-uri: `_operatie` este un cod de operație
+    ('+', '*', '**', 'tanh', 'ReLU', 'sum', 'dot', 'dot_tanh'; '' pentru
+    frunze), iar derivata se propagă printr-o singură tabelă de funcții,
+    `_RETRO`. Pentru '**' exponentul k se află în `_arg`, pentru 'dot' și
+    'dot_tanh' numărul de ponderi.
+    """
+
+    __slots__ = ('valoare', 'derivata', '_parinti', '_operatie', '_arg')
+
     def __init__(
         self,
         valoare: float,
         parinti: Iterable[Self] = (),
         operatie: str = '',
+        arg: float = 0.0,
     ) -> None:
-        if math.isnan(valoare) or math.isinf(valoare):
-            raise ValueError("Valoarea nu poate fi NaN sau inf")
+        if not -_INF < valoare < _INF:
+            _valoare_invalida(valoare, parinti, operatie)
 
         self.valoare: float = float(valoare)
         self.derivata: float = 0.0
-        self._parinti: set[Self] = set(parinti)
-        self._operatie: str = operatie
-        self._retro: Callable[[float], None] = lambda g: None
+        if _graf_activ:
+            self._parinti: tuple[Self, ...] = tuple(parinti)
+            self._operatie: str = operatie
+        else:
+            self._parinti = ()
+            self._operatie = ''
+        self._arg: float = arg
 
     # Adunare
     def __add__(self, alt: Self | float) -> Self:
         alt = alt if isinstance(alt, Scalar) else Scalar(alt)
-        suma = Scalar(self.valoare + alt.valoare, (self, alt), '+')
-
-        def calc_grad(g: float) -> None:
-            self.derivata += g
-            alt.derivata += g
-
-        suma._retro = calc_grad
-        return suma
+        return Scalar(self.valoare + alt.valoare, (self, alt), '+')
 
     # Adunare inversă
     def __radd__(self, alt: float) -> Self:
@@ -45,14 +176,7 @@ class Scalar:
     # Multiplicare
     def __mul__(self, alt: Self | float) -> Self:
         alt = alt if isinstance(alt, Scalar) else Scalar(alt)
-        produs = Scalar(self.valoare * alt.valoare, (self, alt), '*')
-
-        def calc_grad(g: float) -> None:
-            self.derivata += alt.valoare * g
-            alt.derivata += self.valoare * g
-
-        produs._retro = calc_grad
-        return produs
+        return Scalar(self.valoare * alt.valoare, (self, alt), '*')
 
     # Multiplicare inversă
     def __rmul__(self, alt: float) -> Self:
@@ -76,52 +200,401 @@ class Scalar:
         if self.valoare == 0.0 and exp < 0:
             raise ZeroDivisionError("0 cannot be raised to a negative power")
 
-        rez = Scalar(self.valoare ** exp, (self,), f'**{exp}')
-
-        def calc_grad(g: float) -> None:
-            self.derivata += exp * (self.valoare ** (exp - 1)) * g
-
-        rez._retro = calc_grad
-        return rez
+        return Scalar(self.valoare ** exp, (self,), '**', exp)
 
     # Activări element-wise
     def relu(self) -> Self:
-        rez = Scalar(self.valoare if self.valoare > 0 else 0.0, (self,), 'ReLU')
+        return Scalar(self.valoare if self.valoare > 0 else 0.0, (self,), 'ReLU')
 
-        def calc_grad(g: float) -> None:
-            self.derivata += (1.0 if self.valoare > 0 else 0.0) * g
+    def tanh(self) -> Self:
+        return Scalar(math.tanh(self.valoare), (self,), 'tanh')
 
-        rez._retro = calc_grad
-        return rez
+    # Operații n-are: un singur nod pentru toată reducerea
+    @staticmethod
+    def sum(termeni: Iterable['Scalar | float']) -> 'Scalar':
+        """Σ termeni ca un singur nod (în loc de un lanț de k−1 adunări)."""
+        termeni = tuple(t if isinstance(t, Scalar) else Scalar(t) for t in termeni)
+        s = 0.0
+        for t in termeni:
+            s += t.valoare
+        return Scalar(s, termeni, 'sum')
 
-    def tanh(self) -> Self:
-        t = math.tanh(self.valoare)
-        rez = Scalar(t, (self,), 'tanh')
+    @staticmethod
+    def dot(ponderi: Sequence['Scalar | float'], intrari: Sequence['Scalar | float']) -> 'Scalar':
+        """Σ w_i · x_i ca un singur nod; părinții sunt (w_1..w_n, x_1..x_n)."""
+        if len(ponderi) != len(intrari):
+            raise ValueError(f"Produs scalar între vectori de lungimi {len(ponderi)} și {len(intrari)}")
+        ponderi = [w if isinstance(w, Scalar) else Scalar(w) for w in ponderi]
+        intrari = [x if isinstance(x, Scalar) else Scalar(x) for x in intrari]
+        s = 0.0
+        for w, x in zip(ponderi, intrari):
+            s += w.valoare * x.valoare
+        return Scalar(s, (*ponderi, *intrari), 'dot', len(ponderi))
 
-        def calc_grad(g: float) -> None:
-            self.derivata += (1.0 - t * t) * g
+    # Nod fuzionat: tanh(b + Σ w_i · x_i)
+    @staticmethod
+    def dot_tanh(ponderi: Sequence['Scalar'], intrari: Sequence['Scalar'], bias: 'Scalar') -> 'Scalar':
+        """
+        Un singur nod pentru combinația liniară și activarea unui neuron, în
+        locul celor 2n+1 noduri construite cu `*`, `+` și `tanh`. Părinții sunt
+        (bias, w_1..w_n, x_1..x_n).
+        """
+        if len(ponderi) != len(intrari):
+            raise ValueError(f"Produs scalar între vectori de lungimi {len(ponderi)} și {len(intrari)}")
+        intrari = [x if isinstance(x, Scalar) else Scalar(x) for x in intrari]
+        s = bias.valoare
+        for w, x in zip(ponderi, intrari):
+            s += w.valoare * x.valoare
+        return Scalar(math.tanh(s), (bias, *ponderi, *intrari), 'dot_tanh', len(ponderi))
 
-        rez._retro = calc_grad
-        return rez
+    # Derivata locală a nodului, propagată către părinți
+    def _retro(self, g: float) -> None:
+        _RETRO[self._operatie](self, g)
 
-    # Propagare înapoi
-    def retroprop(self) -> None:
-        """Pornește retropropagarea (setează dL/dself = 1)."""
+    # Ordonare topologică (iterativă, fără limită de recursivitate)
+    def ordine_topologica(self) -> list[Self]:
+        """
+        Nodurile grafului în ordine topologică (părinții înaintea copiilor).
+        Un nod eliberat de o retropropagare anterioară ridică RuntimeError.
+        """
+        if self._operatie == _ELIBERAT:
+            _graf_eliberat()
         ordine: list[Scalar] = []
-        vizitat: set[Scalar] = set()
+        vizitat: set[Scalar] = {self}
+        stiva: list[tuple[Scalar, Iterator[Scalar]]] = [(self, iter(self._parinti))]
 
-        def construieste_noduri(nod: Scalar) -> None:
-            if nod not in vizitat:
-                vizitat.add(nod)
-                for p in nod._parinti:
-                    construieste_noduri(p)
+        while stiva:
+            nod, parinti = stiva[-1]
+            for p in parinti:
+                if p not in vizitat:
+                    vizitat.add(p)
+                    if p._parinti:
+                        stiva.append((p, iter(p._parinti)))
+                        break
+                    if p._operatie == _ELIBERAT:
+                        _graf_eliberat()
+                    ordine.append(p)  # frunzele nu mai trec prin stivă
+            else:
+                stiva.pop()
                 ordine.append(nod)
 
-        construieste_noduri(self)
+        return ordine
+
+    # Propagare înapoi
+    def retroprop(self, ordine: list[Self] | None = None, retain_graph: bool | None = None) -> None:
+        """
+        Pornește retropropagarea (setează dL/dself = 1).
+
+        Args:
+            ordine: ordinea topologică obținută cu `self.ordine_topologica()`,
+                refolosită la retropropagări repetate prin același graf, ca
+                sortarea să nu se refacă; valabilă doar cât structura grafului
+                nu se schimbă. Ordinea o păstrează apelantul, nu nodul (ar
+                forma un ciclu de referințe), iar un nou forward creează
+                noduri noi, deci nu se refolosește între pașii de antrenare;
+                pentru asta există `NN.captureaza()` (`captura.PlanStatic`),
+                care înregistrează structura o dată și o reexecută pe
+                parametrii curenți.
+            retain_graph: False (implicit fără `ordine`) eliberează părinții
+                fiecărui nod intern imediat după ce i-a propagat derivata,
+                astfel că graful se dezalocă pe parcursul parcurgerii; o nouă
+                retropropagare, captură sau `gradient` prin aceste noduri
+                ridică RuntimeError. True păstrează graful pentru o nouă
+                retropropagare.
+
+        Derivatele nodurilor interne se golesc înaintea fiecărei parcurgeri,
+        deci o retropropagare repetată nu le cumulează; frunzele (parametrii)
+        cumulează, ca înainte.
+        """
+        if retain_graph is None:
+            retain_graph = ordine is not None
+        elif ordine is not None and not retain_graph:
+            raise ValueError('O ordine refolosită necesită retain_graph=True')
+
+        if ordine is None:
+            ordine = self.ordine_topologica()
+
+        # o parcurgere anterioară (retain_graph=True) a lăsat derivate în nodurile interne
+        for nod in ordine:
+            if nod._parinti:
+                nod.derivata = 0.0
+            elif nod._operatie == _ELIBERAT:
+                _graf_eliberat()  # ordine refolosită, eliberată între timp de alt graf
         self.derivata = 1.0
 
-        for nod in reversed(ordine):
-            nod._retro(nod.derivata)
+        retro = _RETRO
+        if _anomalii:
+            _retro_verificat(ordine, retain_graph)
+            return
+        if retain_graph:
+            for nod in reversed(ordine):
+                if nod._parinti:
+                    retro[nod._operatie](nod, nod.derivata)
+            return
+
+        # copiii sunt procesați înaintea părinților: după pop() și golirea
+        # legăturilor, singura referință la nod o mai poate avea apelantul
+        while ordine:
+            nod = ordine.pop()
+            if nod._parinti:
+                retro[nod._operatie](nod, nod.derivata)
+                nod._parinti = ()
+                nod._operatie = _ELIBERAT
 
     def __repr__(self) -> str:
         return f'Scalar(valoare={self.valoare:.4f}, deriv={self.derivata:.4f})'
+
+
+# Constructori alternativi pentru `mod_rapid()` și `detectie_anomalii()`
+_init_verificat = Scalar.__init__
+
+
+def _init_rapid(
+    self: Scalar,
+    valoare: float,
+    parinti: Iterable[Scalar] = (),
+    operatie: str = '',
+    arg: float = 0.0,
+) -> None:
+    self.valoare = float(valoare)
+    self.derivata = 0.0
+    if _graf_activ:
+        self._parinti = tuple(parinti)
+        self._operatie = operatie
+    else:
+        self._parinti = ()
+        self._operatie = ''
+    self._arg = arg
+
+
+def _init_anomalii(
+    self: Scalar,
+    valoare: float,
+    parinti: Iterable[Scalar] = (),
+    operatie: str = '',
+    arg: float = 0.0,
+) -> None:
+    _init_verificat(self, valoare, parinti, operatie, arg)
+    _provenienta[id(self)] = (self, _locatie())
+
+
+def _retro_verificat(ordine: list[Scalar], retain_graph: bool) -> None:
+    """Retropropagarea din `detectie_anomalii()`: verifică fiecare valoare și gradient."""
+    for nod in ordine:
+        if not -_INF < nod.valoare < _INF:
+            raise AnomalieNumerica(
+                f'Valoare non-finită în nodul {_descrie(nod)}', nod._operatie, _lant(nod._parinti)
+            )
+
+    for nod in reversed(ordine):
+        if not nod._parinti:
+            continue
+        _RETRO[nod._operatie](nod, nod.derivata)
+        for k, p in enumerate(nod._parinti):
+            if not -_INF < p.derivata < _INF:
+                raise AnomalieNumerica(
+                    f'Gradientul {p.derivata!r} al părintelui {k} produs de retropropagarea '
+                    f'nodului {_descrie(nod)} (gradient primit {nod.derivata!r})',
+                    nod._operatie,
+                    _lant(nod._parinti, adancime=1),
+                )
+
+    if not retain_graph:
+        for nod in ordine:
+            if nod._parinti:
+                nod._parinti = ()
+                nod._operatie = _ELIBERAT
+        ordine.clear()
+
+
+# Reguli de derivare, indexate după codul operației
+def _retro_frunza(nod: Scalar, g: float) -> None:
+    pass
+
+
+def _retro_add(nod: Scalar, g: float) -> None:
+    a, b = nod._parinti
+    a.derivata += g
+    b.derivata += g
+
+
+def _retro_mul(nod: Scalar, g: float) -> None:
+    a, b = nod._parinti
+    a.derivata += b.valoare * g
+    b.derivata += a.valoare * g
+
+
+def _retro_pow(nod: Scalar, g: float) -> None:
+    a, = nod._parinti
+    exp = nod._arg
+    a.derivata += exp * (a.valoare ** (exp - 1)) * g
+
+
+def _retro_relu(nod: Scalar, g: float) -> None:
+    a, = nod._parinti
+    a.derivata += (1.0 if a.valoare > 0 else 0.0) * g
+
+
+def _retro_tanh(nod: Scalar, g: float) -> None:
+    a, = nod._parinti
+    t = nod.valoare
+    a.derivata += (1.0 - t * t) * g
+
+
+def _retro_sum(nod: Scalar, g: float) -> None:
+    for p in nod._parinti:
+        p.derivata += g
+
+
+def _retro_dot(nod: Scalar, g: float) -> None:
+    p = nod._parinti
+    n = int(nod._arg)
+    for i in range(n):
+        w, x = p[i], p[n + i]
+        w.derivata += x.valoare * g
+        x.derivata += w.valoare * g
+
+
+def _retro_dot_tanh(nod: Scalar, g: float) -> None:
+    p = nod._parinti
+    n = int(nod._arg)
+    t = nod.valoare
+    dz = (1.0 - t * t) * g
+    p[0].derivata += dz
+    for i in range(1, n + 1):
+        w, x = p[i], p[n + i]
+        w.derivata += x.valoare * dz
+        x.derivata += w.valoare * dz
+
+
+_RETRO: dict[str, Callable[[Scalar, float], None]] = {
+    '': _retro_frunza,
+    '+': _retro_add,
+    '*': _retro_mul,
+    '**': _retro_pow,
+    'ReLU': _retro_relu,
+    'tanh': _retro_tanh,
+    'sum': _retro_sum,
+    'dot': _retro_dot,
+    'dot_tanh': _retro_dot_tanh,
+}
+
+
+def inregistreaza_retro(operatie: str, functie: Callable[[Scalar, float], None]) -> None:
+    """Adaugă regula de derivare pentru un cod de operație definit în alt modul."""
+    _RETRO[operatie] = functie
+
+
+# Reguli de derivare simbolice: contribuțiile (părinte, g · ∂nod/∂părinte) ca
+# noduri `Scalar`, astfel încât gradientul însuși să poată fi derivat
+Contributii = Iterable[tuple[Scalar, Scalar]]
+
+
+def _graf_add(nod: Scalar, g: Scalar) -> Contributii:
+    a, b = nod._parinti
+    return ((a, g), (b, g))
+
+
+def _graf_mul(nod: Scalar, g: Scalar) -> Contributii:
+    a, b = nod._parinti
+    return ((a, g * b), (b, g * a))
+
+
+def _graf_pow(nod: Scalar, g: Scalar) -> Contributii:
+    a, = nod._parinti
+    exp = nod._arg
+    if exp == 1:
+        return ((a, g),)
+    return ((a, g * (a ** (exp - 1) * exp)),)
+
+
+def _graf_relu(nod: Scalar, g: Scalar) -> Contributii:
+    a, = nod._parinti
+    return ((a, g),) if a.valoare > 0 else ()
+
+
+def _graf_tanh(nod: Scalar, g: Scalar) -> Contributii:
+    a, = nod._parinti
+    return ((a, g * (-(nod * nod) + 1.0)),)
+
+
+def _graf_sum(nod: Scalar, g: Scalar) -> Contributii:
+    return ((p, g) for p in nod._parinti)
+
+
+def _graf_dot(nod: Scalar, g: Scalar) -> Contributii:
+    p = nod._parinti
+    n = int(nod._arg)
+    for i in range(n):
+        w, x = p[i], p[n + i]
+        yield w, g * x
+        yield x, g * w
+
+
+def _graf_dot_tanh(nod: Scalar, g: Scalar) -> Contributii:
+    p = nod._parinti
+    n = int(nod._arg)
+    dz = g * (-(nod * nod) + 1.0)
+    yield p[0], dz
+    for i in range(1, n + 1):
+        w, x = p[i], p[n + i]
+        yield w, dz * x
+        yield x, dz * w
+
+
+_RETRO_GRAF: dict[str, Callable[[Scalar, Scalar], Contributii]] = {
+    '+': _graf_add,
+    '*': _graf_mul,
+    '**': _graf_pow,
+    'ReLU': _graf_relu,
+    'tanh': _graf_tanh,
+    'sum': _graf_sum,
+    'dot': _graf_dot,
+    'dot_tanh': _graf_dot_tanh,
+}
+
+
+def inregistreaza_retro_graf(operatie: str, functie: Callable[[Scalar, Scalar], Contributii] | str) -> None:
+    """
+    Regula simbolică (pentru `gradient`) a unui cod de operație definit în alt
+    modul; un șir refolosește regula operației cu acel nume.
+    """
+    _RETRO_GRAF[operatie] = _RETRO_GRAF[functie] if isinstance(functie, str) else functie
+
+
+def gradient(iesire: Scalar, fata_de: Sequence[Scalar]) -> list[Scalar]:
+    """
+    ∂iesire/∂x pentru fiecare x din `fata_de`, ca noduri `Scalar` (mod de
+    ordin superior): parcurgerea inversă folosește operații `Scalar` în locul
+    float-urilor, deci rezultatul are propriul graf și poate fi derivat din
+    nou (cu `retroprop` sau cu `gradient`). Nu modifică `derivata` niciunui
+    nod. Nodurile fără legătură cu `iesire` primesc gradientul 0.
+    """
+    contributii: dict[int, list[Scalar]] = {id(iesire): [Scalar(1.0)]}
+    total: dict[int, Scalar] = {}
+    for nod in reversed(iesire.ordine_topologica()):
+        termeni = contributii.pop(id(nod), None)
+        if termeni is None:
+            continue
+        g = termeni[0] if len(termeni) == 1 else Scalar.sum(termeni)
+        total[id(nod)] = g
+        if not nod._parinti:
+            continue
+        regula = _RETRO_GRAF.get(nod._operatie)
+        if regula is None:
+            raise ValueError(f'Operația {nod._operatie!r} nu are regulă de derivare simbolică')
+        for p, c in regula(nod, g):
+            contributii.setdefault(id(p), []).append(c)
+
+    return [total[id(x)] if id(x) in total else Scalar(0.0) for x in fata_de]
+
+
+def hvp(iesire: Scalar, parametri: Sequence[Scalar], v: Sequence[float]) -> list[float]:
+    """
+    Produsul Hessiană–vector H·v = ∇(∇f · v), cu două parcurgeri inverse
+    (`gradient` de două ori) în loc de 2·len(parametri) evaluări ale lui f.
+    """
+    if len(v) != len(parametri):
+        raise ValueError(f'Vector de lungime {len(v)} pentru {len(parametri)} parametri')
+    g = gradient(iesire, parametri)
+    return [h.valoare for h in gradient(Scalar.dot(g, v), parametri)]
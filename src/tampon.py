@@ -0,0 +1,165 @@
+import math
+from array import array
+from typing import Sequence
+
+from scalar import Scalar, inregistreaza_retro, inregistreaza_retro_graf
+
+
+class TamponParametri:
+    """
+    Tablouri contigue cu valorile și gradientele tuturor parametrilor unei rețele.
+
+    Parametrii se alocă în ordine (`parametru`, `bloc`) și sunt vederi
+    asupra tablourilor, astfel că golirea gradientelor, actualizările și
+    salvarea devin operații în bloc. Aceeași interfață (`valori`,
+    `gradienti`, `nr_parametri`, `parametru`, `intact`) o oferă și `Banda`.
+
+    `intact` devine False când un neuron își înlocuiește parametrii cu alte
+    obiecte (`neuron.ponderi = [...]`, `neuron.ponderi[i] = ...`,
+    `neuron.bias = ...`); din acel moment tamponul nu mai conține toți
+    parametrii rețelei, iar operațiile în bloc ale lui `NN` trec pe obiecte.
+    """
+
+    def __init__(self, nr_parametri: int) -> None:
+        self.valori = array('d', bytes(8 * nr_parametri))
+        self.gradienti = array('d', bytes(8 * nr_parametri))
+        self.nr_parametri: int = nr_parametri
+        self.intact: bool = True
+        self._urmator: int = 0
+
+    def bloc(self, lungime: int) -> int:
+        """Rezervă `lungime` poziții consecutive; întoarce indicele primei."""
+        start = self._urmator
+        if start + lungime > self.nr_parametri:
+            raise RuntimeError(f'Tamponul are doar {self.nr_parametri} poziții')
+        self._urmator += lungime
+        return start
+
+    def parametru(self, valoare: float) -> 'Parametru':
+        i = self.bloc(1)
+        self.valori[i] = valoare
+        return Parametru(self, i)
+
+    def zero_grad(self) -> None:
+        self.gradienti[:] = array('d', bytes(8 * self.nr_parametri))
+
+    def __len__(self) -> int:
+        return self.nr_parametri
+
+
+class Parametru(Scalar):
+    """Frunză `Scalar` ale cărei valoare și derivată stau în `TamponParametri`."""
+
+    __slots__ = ('tampon', 'index')
+
+    def __init__(self, tampon: TamponParametri, index: int) -> None:
+        self.tampon = tampon
+        self.index = index
+        self._parinti = ()
+        self._operatie = ''
+        self._arg = 0.0
+
+    @property
+    def valoare(self) -> float:
+        return self.tampon.valori[self.index]
+
+    @valoare.setter
+    def valoare(self, v: float) -> None:
+        self.tampon.valori[self.index] = v
+
+    @property
+    def derivata(self) -> float:
+        return self.tampon.gradienti[self.index]
+
+    @derivata.setter
+    def derivata(self, g: float) -> None:
+        self.tampon.gradienti[self.index] = g
+
+
+class ListaParametri(list):
+    """
+    Lista ponderilor unui neuron alocate dintr-un tampon (`TamponParametri`
+    sau `Banda`). Orice modificare a listei o marchează `modificata` și
+    marchează tamponul ca neintact.
+    """
+
+    __slots__ = ('tampon', 'modificata')
+
+    def __init__(self, parametri: Sequence[Scalar], tampon, modificata: bool = False) -> None:
+        super().__init__(parametri)
+        self.tampon = tampon
+        self.modificata: bool = modificata
+
+    def _modifica(self) -> None:
+        self.modificata = True
+        self.tampon.intact = False
+
+    def __reduce__(self):
+        # copy/pickle refac lista prin constructor, nu prin `append` (care ar marca-o modificată)
+        return type(self), (list(self), self.tampon, self.modificata)
+
+
+def _modificator(nume: str):
+    metoda = getattr(list, nume)
+
+    def f(self: ListaParametri, *args, **kwargs):
+        self._modifica()
+        return metoda(self, *args, **kwargs)
+    f.__name__ = nume
+    return f
+
+
+for _nume in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend',
+              'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(ListaParametri, _nume, _modificator(_nume))
+
+
+def tampon_comun(parametri: Sequence[Scalar]):
+    """Tamponul ai cărui parametri sunt exact pozițiile 0..n-1, altfel None."""
+    if not parametri:
+        return None
+    tampon = getattr(parametri[0], 'tampon', None)
+    if tampon is None or tampon.nr_parametri != len(parametri):
+        return None
+    for i, p in enumerate(parametri):
+        if getattr(p, 'tampon', None) is not tampon or p.index != i:
+            return None
+    return tampon
+
+
+def dot_tanh_bloc(ponderi: Sequence[Parametru], intrari: Sequence[Scalar | float], bias: Parametru) -> Scalar:
+    """
+    Ca `Scalar.dot_tanh`, pentru un neuron ale cărui ponderi și bias ocupă
+    poziții consecutive [w_1..w_n, b] în tampon: valorile și gradientele
+    se citesc/scriu direct în tablouri, fără proprietățile lui `Parametru`.
+    Apelantul garantează că obiectele sunt cele alocate în bloc
+    (`Neuron` verifică asta prin `ListaParametri`).
+    """
+    tampon, start, n = bias.tampon, ponderi[0].index, len(ponderi)
+    s = tampon.valori[start + n]
+    try:
+        for w, x in zip(tampon.valori[start:start + n], intrari):
+            s += w * x.valoare
+    except AttributeError:
+        # intrări float: se împachetează în `Scalar`, ca la `Scalar.dot_tanh`
+        return dot_tanh_bloc(ponderi, [x if isinstance(x, Scalar) else Scalar(x) for x in intrari], bias)
+    return Scalar(math.tanh(s), (bias, *ponderi, *intrari), 'dot_tanh_bloc', n)
+
+
+def _retro_dot_tanh_bloc(nod: Scalar, g: float) -> None:
+    p = nod._parinti
+    n = int(nod._arg)
+    t = nod.valoare
+    dz = (1.0 - t * t) * g
+    tampon, start = p[0].tampon, p[1].index
+    val, grad = tampon.valori, tampon.gradienti
+    for i in range(n):
+        x = p[n + 1 + i]
+        grad[start + i] += x.valoare * dz
+        x.derivata += val[start + i] * dz
+    grad[start + n] += dz
+
+
+inregistreaza_retro('dot_tanh_bloc', _retro_dot_tanh_bloc)
+# părinții au aceeași ordine ca la 'dot_tanh': (bias, w_1..w_n, x_1..x_n)
+inregistreaza_retro_graf('dot_tanh_bloc', 'dot_tanh')
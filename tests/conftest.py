@@ -1,5 +1,8 @@
+import math
+
 import pytest
 
+from nn import NN
 from scalar import Scalar
 
 
@@ -10,3 +13,22 @@ from scalar import Scalar
 def scalar_pair(request):
     a, b = request.param
     return Scalar(a), Scalar(b)
+
+
+@pytest.fixture(params=NN.BACKENDS)
+def backend(request):
+    """Fiecare backend al lui `NN`."""
+    return request.param
+
+
+@pytest.fixture
+def retea():
+    """
+    Fabrică de rețele cu parametri deterministici: parametrul i (în ordinea
+    lui `parametri()`) primește scara · cos(1.5 · i), pe orice backend.
+    """
+    def fabrica(dims, backend="scalar", scara=1.0):
+        net = NN(list(dims), backend=backend)
+        net.scrie_parametri([scara * math.cos(1.5 * i) for i in range(net.tampon.nr_parametri)])
+        return net
+    return fabrica
@@ -0,0 +1,66 @@
+import pytest
+
+from helpers import constants
+from nn import NN
+
+TOL = constants.get("TOL")
+
+
+X = [[0.3, -0.8, 0.5], [0.1, 0.2, -0.4], [-1.0, 0.7, 0.0], [0.9, 0.9, -0.9]]
+Y1 = [0.7, -0.2, 0.1, 0.5]
+Y2 = [[0.7, -0.1], [-0.2, 0.3], [0.1, 0.0], [0.5, -0.5]]
+
+
+class TestBatch:
+    # forward_batch întoarce câte o ieșire per rând, identică cu apelul individual
+    @pytest.mark.parametrize("dims", [[3, 4, 1], [3, 4, 2]], ids=["1-out", "2-out"])
+    def test_forward_batch_matches_single(self, retea, backend, dims):
+        net = retea(dims, backend)
+        individual = []
+        for x in X:
+            y = net(x)
+            individual.append([y.valoare] if dims[-1] == 1 else [v.valoare for v in y])
+
+        iesiri = net.forward_batch(X)
+        assert len(iesiri) == len(X)
+        for y, asteptat in zip(iesiri, individual):
+            y = [y] if dims[-1] == 1 else y
+            assert [v.valoare for v in y] == pytest.approx(asteptat, rel=TOL)
+
+    # Pierderea batch = media pierderilor individuale; gradientele = media gradientelor
+    @pytest.mark.parametrize("dims, Y", [([3, 4, 1], Y1), ([3, 5, 2], Y2)], ids=["1-out", "2-out"])
+    def test_batch_loss_and_grads_are_means(self, retea, backend, dims, Y):
+        net = retea(dims, backend)
+        n = len(net.parametri())
+
+        asteptat_grad = [0.0] * n
+        asteptat_loss = 0.0
+        for x, t in zip(X, Y):
+            net.reset_deriv()
+            loss = net.pierdere_batch([x], [t])
+            loss.retroprop()
+            asteptat_loss += loss.valoare / len(X)
+            for i, p in enumerate(net.parametri()):
+                asteptat_grad[i] += p.derivata / len(X)
+
+        net.reset_deriv()
+        valoare = net.retroprop_batch(X, Y)
+
+        assert valoare == pytest.approx(asteptat_loss, rel=TOL)
+        assert [p.derivata for p in net.parametri()] == pytest.approx(asteptat_grad, rel=1e-9, abs=1e-12)
+
+    # Toate backend-urile dau aceeași pierdere și aceleași gradiente pe batch
+    def test_backends_agree(self, retea):
+        rezultate = []
+        for backend in NN.BACKENDS:
+            net = retea([3, 4, 2], backend)
+            net.reset_deriv()
+            rezultate.append((net.retroprop_batch(X, Y2), [p.derivata for p in net.parametri()]))
+        for loss, grads in rezultate[1:]:
+            assert loss == pytest.approx(rezultate[0][0], rel=TOL)
+            assert grads == pytest.approx(rezultate[0][1], rel=1e-9, abs=1e-12)
+
+    # Batch și ținte cu lungimi diferite → ValueError
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            NN([3, 2, 1]).pierdere_batch(X, Y1[:2])
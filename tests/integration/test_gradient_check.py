@@ -0,0 +1,59 @@
+import pytest
+
+from helpers import verifica_gradient
+from scalar import Scalar
+
+
+X = [[0.3, -0.8, 0.5], [0.1, 0.2, -0.4], [-1.0, 0.7, 0.0]]
+Y = [[0.7, -0.1], [-0.2, 0.3], [0.1, 0.0]]
+
+
+class TestVerificaGradient:
+    # Gradientul corect: eroare relativă mică pe fiecare strat, pe orice backend
+    @pytest.mark.parametrize("complet", [False, True], ids=["directional", "complet"])
+    def test_correct_gradient_passes(self, retea, backend, complet):
+        net = retea([3, 4, 2], backend, scara=0.5)
+        raport = verifica_gradient(net, X, Y, complet=complet)
+        assert set(raport) == {"strat 0", "strat 1"}
+        assert max(raport.values()) < 1e-6
+
+    # Un gradient greșit pe ultimul strat apare doar în raportul acelui strat
+    def test_wrong_gradient_is_reported_per_layer(self, retea, monkeypatch):
+        net = retea([3, 4, 2], scara=0.5)
+        original = net.retroprop_batch
+
+        def stricat(X, Y):
+            pierdere = original(X, Y)
+            net.tampon.gradienti[-1] += 0.5  # bias-ul ultimului neuron
+            return pierdere
+
+        monkeypatch.setattr(net, "retroprop_batch", stricat)
+        raport = verifica_gradient(net, X, Y)
+        assert raport["strat 0"] < 1e-6
+        assert raport["strat 1"] > 1e-2
+
+    # Parametrii și gradientele rețelei rămân neschimbate
+    def test_network_state_is_restored(self, retea):
+        net = retea([3, 4, 2], scara=0.5)
+        net.tampon.gradienti[0] = 1.25
+        theta, grad = net.citeste_parametri(), net.tampon.gradienti[:]
+        verifica_gradient(net, X, Y)
+        assert net.citeste_parametri() == theta
+        assert net.tampon.gradienti[:] == grad
+
+    # Ponderi înlocuite cu alte obiecte: verificarea le perturbă pe ele, nu tamponul
+    def test_replaced_weights(self, retea):
+        net = retea([3, 4, 2], scara=0.5)
+        neuron = net.layers[1].neuroni[0]
+        neuron.ponderi = [Scalar(0.9), Scalar(-0.4), Scalar(0.2), Scalar(0.7)]
+        neuron.bias.derivata = 1.25
+        theta, grad = net.citeste_parametri(), net.citeste_gradienti()
+        raport = verifica_gradient(net, X, Y, complet=True)
+        assert max(raport.values()) < 1e-6
+        assert net.citeste_parametri() == theta
+        assert net.citeste_gradienti() == grad
+
+    # În paralel se obține exact același raport
+    def test_parallel_matches_serial(self, retea):
+        net = retea([3, 4, 2], scara=0.5)
+        assert verifica_gradient(net, X, Y, procese=2) == verifica_gradient(net, X, Y)
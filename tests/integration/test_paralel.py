@@ -0,0 +1,59 @@
+import math
+
+import pytest
+
+from antrenare import Trainer
+from nn import NN
+from optim import SGD
+from paralel import GradientParalel
+from scalar import Scalar
+
+X = [[0.1 * i, -0.05 * i, 0.3 - 0.02 * i] for i in range(11)]
+Y = [math.sin(0.4 * i) * 0.5 for i in range(11)]
+
+
+class TestGradientParalel:
+    # Gradientul paralel = gradientul serial pe tot batch-ul (inclusiv fragmente inegale)
+    @pytest.mark.parametrize("backend", ["scalar", "banda"])
+    def test_matches_serial_gradient(self, backend):
+        net = NN([3, 4, 1], backend=backend)
+        net.reset_deriv()
+        pierdere_seriala = net.retroprop_batch(X, Y)
+        grad_serial = [p.derivata for p in net.parametri()]
+
+        net.reset_deriv()
+        with GradientParalel(net, procese=3) as paralel:
+            pierdere = paralel.retroprop_batch(X, Y)
+
+        assert pierdere == pytest.approx(pierdere_seriala, rel=1e-9)
+        assert [p.derivata for p in net.parametri()] == pytest.approx(grad_serial, rel=1e-9, abs=1e-12)
+
+    # Ponderi înlocuite după construcție: valorile și gradienții trec prin obiecte
+    def test_replaced_weights(self):
+        net = NN([3, 4, 1])
+        net.layers[0].neuroni[1].ponderi[2] = Scalar(0.7)
+        net.reset_deriv()
+        pierdere_seriala = net.retroprop_batch(X, Y)
+        grad_serial = [p.derivata for p in net.parametri()]
+
+        net.reset_deriv()
+        with GradientParalel(net, procese=2) as paralel:
+            pierdere = paralel.retroprop_batch(X, Y)
+
+        assert pierdere == pytest.approx(pierdere_seriala, rel=1e-9)
+        assert [p.derivata for p in net.parametri()] == pytest.approx(grad_serial, rel=1e-9, abs=1e-12)
+
+    # Parametrii actualizați în părinte ajung la lucrători; rezultat determinist
+    def test_training_with_trainer_is_deterministic(self):
+        rezultate = []
+        for _ in range(2):
+            net = NN([3, 4, 1])
+            net.scrie_parametri([0.1 * ((i * 7) % 5 - 2) for i in range(len(net.parametri()))])
+            with GradientParalel(net, procese=2) as paralel:
+                trainer = Trainer(net, SGD(net.parametri(), lr=0.1), gradient=paralel)
+                istoric = trainer.antreneaza([(X, Y)], epoci=5)
+            rezultate.append((istoric, list(net.citeste_parametri())))
+
+        istoric, valori = rezultate[0]
+        assert istoric[-1] < istoric[0]
+        assert rezultate[1] == (istoric, valori)
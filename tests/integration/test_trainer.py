@@ -0,0 +1,47 @@
+import math
+import random
+
+import pytest
+
+from antrenare import Trainer
+from date import DataLoader, scrie_binar, sursa_binara
+from nn import NN
+from optim import Adam
+
+
+def _xor_like(n, seed=0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        a, b = rng.uniform(-1, 1), rng.uniform(-1, 1)
+        yield [a, b], 0.5 * math.tanh(2 * a * b)
+
+
+class TestTrainer:
+    # Antrenare pe un fișier citit în flux: pierderea scade de-a lungul epocilor
+    @pytest.mark.parametrize("backend", ["scalar", "banda"])
+    def test_streaming_training_reduces_loss(self, tmp_path, backend):
+        random.seed(1)
+        cale = tmp_path / "train.bin"
+        scrie_binar(cale, _xor_like(200))
+
+        net = NN([2, 6, 1], backend=backend)
+        loader = DataLoader(sursa_binara(cale, 2, dimensiune_bucata=32), batch=16, amestecare=64, seed=0)
+        trainer = Trainer(net, Adam(net.parametri(), lr=0.02))
+        istoric = trainer.antreneaza(loader, epoci=8)
+
+        assert len(istoric) == 8
+        assert istoric[-1] < istoric[0]
+
+    # Callback-ul de final de epocă primește indicele și pierderea
+    def test_epoch_callback(self):
+        net = NN([2, 3, 1])
+        date = [([[0.1, 0.2], [0.3, -0.4]], [0.1, -0.1])]
+        vazute = []
+        Trainer(net).antreneaza(date, epoci=3, la_final_de_epoca=lambda e, p: vazute.append((e, p)))
+        assert [e for e, _ in vazute] == [0, 1, 2]
+        assert all(p >= 0.0 for _, p in vazute)
+
+    # O sursă goală → ValueError
+    def test_empty_source_raises(self):
+        with pytest.raises(ValueError):
+            Trainer(NN([2, 1])).epoca([])
@@ -0,0 +1,47 @@
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+CALE = Path(__file__).resolve().parents[2] / 'benchmarks' / 'suita.py'
+
+
+@pytest.fixture(scope='module')
+def suita():
+    spec = importlib.util.spec_from_file_location('suita', CALE)
+    modul = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modul)
+    return modul
+
+
+def _rulare(timp, memorie):
+    return {'rezultate': {'b': {'timp_min_s': timp, 'timp_median_s': timp, 'memorie_varf_o': memorie}}}
+
+
+class TestSuitaBenchmark:
+    # Rulare scurtă: JSON-ul are câte o intrare pentru fiecare benchmark selectat
+    def test_run_writes_json(self, suita, tmp_path):
+        iesire = tmp_path / 'rez.json'
+        assert suita.main(['--filtru', '/2-4-1', '--repetari', '1', '--iesire', str(iesire)]) == 0
+        rez = json.loads(iesire.read_text())
+        assert set(rez['rezultate']) == {'nn/forward/2-4-1', 'nn/backward/2-4-1', 'nn/pas/2-4-1'}
+        for r in rez['rezultate'].values():
+            assert r['timp_min_s'] > 0 and r['memorie_varf_o'] > 0
+
+    # Regresie doar peste prag, separat pentru timp și memorie
+    def test_compare_flags_regressions_over_threshold(self, suita):
+        ref = _rulare(1.0, 1000)
+        assert not any(r[-1] for r in suita.compara(_rulare(1.15, 1000), ref, 0.2))
+        regresii = [r[1] for r in suita.compara(_rulare(1.3, 1300), ref, 0.2) if r[-1]]
+        assert regresii == ['timp_min_s', 'memorie_varf_o']
+
+    # Comparația cu o referință mult mai rapidă eșuează cu cod 1
+    def test_main_exits_nonzero_on_regression(self, suita, tmp_path):
+        argumente = ['--filtru', 'nn/forward/2-4-1', '--repetari', '1']
+        ref = tmp_path / 'ref.json'
+        assert suita.main([*argumente, '--iesire', str(ref)]) == 0
+        rez = json.loads(ref.read_text())
+        rez['rezultate']['nn/forward/2-4-1']['timp_min_s'] = 1e-9
+        ref.write_text(json.dumps(rez))
+        assert suita.main([*argumente, '--referinta', str(ref)]) == 1
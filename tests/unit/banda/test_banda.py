@@ -0,0 +1,179 @@
+import math
+import statistics
+
+import pytest
+
+from banda import Banda, NodBanda
+from helpers import constants
+from nn import NN
+from scalar import Scalar
+
+TOL = constants.get("TOL")
+
+
+def _ambele(expr, *valori):
+    """Evaluează aceeași expresie pe Scalar și pe bandă; întoarce (scalari, noduri bandă)."""
+    xs = [Scalar(v) for v in valori]
+    expr(*xs).retroprop()
+
+    banda = Banda()
+    bs = [banda.parametru(v) for v in valori]
+    out = expr(*bs)
+    out.retroprop()
+    return xs, bs, out
+
+
+class TestBanda:
+    # Valori și gradiente identice cu motorul Scalar pe toate operațiile
+    @pytest.mark.parametrize(
+        "expr, valori",
+        [
+            (lambda a, b: a + b * 2.0, (1.5, -2.0)),
+            (lambda a, b: (a * b).tanh(), (0.5, -1.2)),
+            (lambda a, b: ((a * 3) + b) ** 2, (1.0, 2.0)),
+            (lambda a, b: (a - b).relu() + a / b, (3.0, 0.5)),
+            (lambda a, b: a * a + 1.0 / b, (-2.0, 4.0)),
+        ],
+        ids=["add_mul", "tanh", "pow", "relu_sub_div", "repeat_rtruediv"],
+    )
+    def test_matches_scalar_engine(self, expr, valori):
+        xs, bs, _ = _ambele(expr, *valori)
+        for x, b in zip(xs, bs):
+            assert math.isclose(b.derivata, x.derivata, rel_tol=TOL, abs_tol=TOL)
+        assert math.isclose(expr(*bs).valoare, expr(*xs).valoare, rel_tol=TOL, abs_tol=TOL)
+
+    # Înregistrările sunt contigue: o operație = o intrare pe bandă
+    def test_records_are_flat(self):
+        banda = Banda()
+        a, b = banda.parametru(2.0), banda.parametru(3.0)
+        c = (a * b).tanh()
+        assert isinstance(c, NodBanda)
+        assert len(banda) == 4 and c.index == 3
+
+    # Parametrii se creează doar înaintea operațiilor
+    def test_parameter_after_ops_raises(self):
+        banda = Banda()
+        a = banda.parametru(1.0)
+        _ = a + 1.0
+        with pytest.raises(RuntimeError):
+            banda.parametru(2.0)
+
+    # goleste() păstrează parametrii și invalidează nodurile temporare
+    def test_clear_keeps_parameters(self):
+        banda = Banda()
+        w = banda.parametru(0.7)
+        y = w * 2.0
+        banda.goleste()
+        assert len(banda) == 1 and w.valoare == 0.7
+        with pytest.raises(RuntimeError):
+            _ = y.valoare
+
+    # Un nod de pe o bandă golită nu mai poate fi operand (nici în stânga, nici în dreapta)
+    @pytest.mark.parametrize(
+        "op",
+        [lambda y, w: y + w, lambda y, w: w * y, lambda y, w: y ** 2, lambda y, w: y.tanh(), lambda y, w: y.relu()],
+        ids=["add", "rmul", "pow", "tanh", "relu"],
+    )
+    def test_stale_operand_raises(self, op):
+        banda = Banda()
+        w = banda.parametru(0.7)
+        y = w * 2.0
+        banda.goleste()
+        with pytest.raises(RuntimeError):
+            op(y, w)
+
+    # Operanzi din benzi diferite → ValueError; NaN/inf → ValueError
+    def test_invalid_operands(self):
+        a, b = Banda().parametru(1.0), Banda().parametru(2.0)
+        with pytest.raises(ValueError):
+            _ = a + b
+        with pytest.raises(ValueError):
+            _ = Banda().parametru(1e308) * 10.0
+
+
+class TestNNBanda:
+    # Backend necunoscut → ValueError
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            NN([2, 1], backend="gpu")
+
+    # Aceleași ponderi → aceeași ieșire și aceleași gradiente ca backend-ul Scalar
+    def test_same_results_as_scalar_backend(self):
+        net_s = NN([3, 4, 1])
+        net_b = NN([3, 4, 1], backend="banda")
+        for ps, pb in zip(net_s.parametri(), net_b.parametri()):
+            pb.valoare = ps.valoare + 0.1
+            ps.valoare = pb.valoare
+
+        x, target = [0.3, -0.8, 0.5], 0.7
+        ((net_s(x) - target) ** 2).retroprop()
+        ((net_b(x) - target) ** 2).retroprop()
+
+        for ps, pb in zip(net_s.parametri(), net_b.parametri()):
+            assert math.isclose(pb.derivata, ps.derivata, rel_tol=TOL, abs_tol=TOL)
+
+    # Pierdere pe mai multe exemple construite prin apeluri separate: ca pe Scalar
+    def test_multi_sample_loss_matches_scalar(self):
+        net_s = NN([3, 4, 1])
+        net_b = NN([3, 4, 1], backend="banda")
+        net_b.scrie_parametri(net_s.citeste_parametri())
+        a, b, t = [0.3, -0.8, 0.5], [-0.1, 0.4, 0.9], 0.7
+
+        pierderi = [(net(a) - t) ** 2 + (net(b) - t) ** 2 for net in (net_s, net_b)]
+        for p in pierderi:
+            p.retroprop()
+        assert math.isclose(pierderi[1].valoare, pierderi[0].valoare, rel_tol=TOL)
+        for gs, gb in zip(net_s.tampon.gradienti, net_b.tampon.gradienti[:net_b.banda.nr_parametri]):
+            assert math.isclose(gb, gs, rel_tol=TOL, abs_tol=TOL)
+
+    # Nodurile rămân valide până la primul forward de după retropropagare;
+    # retroprop_batch golește banda
+    def test_nodes_survive_until_next_step(self):
+        net = NN([3, 4, 1], backend="banda")
+        x = [0.3, -0.8, 0.5]
+        y = net(x)
+        pierdere = (y - 0.7) ** 2
+        pierdere.retroprop()
+        assert pierdere.valoare == pytest.approx((y.valoare - 0.7) ** 2)
+
+        net(x)
+        with pytest.raises(RuntimeError):
+            _ = pierdere.valoare
+
+        net.retroprop_batch([x], [0.7])
+        assert len(net.banda) == net.banda.nr_parametri
+
+    # Un neuron e o singură înregistrare pe bandă; gradientele intrărilor ca pe Scalar
+    def test_neuron_is_one_record(self):
+        net_s = NN([3, 2])
+        net_b = NN([3, 2], backend="banda")
+        net_b.scrie_parametri(net_s.citeste_parametri())
+        xs = [Scalar(0.3), Scalar(-0.8), Scalar(0.5)]
+        xb = [net_b.banda.constanta(x.valoare) for x in xs]
+        ys, yb = net_s.layers[0](xs), net_b.layers[0](xb)
+        assert len(net_b.banda) == net_b.banda.nr_parametri + 3 + 2
+        assert [y.valoare for y in yb] == [y.valoare for y in ys]
+
+        (ys[0] * ys[1]).retroprop()
+        (yb[0] * yb[1]).retroprop()
+        for a, b in zip(xs, xb):
+            assert math.isclose(b.derivata, a.derivata, rel_tol=TOL, abs_tol=TOL)
+
+    # Bucla de antrenare existentă funcționează neschimbată pe bandă
+    def test_training_loop_unchanged(self):
+        net = NN([3, 5, 1], backend="banda")
+        x, target, lr = [0.1, -0.7, 0.9], -0.4, 0.05
+        losses, lungimi = [], []
+        for _ in range(10):
+            loss = (net(x) - target) ** 2
+            losses.append(loss.valoare)
+            net.reset_deriv()
+            loss.retroprop()
+            for p in net.parametri():
+                p.valoare -= lr * p.derivata
+            lungimi.append(len(net.banda))
+
+        assert all(p.derivata == p.banda.gradienti[p.index] for p in net.parametri())
+        assert statistics.mean(losses[-3:]) < statistics.mean(losses[:3])
+        # banda se golește la fiecare pas: nu crește
+        assert len(set(lungimi)) == 1 and lungimi[0] > net.banda.nr_parametri
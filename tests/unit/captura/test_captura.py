@@ -0,0 +1,86 @@
+import pytest
+
+from antrenare import Trainer
+from nn import NN
+from optim import SGD
+from scalar import Scalar
+
+X = [[0.3, -0.8, 0.5], [0.1, 0.2, -0.4], [-1.0, 0.7, 0.0], [0.9, 0.9, -0.9]]
+Y1 = [0.7, -0.2, 0.1, 0.5]
+Y2 = [[0.7, -0.1], [-0.2, 0.3], [0.1, 0.0], [0.5, -0.5]]
+
+
+def _gradient(net, f, X, Y):
+    net.reset_deriv()
+    pierdere = f(X, Y)
+    return pierdere, net.tampon.gradienti[:]
+
+
+class TestPlanStatic:
+    # Reexecutarea planului dă exact pierderea și gradientul grafului Scalar
+    @pytest.mark.parametrize("dims, Y", [([3, 4, 1], Y1), ([3, 4, 2], Y2)])
+    def test_replay_matches_graph(self, retea, dims, Y):
+        net = retea(dims)
+        plan = net.captureaza(batch=len(X))
+        assert _gradient(net, plan.retroprop_batch, X, Y) == _gradient(net, net.retroprop_batch, X, Y)
+
+    # Planul citește parametrii la fiecare apel și poate fi refolosit pe alte date
+    def test_replay_sees_updated_parameters(self, retea):
+        net = retea([3, 4, 1])
+        plan = net.captureaza(batch=2)
+        plan.retroprop_batch(X[:2], Y1[:2])
+        for p in net.parametri():
+            p.valoare *= 0.5
+        assert _gradient(net, plan.retroprop_batch, X[2:], Y1[2:]) == \
+            _gradient(net, net.retroprop_batch, X[2:], Y1[2:])
+
+    # Ieșirile rețelei sunt disponibile după forward
+    def test_forward_outputs(self, retea):
+        net = retea([3, 4, 2])
+        plan = net.captureaza(batch=1)
+        plan.forward(X[:1], Y2[:1])
+        assert [plan.valori[i] for i in plan.iesiri] == net.predict(X[0])
+
+    # Un batch de altă mărime folosește graful obișnuit
+    def test_other_batch_size_falls_back(self, retea):
+        net = retea([3, 4, 1])
+        plan = net.captureaza(batch=4)
+        assert _gradient(net, plan.retroprop_batch, X[:3], Y1[:3]) == \
+            _gradient(net, net.retroprop_batch, X[:3], Y1[:3])
+
+    # Planul poate înlocui calculul gradientului în Trainer
+    def test_trainer_with_plan(self, retea):
+        net_a, net_b = retea([3, 4, 1]), retea([3, 4, 1])
+        date = [(X, Y1)]
+        Trainer(net_a, SGD(net_a.parametri(), lr=0.1)).antreneaza(date, epoci=3)
+        Trainer(net_b, SGD(net_b.parametri(), lr=0.1), gradient=net_b.captureaza(4)).antreneaza(date, epoci=3)
+        assert net_a.citeste_parametri() == net_b.citeste_parametri()
+
+    @pytest.mark.parametrize("backend", ["banda", "numpy"])
+    def test_only_scalar_backend(self, backend):
+        with pytest.raises(ValueError):
+            NN([2, 2, 1], backend=backend).captureaza()
+
+    # Ponderi înlocuite înainte de captură: planul lucrează prin obiecte, ca rețeaua
+    @pytest.mark.parametrize("compilat", [False, True], ids=["plan", "compilat"])
+    def test_replaced_weights_before_capture(self, retea, compilat):
+        net_a, net_b = retea([3, 4, 1]), retea([3, 4, 1])
+        for net in (net_a, net_b):
+            net.layers[0].neuroni[1].ponderi = [Scalar(0.9), Scalar(-0.4), Scalar(0.2)]
+        plan = net_b.compileaza(batch=4) if compilat else net_b.captureaza(batch=4)
+        assert _gradient(net_b, plan.retroprop_batch, X, Y1) == _gradient(net_a, net_a.retroprop_batch, X, Y1)
+        assert [p.derivata for p in net_b.parametri()] == [p.derivata for p in net_a.parametri()]
+
+    # Ponderi înlocuite după captură → RuntimeError, nu o pierdere greșită
+    @pytest.mark.parametrize("compilat", [False, True], ids=["plan", "compilat"])
+    def test_replaced_weights_after_capture_raises(self, retea, compilat):
+        net = retea([3, 4, 1])
+        plan = net.compileaza(batch=4) if compilat else net.captureaza(batch=4)
+        net.layers[0].neuroni[1].bias = Scalar(0.3)
+        with pytest.raises(RuntimeError):
+            plan.retroprop_batch(X, Y1)
+
+    def test_wrong_input_size_raises(self, retea):
+        plan = retea([3, 4, 1]).captureaza(batch=1)
+        with pytest.raises(ValueError):
+            plan.forward([[0.1, 0.2]], [0.0])
@@ -0,0 +1,121 @@
+import pytest
+
+import compilator
+from compilator import FunctieCompilata, _CACHE, genereaza_sursa
+from scalar import Scalar
+
+X = [[0.3, -0.8, 0.5], [0.1, 0.2, -0.4], [-1.0, 0.7, 0.0], [0.9, 0.9, -0.9]]
+Y2 = [[0.7, -0.1], [-0.2, 0.3], [0.1, 0.0], [0.5, -0.5]]
+
+
+def _expresie(w, x):
+    """Folosește toate operațiile capturabile."""
+    a = Scalar.dot(w, x).tanh() + Scalar.dot_tanh(w, x, w[0]) * x[1]
+    b = (w[1] * x[0] - 0.5).relu() + Scalar.sum([w[2], x[2], a]) ** 2
+    return a / (b + 3.0)
+
+
+class TestCompilator:
+    # Funcția generată dă exact valoarea și gradientele grafului Scalar
+    def test_all_operations_match_graph(self):
+        w = [Scalar(0.4), Scalar(-0.7), Scalar(1.1)]
+        x = [Scalar(0.2), Scalar(0.9), Scalar(-0.3)]
+        f = FunctieCompilata(_expresie(w, x), x, w)
+
+        x_noi = [0.5, -0.6, 0.8]
+        y = _expresie(w, [Scalar(v) for v in x_noi])
+        y.retroprop()
+        asteptat = [p.derivata for p in w]
+        for p in w:
+            p.derivata = 0.0
+
+        assert f(x_noi) == y.valoare
+        assert f.retroprop(x_noi) == y.valoare
+        assert [p.derivata for p in w] == asteptat
+
+    # Exemplul din cerință: (net(x) - tinta) ** 2, cu intrările și ținta ca substituenți
+    def test_network_loss(self, retea):
+        net = retea([3, 4, 1])
+        x, t = [Scalar(0.0) for _ in range(3)], Scalar(0.0)
+        y = x
+        for layer in net.layers:
+            y = layer(y)
+        f = FunctieCompilata((y[0] - t) ** 2, [*x, t], net.parametri())
+
+        f.retroprop([*X[0], 0.7])
+        compilat = net.tampon.gradienti[:]
+        net.reset_deriv()
+        net.retroprop_batch(X[:1], [0.7])
+        assert compilat == net.tampon.gradienti[:]
+
+    # Planul compilat al rețelei = graful obișnuit; a doua compilare vine din cache
+    def test_compiled_plan_matches_graph_and_is_cached(self, retea):
+        net = retea([3, 4, 2])
+        plan = net.compileaza(batch=4)
+        inainte = len(_CACHE)
+        assert net.compileaza(batch=4)._inainte_inapoi_compilat is plan._inainte_inapoi_compilat
+        assert len(_CACHE) == inainte
+
+        pierdere = plan.retroprop_batch(X, Y2)
+        compilat = net.tampon.gradienti[:]
+        net.reset_deriv()
+        assert pierdere == net.retroprop_batch(X, Y2)
+        assert compilat == net.tampon.gradienti[:]
+        assert plan.forward(X, Y2) == pierdere
+        assert [plan.valori[i] for i in plan.iesiri[:2]] == net.predict(X[0])
+
+    # Cache-ul e limitat: la depășire pleacă semnătura folosită cel mai demult
+    def test_cache_is_bounded_lru(self, monkeypatch):
+        monkeypatch.setattr(compilator, "_CACHE_MAXIM", 3)
+        _CACHE.clear()
+        x = Scalar(0.0)
+        functii = [FunctieCompilata(x * c, [x], []) for c in (1.0, 2.0, 3.0)]
+        FunctieCompilata(x * 1.0, [x], [])  # 1.0 devine cea mai recentă
+        functii.append(FunctieCompilata(x * 4.0, [x], []))
+        assert len(_CACHE) == 3
+        assert functii[1].graf.semnatura() not in _CACHE
+        assert functii[0].graf.semnatura() in _CACHE
+        assert [f([2.0]) for f in functii] == [2.0, 4.0, 6.0, 8.0]
+
+    # Alt batch trece prin graful obișnuit
+    def test_compiled_plan_falls_back_on_other_batch(self, retea):
+        net_a, net_b = retea([3, 4, 2]), retea([3, 4, 2])
+        assert net_a.compileaza(batch=4).forward(X[:2], Y2[:2]) == net_b.pierdere_batch(X[:2], Y2[:2]).valoare
+        assert net_a.compileaza(batch=4).retroprop_batch(X[:2], Y2[:2]) == net_b.retroprop_batch(X[:2], Y2[:2])
+        assert net_a.tampon.gradienti == net_b.tampon.gradienti
+
+    # Expresiile lungi sunt împărțite, ca să nu depășească adâncimea compilatorului Python
+    def test_long_sum_is_split(self):
+        x = [Scalar(0.0) for _ in range(1000)]
+        f = FunctieCompilata(Scalar.sum(x), x, [])
+        assert max(linie.count('+') for linie in genereaza_sursa(f.graf).splitlines()) <= 65
+        assert f([1.0] * 1000) == 1000.0
+
+    # Constantele negative se scriu între paranteze: (−3)² = 9, nu −9
+    def test_negative_constant_base(self):
+        p, x = Scalar(0.5), Scalar(0.7)
+        f = FunctieCompilata(p * (Scalar(-3.0) ** 2) + x, [x], [p])
+        assert f([0.7]) == 0.5 * 9.0 + 0.7
+        f.retroprop([0.7])
+        assert p.derivata == 9.0
+
+    # Cu `functie`, alt număr de intrări trece prin graful Scalar
+    def test_other_input_count_falls_back(self):
+        w = Scalar(0.5)
+
+        def functie(x):
+            return (Scalar.sum(x) * w).tanh()
+
+        x = [Scalar(0.0), Scalar(0.0)]
+        f = FunctieCompilata(functie(x), x, [w], functie=functie)
+        assert f([0.1, 0.2, 0.3]) == functie([Scalar(0.1), Scalar(0.2), Scalar(0.3)]).valoare
+        y = functie([Scalar(0.1), Scalar(0.2), Scalar(0.3)])
+        y.retroprop()
+        asteptat, w.derivata = w.derivata, 0.0
+        assert f.retroprop([0.1, 0.2, 0.3]) == y.valoare
+        assert w.derivata == asteptat
+
+    def test_wrong_input_count_raises(self):
+        x = [Scalar(0.0), Scalar(0.0)]
+        with pytest.raises(ValueError):
+            FunctieCompilata(x[0] * x[1], x, [])([1.0])
@@ -0,0 +1,93 @@
+import math
+
+import pytest
+
+from captura import Graf
+from compilator import FunctieCompilata
+from nn import NN
+from optimizare_graf import optimizeaza_graf
+from scalar import Scalar
+
+TOL = 1e-12
+
+
+def _ruleaza(graf, intrari, gradient_initial=0.0):
+    P = graf.nr_parametri
+    graf.valori[P:P + len(intrari)] = type(graf.valori)('d', intrari)
+    graf._inainte()
+    graf.gradienti[:P] = type(graf.gradienti)('d', [gradient_initial] * P)
+    graf._inapoi()
+    return graf.valori[graf.pierdere], list(graf.gradienti[:P])
+
+
+def _expresie(w, x):
+    """Neuron scris cu operații elementare, plus o subexpresie constantă și una repetată."""
+    s = w[2]
+    for wi, xi in zip(w, x):
+        s = s + wi * xi
+    scala = Scalar(2.0) * Scalar(0.25) + 1.0
+    return ((s.tanh() - x[1]) ** 2) / (w[0] * x[0] + x[0] * w[0] + scala)
+
+
+class TestOptimizareGraf:
+    # Fiecare trecere face ceva pe expresia de test; valorile și gradientele rămân aceleași
+    def test_passes_preserve_results(self):
+        w = [Scalar(0.4), Scalar(-0.7), Scalar(1.1)]
+        x = [Scalar(0.2), Scalar(0.9), Scalar(-0.3)]
+        simplu = Graf(_expresie(w, x), x, w)
+        optimizat = Graf(_expresie(w, x), x, w)
+        raport = optimizeaza_graf(optimizat)
+
+        assert raport['pliate'] == 2  # 2.0 · 0.25, apoi + 1.0
+        assert raport['comune'] >= 1  # w0·x0 = x0·w0
+        assert raport['contopite'] == 3  # neg(x1), sub și div
+        assert raport['eliminate'] == 2  # neg(x1) și (...)**-1 rămase fără utilizări
+        assert raport['dupa'] < raport['inainte']
+        assert len(optimizat) < len(simplu)
+
+        for intrari in ([0.5, -0.6, 0.8], [-1.0, 0.3, 0.0]):
+            y_s, g_s = _ruleaza(simplu, intrari)
+            y_o, g_o = _ruleaza(optimizat, intrari)
+            assert y_o == pytest.approx(y_s, abs=TOL)
+            assert g_o == pytest.approx(g_s, abs=TOL)
+
+    # Nodurile care depind doar de intrări nu mai intră în retropropagare
+    def test_nodes_without_parameter_gradient(self):
+        w, x = Scalar(0.5), Scalar(0.3)
+        graf = Graf(w * (x * x).tanh(), [x], [w])
+        raport = optimizeaza_graf(graf)
+        assert raport['fara_gradient'] == 2
+        assert len(graf._pasi_inapoi) == 1
+        assert _ruleaza(graf, [0.7]) == (0.5 * math.tanh(0.49), [math.tanh(0.49)])
+
+    # Pe graful rețelei (fără '/') optimizarea nu schimbă niciun bit
+    def test_network_plan_unchanged(self):
+        X = [[0.3, -0.8, 0.5], [0.1, 0.2, -0.4]]
+        Y = [[0.7, -0.1], [-0.2, 0.3]]
+        net = NN([3, 4, 2])
+        plan = net.captureaza(batch=2, optimizat=True)
+        assert plan.raport['contopite'] == 8  # −t, apoi y − t, pe fiecare ieșire
+        assert plan.raport['eliminate'] == 4
+        assert plan.raport['dupa'] < plan.raport['inainte']
+
+        pierdere = plan.retroprop_batch(X, Y)
+        optimizat = net.tampon.gradienti[:]
+        net.reset_deriv()
+        assert pierdere == net.retroprop_batch(X, Y)
+        assert optimizat == net.tampon.gradienti[:]
+
+    # Codul generat știe operațiile noi (sub, neg, div)
+    def test_compiled_optimized_graph(self):
+        w = [Scalar(0.4), Scalar(-0.7), Scalar(1.1)]
+        x = [Scalar(0.2), Scalar(0.9), Scalar(-0.3)]
+        f = FunctieCompilata(_expresie(w, x) - (-w[1]), x, w, optimizat=True)
+        assert f.raport['contopite'] >= 3
+
+        intrari = [0.5, -0.6, 0.8]
+        y = _expresie(w, [Scalar(v) for v in intrari]) - (-w[1])
+        y.retroprop()
+        asteptat = [p.derivata for p in w]
+        for p in w:
+            p.derivata = 0.0
+        assert f.retroprop(intrari) == pytest.approx(y.valoare, abs=TOL)
+        assert [p.derivata for p in w] == pytest.approx(asteptat, abs=TOL)
@@ -0,0 +1,83 @@
+import os
+import stat
+
+import pytest
+
+import checkpoint
+from checkpoint import mapeaza
+from nn import NN
+
+
+class TestCheckpoint:
+    # Salvare + încărcare: aceiași parametri, aceleași predicții, pe orice backend
+    def test_roundtrip_is_exact(self, retea, tmp_path, backend):
+        net = retea([3, 5, 2])
+        net.save(tmp_path / "m.nn")
+        incarcat = NN.load(tmp_path / "m.nn", backend=backend)
+        assert incarcat.dimensiuni == net.dimensiuni
+        assert incarcat.backend == backend
+        assert incarcat.citeste_parametri() == net.citeste_parametri()
+        assert incarcat.predict([0.1, -0.2, 0.3]) == pytest.approx(net.predict([0.1, -0.2, 0.3]), rel=1e-12)
+
+    # float32: fișier de două ori mai mic, parametri aproape egali
+    def test_float32(self, retea, tmp_path):
+        net = retea([3, 5, 2])
+        net.save(tmp_path / "d.nn")
+        net.save(tmp_path / "f.nn", tip="f")
+        n = net.tampon.nr_parametri
+        assert os.path.getsize(tmp_path / "d.nn") - os.path.getsize(tmp_path / "f.nn") == 4 * n
+        incarcat = NN.load(tmp_path / "f.nn")
+        assert incarcat.citeste_parametri().tolist() == pytest.approx(net.citeste_parametri().tolist(), rel=1e-6)
+
+    # Maparea directă: vedere doar-citire asupra parametrilor, fără copiere
+    def test_map_is_read_only_view(self, retea, tmp_path):
+        net = retea([3, 5, 2])
+        net.save(tmp_path / "m.nn")
+        dimensiuni, parametri = mapeaza(tmp_path / "m.nn")
+        assert dimensiuni == [3, 5, 2]
+        assert parametri.tolist() == net.citeste_parametri().tolist()
+        with pytest.raises(TypeError):
+            parametri[0] = 1.0
+
+    # O scriere întreruptă lasă checkpoint-ul anterior intact și niciun fișier temporar
+    def test_interrupted_save_keeps_previous(self, retea, tmp_path, monkeypatch):
+        vechi = retea([3, 5, 2])
+        vechi.save(tmp_path / "m.nn")
+        continut = (tmp_path / "m.nn").read_bytes()
+
+        def esec(fd):
+            raise OSError("disc plin")
+
+        monkeypatch.setattr(checkpoint.os, "fsync", esec)
+        with pytest.raises(OSError):
+            retea([3, 8, 2]).save(tmp_path / "m.nn")
+        assert (tmp_path / "m.nn").read_bytes() == continut
+        assert os.listdir(tmp_path) == ["m.nn"]
+
+    # Fișierul nou primește permisiunile unui fișier scris direct; cel existent și le păstrează
+    @pytest.mark.skipif(not hasattr(os, "fchmod"), reason="fără fchmod")
+    def test_file_mode(self, retea, tmp_path):
+        def mod(nume):
+            return stat.S_IMODE(os.stat(tmp_path / nume).st_mode)
+
+        (tmp_path / "simplu").write_bytes(b"")
+        retea([3, 5, 2]).save(tmp_path / "m.nn")
+        assert mod("m.nn") == mod("simplu")
+
+        os.chmod(tmp_path / "m.nn", 0o640)
+        retea([3, 5, 2]).save(tmp_path / "m.nn")
+        assert mod("m.nn") == 0o640
+
+    @pytest.mark.parametrize("stricare", ["semnatura", "trunchiat", "tip"])
+    def test_corrupt_file_rejected(self, retea, tmp_path, stricare):
+        retea([3, 5, 2]).save(tmp_path / "m.nn")
+        date = bytearray((tmp_path / "m.nn").read_bytes())
+        if stricare == "semnatura":
+            date[:4] = b"XXXX"
+        elif stricare == "trunchiat":
+            del date[-8:]
+        else:
+            date[5:6] = b"q"
+        (tmp_path / "m.nn").write_bytes(bytes(date))
+        with pytest.raises(ValueError):
+            NN.load(tmp_path / "m.nn")
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from cuantizare import NNCuantizat, raport_cuantizare
+from nn import NN
+
+
+random.seed(1)
+X = [[random.uniform(-1.0, 1.0) for _ in range(4)] for _ in range(10)]
+
+
+class TestCuantizare:
+    # int8: fiecare pondere e refăcută cu eroare de cel mult jumătate din scara neuronului
+    def test_int8_weights_within_half_scale(self, retea):
+        net = retea([4, 6, 2])
+        q = net.cuantizeaza("int8")
+        parametri = net.citeste_parametri()
+        start = 0
+        for k, (n, m) in enumerate([(4, 6), (6, 2)]):
+            for j in range(m):
+                scara = q.scari[k][j]
+                for i in range(n):
+                    w = parametri[start + j * (n + 1) + i]
+                    assert abs(q.ponderi[k][j * n + i] * scara - w) <= scara / 2 + 1e-7
+            start += (n + 1) * m
+
+    @pytest.mark.parametrize("tip, toleranta", [("float32", 1e-6), ("int8", 0.05)])
+    def test_predict_close_to_network(self, retea, tip, toleranta):
+        net = retea([4, 6, 2])
+        q = net.cuantizeaza(tip)
+        for x in X:
+            assert q.predict(x) == pytest.approx(net.predict(x), abs=toleranta)
+        assert q.predict_batch(X) == [q.predict(x) for x in X]
+
+    # int8: 1 octet pe pondere + bias și scară float32 pe neuron; float32: 4 octeți pe parametru
+    def test_memory_footprint(self, retea):
+        net = retea([4, 6, 2])
+        assert net.cuantizeaza("int8").octeti() == (4 * 6 + 6 * 2) + 8 * (6 + 2)
+        assert net.cuantizeaza("float32").octeti() == 4 * net.tampon.nr_parametri
+
+    # Un neuron cu toate ponderile zero nu împarte la zero
+    def test_zero_weights(self):
+        net = NN([2, 1])
+        net.scrie_parametri([0.0, 0.0, 0.3])
+        assert net.cuantizeaza().predict([1.0, -1.0]) == pytest.approx(net.predict([1.0, -1.0]), abs=1e-7)
+
+    def test_report(self, retea):
+        net = retea([4, 6, 2])
+        r = raport_cuantizare(net, net.cuantizeaza("int8"), X)
+        assert 0 < r["eroare_medie"] <= r["eroare_max"] < 0.05
+        assert r["octeti"] == 8 * net.tampon.nr_parametri
+        assert r["compresie"] == r["octeti"] / r["octeti_cuantizat"] > 1
+
+    def test_invalid_arguments(self, retea):
+        net = retea([4, 6, 2])
+        with pytest.raises(ValueError):
+            NNCuantizat(net, "int4")
+        with pytest.raises(ValueError):
+            net.cuantizeaza().predict([0.1, 0.2])
+        with pytest.raises(ValueError):
+            raport_cuantizare(net, net.cuantizeaza(), [])
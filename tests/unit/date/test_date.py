@@ -0,0 +1,86 @@
+import pytest
+
+from date import DataLoader, scrie_binar, sursa_binara, sursa_csv
+
+EXEMPLE = [([0.1 * i, -0.2 * i], 0.5 * i) for i in range(23)]
+
+
+@pytest.fixture
+def fisier_csv(tmp_path):
+    cale = tmp_path / "date.csv"
+    randuri = ["x1,x2,y"] + [f"{x[0]},{x[1]},{y}" for x, y in EXEMPLE]
+    cale.write_text("\n".join(randuri) + "\n")
+    return cale
+
+
+@pytest.fixture
+def fisier_binar(tmp_path):
+    cale = tmp_path / "date.bin"
+    scrie_binar(cale, EXEMPLE)
+    return cale
+
+
+class TestSurse:
+    # CSV citit în bucăți mici dă exact exemplele scrise, în ordine
+    def test_csv_roundtrip_chunks(self, fisier_csv):
+        sursa = sursa_csv(fisier_csv, nr_intrari=2, antet=True, dimensiune_bucata=4)
+        assert list(sursa()) == [(x, pytest.approx(y)) for x, y in EXEMPLE]
+
+    # Fișierul binar: aceleași exemple, inclusiv ultima bucată incompletă
+    @pytest.mark.parametrize("bucata", [1, 5, 23, 100], ids=["1", "5", "23", "100"])
+    def test_binary_roundtrip_chunks(self, fisier_binar, bucata):
+        sursa = sursa_binara(fisier_binar, nr_intrari=2, dimensiune_bucata=bucata)
+        assert list(sursa()) == EXEMPLE
+
+    # Ținte cu mai multe ieșiri devin liste
+    def test_multi_output_targets(self, tmp_path):
+        cale = tmp_path / "multi.bin"
+        scrie_binar(cale, [([1.0], [2.0, 3.0])])
+        assert list(sursa_binara(cale, nr_intrari=1, nr_iesiri=2)()) == [([1.0], [2.0, 3.0])]
+
+    # Fișier trunchiat sau rând fără țintă → ValueError
+    def test_invalid_files(self, tmp_path, fisier_binar):
+        trunchiat = tmp_path / "trunchiat.bin"
+        trunchiat.write_bytes(fisier_binar.read_bytes()[:-8])
+        with pytest.raises(ValueError):
+            list(sursa_binara(trunchiat, nr_intrari=2)())
+
+        fara_tinta = tmp_path / "fara_tinta.csv"
+        fara_tinta.write_text("1.0,2.0\n")
+        with pytest.raises(ValueError):
+            list(sursa_csv(fara_tinta, nr_intrari=2)())
+
+
+class TestDataLoader:
+    # Batch-uri de dimensiune fixă, ultimul parțial, fără amestecare
+    def test_batches_in_order(self, fisier_binar):
+        loader = DataLoader(sursa_binara(fisier_binar, 2), batch=5)
+        batches = list(loader)
+        assert [len(X) for X, _ in batches] == [5, 5, 5, 5, 3]
+        assert [y for _, Y in batches for y in Y] == [y for _, y in EXEMPLE]
+
+    # Amestecarea păstrează mulțimea exemplelor, schimbă ordinea, e reproductibilă
+    def test_shuffle_buffer(self, fisier_binar):
+        loader = DataLoader(sursa_binara(fisier_binar, 2), batch=4, amestecare=8, seed=3)
+        ordine = [y for _, Y in loader for y in Y]
+        assert sorted(ordine) == [y for _, y in EXEMPLE]
+        assert ordine != [y for _, y in EXEMPLE]
+        again = DataLoader(sursa_binara(fisier_binar, 2), batch=4, amestecare=8, seed=3)
+        assert [y for _, Y in again for y in Y] == ordine
+
+    # Sursa se parcurge leneș: loader-ul nu cere mai mult decât tamponul + batch-ul
+    def test_streams_lazily(self):
+        cerute = []
+
+        def sursa():
+            for i in range(10_000):
+                cerute.append(i)
+                yield [float(i)], float(i)
+
+        X, _ = next(iter(DataLoader(sursa, batch=4, amestecare=16, seed=0)))
+        assert len(X) == 4 and len(cerute) <= 16 + 4
+
+    # Batch invalid → ValueError
+    def test_invalid_batch(self):
+        with pytest.raises(ValueError):
+            DataLoader(lambda: iter(()), batch=0)
@@ -0,0 +1,83 @@
+import math
+
+import pytest
+
+from dual import Dual
+from helpers import constants
+from scalar import Scalar
+
+TOL = constants.get("TOL")
+
+
+FUNCTII = {
+    "add_mul": lambda x: x * x + 3.0 * x + 1.0,
+    "sub_div": lambda x: (x - 2.0) / (x + 4.0) - 1.0 / x,
+    "pow": lambda x: x ** 3 - x ** -2,
+    "tanh": lambda x: (x * 0.7).tanh(),
+    "relu": lambda x: (x - 0.2).relu() * x,
+}
+
+
+class TestDual:
+    # Tangenta unei funcții de o variabilă = derivata calculată prin retroprop
+    @pytest.mark.parametrize("f", FUNCTII.values(), ids=FUNCTII.keys())
+    @pytest.mark.parametrize("x0", [0.6, 1.7])
+    def test_tangent_matches_reverse_mode(self, f, x0):
+        x = Scalar(x0)
+        y = f(x)
+        y.retroprop()
+        d = f(Dual(x0, 1.0))
+        assert d.valoare == pytest.approx(y.valoare, abs=TOL)
+        assert d.tangenta == pytest.approx(x.derivata, abs=TOL)
+
+    # dot_tanh acceptă amestec de Dual și float (tangentă 0)
+    def test_dot_tanh_mixed(self):
+        d = Dual.dot_tanh([0.5, Dual(-1.0, 1.0)], [Dual(2.0, 1.0), 3.0], 0.1)
+        z = 0.1 + 0.5 * 2.0 - 3.0
+        assert d.valoare == pytest.approx(math.tanh(z), abs=TOL)
+        assert d.tangenta == pytest.approx((1 - math.tanh(z) ** 2) * (0.5 + 3.0), abs=TOL)
+
+    def test_nonfinite_raises(self):
+        with pytest.raises(ValueError):
+            Dual(float("nan"))
+
+
+class TestJVP:
+    # J·v pe intrări = Σ_i (∂y/∂x_i) · v_i din retropropagare, pe fiecare ieșire
+    def test_jvp_inputs_matches_reverse_mode(self, retea, backend):
+        net = retea([3, 4, 2], backend, scara=0.5)
+        x0, v = [0.3, -0.8, 0.5], [1.0, 0.5, -2.0]
+        iesiri, tangente = net.jvp(x0, v)
+        assert iesiri == pytest.approx(net.predict(x0), abs=TOL)
+
+        for j in range(2):
+            x = [Scalar(a) for a in x0]
+            y = x
+            for layer in retea([3, 4, 2], scara=0.5).layers:
+                y = layer(y)
+            y[j].retroprop()
+            assert tangente[j] == pytest.approx(sum(xi.derivata * vi for xi, vi in zip(x, v)), abs=TOL)
+
+    # Direcție în spațiul parametrilor: J·v = ∇_θ y · v
+    def test_jvp_parameters_matches_gradient(self, retea, backend):
+        net = retea([3, 4, 1], backend, scara=0.5)
+        x0 = [0.3, -0.8, 0.5]
+        v = [math.sin(i) for i in range(net.tampon.nr_parametri)]
+        _, tangenta = net.jvp(x0, [0.0, 0.0, 0.0], v)
+
+        ref = retea([3, 4, 1], scara=0.5)
+        ref(x0).retroprop()
+        gradient = ref.tampon.gradienti
+        assert tangenta == pytest.approx(sum(g * vi for g, vi in zip(gradient, v)), abs=TOL)
+
+    # Nu se construiește niciun graf
+    def test_jvp_returns_floats(self, retea):
+        y, d = retea([2, 3, 1], scara=0.5).jvp([0.1, 0.2], [1.0, 0.0])
+        assert isinstance(y, float) and isinstance(d, float)
+
+    def test_wrong_direction_length_raises(self, retea):
+        net = retea([2, 3, 1], scara=0.5)
+        with pytest.raises(ValueError):
+            net.jvp([0.1, 0.2], [1.0])
+        with pytest.raises(ValueError):
+            net.jvp([0.1, 0.2], [1.0, 0.0], [0.0])
@@ -0,0 +1,51 @@
+import importlib.util
+import subprocess
+import sys
+
+import pytest
+
+
+def _importa(cale):
+    spec = importlib.util.spec_from_file_location(cale.stem, cale)
+    modul = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modul)
+    return modul
+
+
+X = [[0.3, -0.8, 0.5], [0.1, 0.2, -0.4], [-1.0, 0.7, 0.0]]
+
+
+class TestExport:
+    # Aceleași ieșiri ca rețeaua, cu una sau mai multe ieșiri
+    @pytest.mark.parametrize("dims", [[3, 4, 1], [3, 5, 4, 2]], ids=["o_iesire", "doua_iesiri"])
+    def test_matches_network(self, retea, tmp_path, dims):
+        net = retea(dims, scara=0.5)
+        net.exporta(tmp_path / "inferenta.py")
+        modul = _importa(tmp_path / "inferenta.py")
+        assert modul.DIMENSIUNI == tuple(dims)
+        assert modul.ACTIVARE == "tanh"
+        assert modul.PONDERI.tolist() == net.citeste_parametri().tolist()
+        for x in X:
+            assert modul.predict(x) == net.predict(x)
+            y = net(x)
+            y = y.valoare if dims[-1] == 1 else [v.valoare for v in y]
+            assert modul.predict(x) == pytest.approx(y, rel=1e-12)
+        assert modul.predict_batch(X) == [net.predict(x) for x in X]
+
+    def test_wrong_input_length(self, retea, tmp_path):
+        retea([3, 4, 1], scara=0.5).exporta(tmp_path / "inferenta.py")
+        modul = _importa(tmp_path / "inferenta.py")
+        with pytest.raises(ValueError):
+            modul.predict([0.1, 0.2])
+
+    # Modulul se importă fără `src/` pe cale și nu încarcă nimic din proiect
+    def test_standalone(self, retea, tmp_path):
+        retea([3, 4, 1], scara=0.5).exporta(tmp_path / "inferenta.py")
+        cod = (
+            "import sys, inferenta\n"
+            "print(inferenta.predict([0.3, -0.8, 0.5]))\n"
+            "assert not {'scalar', 'nn', 'tampon'} & set(sys.modules)\n"
+        )
+        rezultat = subprocess.run([sys.executable, "-E", "-s", "-c", cod], cwd=tmp_path, capture_output=True, text=True)
+        assert rezultat.returncode == 0, rezultat.stderr
+        assert float(rezultat.stdout) == retea([3, 4, 1], scara=0.5).predict([0.3, -0.8, 0.5])
@@ -0,0 +1,122 @@
+import math
+
+import numpy as np
+import pytest
+
+from helpers import constants, numeric_grad
+from layer_numpy import LayerNumpy, NodVector
+from nn import NN
+from scalar import Scalar
+
+TOL = constants.get("TOL")
+
+
+def _pereche(dims):
+    """O rețea Scalar și una NumPy cu aceleași ponderi."""
+    net_s, net_n = NN(dims), NN(dims, backend="numpy")
+    for i, (ps, pn) in enumerate(zip(net_s.parametri(), net_n.parametri())):
+        ps.valoare = pn.valoare = math.sin(i + 1.0)
+    return net_s, net_n
+
+
+class TestLayerNumpy:
+    # Forward: tanh(W·x + b) pe un strat cu ponderi controlate
+    def test_forward_values(self):
+        layer = LayerNumpy(2, 2)
+        layer.W[:] = [[1.0, -1.0], [0.5, 0.5]]
+        layer.b[:] = [0.0, 0.25]
+        y = layer(NodVector(np.array([2.0, -3.0])))
+        assert y.vector == pytest.approx([math.tanh(5.0), math.tanh(-0.25)], rel=TOL)
+
+    # Input cu lungime greșită → ValueError
+    def test_input_length_mismatch(self):
+        with pytest.raises(ValueError):
+            LayerNumpy(3, 2)(NodVector(np.zeros(2)))
+
+    # parametri(): aceeași ordine și număr ca Layer, vederi asupra matricelor
+    def test_parametri_views(self):
+        layer = LayerNumpy(3, 4)
+        params = layer.parametri()
+        assert len(params) == (3 + 1) * 4
+        params[0].valoare = 2.5
+        params[3].valoare = -1.5
+        assert layer.W[0, 0] == 2.5 and layer.b[0] == -1.5
+
+
+class TestNNNumpyVsScalar:
+    # Ieșiri identice (în toleranță) cu backend-ul Scalar
+    @pytest.mark.parametrize("dims", [[3, 4, 1], [2, 5, 3], [4, 6, 6, 2]], ids=["3-4-1", "2-5-3", "4-6-6-2"])
+    def test_forward_matches_scalar(self, dims):
+        net_s, net_n = _pereche(dims)
+        x = [0.1 * (i + 1) * (-1) ** i for i in range(dims[0])]
+        ys, yn = net_s(x), net_n(x)
+        ys = ys if isinstance(ys, list) else [ys]
+        yn = yn if isinstance(yn, list) else [yn]
+        assert [v.valoare for v in yn] == pytest.approx([v.valoare for v in ys], rel=TOL, abs=TOL)
+
+    # Gradientele tuturor parametrilor coincid cu cele obținute pe Scalar
+    @pytest.mark.parametrize("dims", [[3, 4, 1], [2, 3, 3, 2]], ids=["3-4-1", "2-3-3-2"])
+    def test_backward_matches_scalar(self, dims):
+        net_s, net_n = _pereche(dims)
+        x = [0.3, -0.8, 0.5][: dims[0]]
+        for net in (net_s, net_n):
+            y = net(x)
+            y = y if isinstance(y, list) else [y]
+            loss = y[0] * 0.0
+            for j, v in enumerate(y):
+                loss = loss + (v - 0.1 * j) ** 2
+            net.reset_deriv()
+            loss.retroprop()
+
+        for ps, pn in zip(net_s.parametri(), net_n.parametri()):
+            assert pn.derivata == pytest.approx(ps.derivata, rel=1e-9, abs=1e-9)
+
+    # Același graf retropropagat de două ori (cu ordinea refolosită): gradientele se dublează, ca pe Scalar
+    def test_repeated_backward_matches_scalar(self):
+        net_s, net_n = _pereche([3, 4, 2])
+        X, Y = [[0.3, -0.8, 0.5], [0.1, 0.2, -0.4]], [[0.7, -0.1], [-0.2, 0.3]]
+        for net in (net_s, net_n):
+            loss = net.pierdere_batch(X, Y)
+            ordine = loss.ordine_topologica()
+            loss.retroprop(ordine)
+            loss.retroprop(ordine)
+
+        for ps, pn in zip(net_s.parametri(), net_n.parametri()):
+            assert pn.derivata == pytest.approx(ps.derivata, rel=1e-9, abs=1e-9)
+
+    # Gradient analitic ≈ gradient numeric
+    def test_numeric_gradient_close(self):
+        net = NN([2, 3, 1], backend="numpy")
+        x, target = [0.5, -1.2], -0.3
+
+        def expr():
+            return (net(x) - target) ** 2
+
+        net.reset_deriv()
+        expr().retroprop()
+        for p in net.parametri()[:4]:
+            assert math.isclose(p.derivata, numeric_grad(expr, p), rel_tol=1e-3, abs_tol=1e-3)
+
+    # Ieșirea unui singur neuron este Scalar; repr arată straturile
+    def test_output_type_and_repr(self):
+        net = NN([2, 3, 1], backend="numpy")
+        assert isinstance(net([0.1, 0.2]), Scalar)
+        assert "LayerNumpy(3×2)" in repr(net)
+
+    # predict() pe backend-ul NumPy = __call__, fără noduri
+    def test_predict_matches_call(self):
+        net = NN([3, 5, 2], backend="numpy")
+        x = [0.3, -0.1, 0.7]
+        assert net.predict(x) == pytest.approx([v.valoare for v in net(x)], rel=TOL)
+
+    # Matricele straturilor sunt vederi asupra tamponului rețelei
+    def test_matrices_share_network_buffer(self):
+        net = NN([2, 3, 1], backend="numpy")
+        net.scrie_parametri([float(i) for i in range(len(net.parametri()))])
+        strat = net.layers[0]
+        assert strat.W.tolist() == [[0.0, 1.0], [3.0, 4.0], [6.0, 7.0]]
+        assert strat.b.tolist() == [2.0, 5.0, 8.0]
+        strat.dW[0, 0] = 1.5
+        assert net.parametri()[0].derivata == 1.5
+        net.reset_deriv()
+        assert strat.dW[0, 0] == 0.0
@@ -1,3 +1,6 @@
+import copy
+import math
+
 import pytest
 
 from nn import NN
@@ -54,3 +57,143 @@ class TestNNCore:
         out1 = net([0.5, -0.5])
         out2 = net([0.5, -0.5])
         assert out1 is not out2 and out1.valoare == out2.valoare
+
+    # predict() dă aceleași valori ca __call__, dar ca float-uri
+    @pytest.mark.parametrize("dims", [[3, 4, 1], [3, 4, 2]], ids=["1-out", "2-out"])
+    @pytest.mark.parametrize("backend", ["scalar", "banda"])
+    def test_predict_matches_call(self, dims, backend):
+        net = NN(dims, backend=backend)
+        x = [0.3, -0.1, 0.7]
+        out, pred = net(x), net.predict(x)
+        if dims[-1] == 1:
+            assert isinstance(pred, float)
+            assert pred == pytest.approx(out.valoare, rel=TOL)
+        else:
+            assert pred == pytest.approx([v.valoare for v in out], rel=TOL)
+
+    # predict() cu input de lungime greșită → ValueError
+    def test_predict_input_length_mismatch(self):
+        net = NN([3, 2, 1])
+        with pytest.raises(ValueError):
+            net.predict([1.0, 2.0])
+
+
+class TestNNTampon:
+    # Parametrii sunt vederi asupra tamponului, în ordinea lui parametri()
+    @pytest.mark.parametrize("backend", ["scalar", "banda"])
+    def test_parameters_are_buffer_views(self, backend):
+        net = NN([3, 4, 2], backend=backend)
+        params = net.parametri()
+        assert net.tampon.nr_parametri == len(params)
+        assert list(net.citeste_parametri()) == [p.valoare for p in params]
+        params[5].valoare = 7.5
+        assert net.tampon.valori[5] == 7.5
+
+    # reset_deriv, norma_gradient și scrie_parametri lucrează în bloc pe tampon
+    @pytest.mark.parametrize("backend", ["scalar", "banda"])
+    def test_bulk_operations(self, backend):
+        net = NN([2, 3, 1], backend=backend)
+        ((net([0.4, -0.6]) - 0.2) ** 2).retroprop()
+        grads = [p.derivata for p in net.parametri()]
+        assert net.norma_gradient() == pytest.approx(sum(g * g for g in grads) ** 0.5, rel=TOL)
+
+        net.reset_deriv()
+        assert net.norma_gradient() == 0.0
+
+        noi = [0.01 * i for i in range(len(grads))]
+        net.scrie_parametri(noi)
+        assert [p.valoare for p in net.parametri()] == pytest.approx(noi)
+        with pytest.raises(ValueError):
+            net.scrie_parametri(noi[:-1])
+
+    # Optimizatorul recunoaște tamponul rețelei și actualizează direct tablourile
+    def test_optimizer_uses_buffer(self):
+        from optim import SGD
+
+        net = NN([2, 3, 1])
+        opt = SGD(net.parametri(), lr=0.1)
+        assert opt.tampon is net.tampon
+        assert SGD(net.parametri()[:-1], lr=0.1).tampon is None
+
+        ((net([0.4, -0.6]) - 0.2) ** 2).retroprop()
+        asteptat = [p.valoare - 0.1 * p.derivata for p in net.parametri()]
+        opt.step()
+        opt.zero_grad()
+        assert [p.valoare for p in net.parametri()] == pytest.approx(asteptat, rel=TOL)
+        assert net.norma_gradient() == 0.0
+
+    # Ponderi înlocuite cu alte obiecte: operațiile în bloc trec pe obiecte
+    def test_bulk_operations_after_replacing_weights(self):
+        net = NN([2, 1])
+        neuron = net.layers[0].neuroni[0]
+        neuron.ponderi = [Scalar(2.0), Scalar(-1.0)]
+        ((net([1.5, -2.0]) - 0.3) ** 2).retroprop()
+        assert net.norma_gradient() > 0.0
+
+        net.reset_deriv()
+        assert all(p.derivata == 0.0 for p in net.parametri())
+        assert net.norma_gradient() == 0.0
+        assert list(net.citeste_parametri()) == [p.valoare for p in net.parametri()]
+
+        net.scrie_parametri([0.5, 0.25, -0.1])
+        assert [p.valoare for p in neuron.ponderi] == [0.5, 0.25]
+        assert net.predict([1.0, 1.0]) == pytest.approx(math.tanh(0.65), rel=TOL)
+
+
+    # Înlocuirea unei singure ponderi (oriunde în listă) iese din calea în bloc
+    @pytest.mark.parametrize("i", [0, 1])
+    def test_replacing_one_weight_in_place(self, i):
+        net = NN([2, 1])
+        neuron = net.layers[0].neuroni[0]
+        net.scrie_parametri([-0.5, 0.25, 0.1])
+        assert net.tampon.intact
+        neuron.ponderi[i] = Scalar(5.0)
+        assert not net.tampon.intact
+
+        ponderi = [-0.5, 0.25]
+        ponderi[i] = 5.0
+        asteptat = math.tanh(ponderi[0] * 0.3 + ponderi[1] * -0.4 + 0.1)
+        assert net([0.3, -0.4]).valoare == pytest.approx(asteptat, rel=TOL)
+        net.reset_deriv()
+        assert list(net.citeste_parametri()) == [*ponderi, 0.1]
+
+    # Un strat al rețelei acceptă intrări float, ca un `Layer` de sine stătător
+    def test_layer_accepts_float_inputs(self):
+        net = NN([2, 3, 1])
+        assert [y.valoare for y in net.layers[0]([0.1, 0.2])] == net.layers[0].predict([0.1, 0.2])
+
+    # Fără înlocuiri, tamponul rămâne intact pe orice backend (și la copiere)
+    def test_buffer_intact_without_replacement(self, backend):
+        net = NN([3, 4, 1], backend=backend)
+        net.scrie_parametri([0.1] * net.tampon.nr_parametri)
+        net.reset_deriv()
+        assert net.tampon.intact
+        assert copy.deepcopy(net).tampon.intact
+
+
+class TestNNHessiana:
+    # H·v al pierderii = diferența finită a gradientului pe direcția v
+    def test_hvp_matches_finite_difference(self):
+        net = NN([2, 3, 1])
+        for i, p in enumerate(net.parametri()):
+            p.valoare = 0.4 * math.cos(1.3 * i)
+        X, Y = [[0.3, -0.8], [0.9, 0.1]], [0.5, -0.2]
+        v = [math.sin(i + 1.0) for i in range(net.tampon.nr_parametri)]
+        hv = net.hvp(X, Y, v)
+
+        eps = 1e-5
+        theta = net.citeste_parametri()
+
+        def grad_in(semn):
+            net.scrie_parametri([t + semn * eps * vi for t, vi in zip(theta, v)])
+            net.reset_deriv()
+            net.retroprop_batch(X, Y)
+            return net.tampon.gradienti[:]
+
+        plus, minus = grad_in(1), grad_in(-1)
+        asteptat = [(a - b) / (2 * eps) for a, b in zip(plus, minus)]
+        assert hv == pytest.approx(asteptat, abs=1e-6)
+
+    def test_hvp_requires_scalar_backend(self):
+        with pytest.raises(ValueError):
+            NN([2, 2, 1], backend="banda").hvp([[0.1, 0.2]], [0.0], [0.0] * 9)
@@ -87,3 +87,25 @@ class TestNeuron:
         sigma_emp = statistics.pstdev(valori)
         sigma_teo = math.sqrt(2.0 / intrari)
         assert abs(sigma_emp - sigma_teo) < 0.2 * sigma_teo
+
+    # Forward fuzionat: un singur nod 'dot_tanh' cu părinții (bias, ponderi, intrări)
+    def test_fused_single_node(self):
+        n = Neuron(intrari=4)
+        x = [Scalar(0.1 * i) for i in range(4)]
+        y = n(x)
+        assert y._operatie == 'dot_tanh'
+        assert y._parinti == (n.bias, *n.ponderi, *x)
+        assert len(y.ordine_topologica()) == 2 * 4 + 2
+
+    # Gradientele intrărilor: autograd ≈ finite-difference
+    def test_gradient_intrari(self):
+        n = Neuron(intrari=3)
+        n.ponderi = [Scalar(0.4), Scalar(-0.9), Scalar(1.3)]
+        x = [Scalar(0.2), Scalar(-0.5), Scalar(0.8)]
+
+        def expr():
+            return n(x)
+
+        expr().retroprop()
+        for xi in x:
+            assert math.isclose(xi.derivata, numeric_grad(expr, xi), rel_tol=1e-3, abs_tol=1e-3)
@@ -0,0 +1,160 @@
+import math
+import random
+
+import pytest
+
+from helpers import constants
+from nn import NN
+from optim import SGD, Adam, NewtonCG, Optimizator, RMSProp
+from scalar import Scalar
+
+TOL = constants.get("TOL")
+
+
+def _patratic(w):
+    """f(w) = Σ (w_i − 1)², minim în w = 1."""
+    return Scalar.sum((p - 1.0) ** 2 for p in w)
+
+
+def _optimizeaza(opt, w, pasi):
+    for _ in range(pasi):
+        opt.zero_grad()
+        _patratic(w).retroprop()
+        opt.step()
+    return _patratic(w).valoare
+
+
+class TestOptimizatori:
+    # SGD fără momentum = actualizarea manuală p -= lr * g
+    def test_sgd_matches_manual_update(self):
+        net_a, net_b = NN([2, 3, 1]), NN([2, 3, 1])
+        for pa, pb in zip(net_a.parametri(), net_b.parametri()):
+            pb.valoare = pa.valoare
+
+        x, target, lr = [0.6, -0.9], -0.5, 0.05
+        opt = SGD(net_b.parametri(), lr=lr)
+        for _ in range(5):
+            loss_a = (net_a(x) - target) ** 2
+            net_a.reset_deriv()
+            loss_a.retroprop()
+            for p in net_a.parametri():
+                p.valoare -= lr * p.derivata
+
+            loss_b = (net_b(x) - target) ** 2
+            opt.zero_grad()
+            loss_b.retroprop()
+            opt.step()
+
+        for pa, pb in zip(net_a.parametri(), net_b.parametri()):
+            assert pb.valoare == pytest.approx(pa.valoare, rel=TOL, abs=TOL)
+
+    # Momentum: doi pași pe f(w)=(w−1)² dau valoarea calculată de mână
+    @pytest.mark.parametrize("nesterov, asteptat", [(False, 2.08), (True, 1.88)], ids=["clasic", "nesterov"])
+    def test_momentum_two_steps(self, nesterov, asteptat):
+        w = [Scalar(3.0)]
+        opt = SGD(w, lr=0.1, momentum=0.5, nesterov=nesterov)
+        _optimizeaza(opt, w, 2)
+        assert w[0].valoare == pytest.approx(asteptat, rel=TOL)
+
+    # Adam: primul pas are mărimea lr pe fiecare coordonată (semnul gradientului)
+    def test_adam_first_step_size(self):
+        w = [Scalar(3.0), Scalar(-2.0)]
+        opt = Adam(w, lr=0.1)
+        _optimizeaza(opt, w, 1)
+        assert [p.valoare for p in w] == pytest.approx([2.9, -1.9], rel=1e-6)
+
+    # Toți optimizatorii converg pe o funcție pătratică
+    @pytest.mark.parametrize(
+        "fabrica",
+        [
+            lambda w: SGD(w, lr=0.1),
+            lambda w: SGD(w, lr=0.05, momentum=0.9),
+            lambda w: SGD(w, lr=0.05, momentum=0.9, nesterov=True),
+            lambda w: RMSProp(w, lr=0.05),
+            lambda w: Adam(w, lr=0.1),
+        ],
+        ids=["sgd", "momentum", "nesterov", "rmsprop", "adam"],
+    )
+    def test_converges_on_quadratic(self, fabrica):
+        w = [Scalar(3.0), Scalar(-2.0), Scalar(0.5)]
+        assert _optimizeaza(fabrica(w), w, 200) < 1e-3
+
+    # Starea stă în tablouri contigue, câte o poziție pe parametru
+    def test_state_is_flat(self):
+        net = NN([3, 4, 1])
+        opt = Adam(net.parametri())
+        assert len(opt.m) == len(opt.v) == len(net.parametri())
+        assert opt.m.typecode == "d"
+
+    # zero_grad golește gradientele; parametri invalizi → ValueError
+    def test_zero_grad_and_validation(self):
+        net = NN([2, 3, 1])
+        ((net([0.4, -0.6]) - 0.2) ** 2).retroprop()
+        opt = SGD(net.parametri(), lr=0.1)
+        opt.zero_grad()
+        assert all(p.derivata == 0.0 for p in net.parametri())
+        with pytest.raises(ValueError):
+            SGD(net.parametri(), lr=-1.0)
+        with pytest.raises(ValueError):
+            SGD(net.parametri(), lr=0.1, nesterov=True)
+
+    # Pasul pe vederile tamponului = pasul pe parametri separați (copii)
+    @pytest.mark.parametrize("clasa", [SGD, RMSProp, Adam])
+    def test_buffer_step_matches_loose_parameters(self, clasa):
+        net = NN([3, 4, 2])
+        w = [Scalar(p.valoare) for p in net.parametri()]
+        opt_net, opt_w = clasa(net.parametri(), lr=0.05), clasa(w, lr=0.05)
+        assert opt_net.tampon is net.tampon and opt_w.tampon is None
+        for k in range(3):
+            for p, q in zip(net.parametri(), w):
+                p.derivata = q.derivata = math.sin(p.valoare + k)
+            opt_net.step()
+            opt_w.step()
+        assert net.citeste_parametri().tolist() == [q.valoare for q in w]
+
+    # `_actualizare` e abstractă: baza nu se poate instanția
+    def test_base_is_abstract(self):
+        with pytest.raises(TypeError):
+            Optimizator([Scalar(1.0)], lr=0.1)
+
+    # Adam antrenează rețeaua pe backend-ul bandă fără modificări
+    def test_adam_trains_tape_backend(self):
+        random.seed(0)
+        net = NN([2, 4, 1], backend="banda")
+        opt = Adam(net.parametri(), lr=0.05)
+        x, target = [0.6, -0.9], -0.5
+        for _ in range(100):
+            loss = (net(x) - target) ** 2
+            opt.zero_grad()
+            loss.retroprop()
+            opt.step()
+        assert math.isclose(net.predict(x), target, abs_tol=1e-2)
+
+
+class TestNewtonCG:
+    # Pe o funcție pătratică pasul Newton ajunge la minim dintr-o dată
+    def test_quadratic_in_one_step(self):
+        w = [Scalar(3.0), Scalar(-2.0), Scalar(0.5)]
+        opt = NewtonCG(w, lambda: _patratic(w), amortizare=0.0)
+        opt.step()
+        assert [p.valoare for p in w] == pytest.approx([1.0, 1.0, 1.0], abs=TOL)
+
+    # Pe o rețea, câțiva pași Newton-CG coboară pierderea mai mult decât tot atâția pași SGD
+    def test_fewer_steps_than_sgd(self):
+        X, Y = [[0.3, -0.8], [0.9, 0.1], [-0.5, 0.5]], [0.5, -0.2, 0.1]
+
+        def retea():
+            net = NN([2, 3, 1])
+            for i, p in enumerate(net.parametri()):
+                p.valoare = 0.4 * math.cos(1.3 * i)
+            return net
+
+        net_n, net_s = retea(), retea()
+        newton = NewtonCG(net_n.parametri(), lambda: net_n.pierdere_batch(X, Y), amortizare=1e-2)
+        sgd = SGD(net_s.parametri(), lr=0.1)
+        for _ in range(5):
+            newton.step()
+            sgd.zero_grad()
+            net_s.retroprop_batch(X, Y)
+            sgd.step()
+        assert net_n.pierdere_batch(X, Y).valoare < net_s.pierdere_batch(X, Y).valoare
@@ -0,0 +1,74 @@
+import pytest
+
+import scalar
+from layer import Layer
+from profilare import profilare, statistici_graf
+from scalar import Scalar
+
+
+X = [[0.3, -0.8, 0.5], [0.1, 0.2, -0.4]]
+Y = [[0.7, -0.1], [-0.2, 0.3]]
+
+
+class TestStatisticiGraf:
+    # x → x·x → tanh → + x: lanț de adâncime 3, x are trei copii
+    def test_depth_width_fan_out(self):
+        x = Scalar(0.5)
+        y = (x * x).tanh() + x
+        s = statistici_graf(y)
+        assert s == {
+            'noduri': 4, 'frunze': 1, 'adancime': 3, 'latime': 1,
+            'fan_out_max': 3, 'fan_out_mediu': 5 / 4,
+        }
+
+    # O sumă de n noduri tanh(x): n noduri pe același nivel
+    def test_wide_graph(self):
+        x = Scalar(0.1)
+        s = statistici_graf(Scalar.sum(x.tanh() for _ in range(10)))
+        assert (s['latime'], s['adancime'], s['fan_out_max']) == (10, 2, 10)
+
+
+class TestProfilare:
+    # Nodurile se numără pe cod de operație; frunzele apar sub ''
+    def test_counts_nodes_per_op(self):
+        with profilare() as p:
+            a, b, c = Scalar(1.0), Scalar(2.0), Scalar(3.0)
+            (a * b + c).tanh()
+        assert p.noduri == {'': 3, '*': 1, '+': 1, 'tanh': 1}
+
+    # Forward și retroprop pe fiecare strat, plus graful retropropagat
+    def test_per_layer_timing(self, retea):
+        net = retea([3, 4, 2])
+        with profilare() as p:
+            net.retroprop_batch(X, Y)
+        r = p.raport()
+        assert list(r['straturi']) == ['strat 0', 'strat 1']
+        for s in r['straturi'].values():
+            assert s['apeluri'] == len(X)
+            assert s['inainte_s'] > 0 and s['inapoi_s'] > 0
+        assert r['retroprop']['apeluri'] == 1
+        assert sum(s['inapoi_s'] for s in r['straturi'].values()) <= r['retroprop']['secunde']
+        # graful = nodurile create în context + parametrii, creați înainte
+        assert r['graf']['noduri'] == sum(r['noduri'].values()) + len(net.parametri())
+        assert 'strat 1' in str(p)
+
+    # Gradientele sunt aceleași cu și fără profilare
+    def test_gradients_unchanged(self, retea):
+        net = retea([3, 4, 2])
+        net.retroprop_batch(X, Y)
+        asteptat = net.tampon.gradienti[:]
+        net.reset_deriv()
+        with profilare():
+            net.retroprop_batch(X, Y)
+        assert net.tampon.gradienti[:] == asteptat
+
+    # La ieșire (și la excepție) se pun la loc funcțiile originale
+    def test_originals_restored(self):
+        init, retroprop, apel = Scalar.__init__, Scalar.retroprop, Layer.__call__
+        retro = dict(scalar._RETRO)
+        with pytest.raises(RuntimeError):
+            with profilare():
+                assert Scalar.__init__ is not init
+                raise RuntimeError
+        assert (Scalar.__init__, Scalar.retroprop, Layer.__call__) == (init, retroprop, apel)
+        assert scalar._RETRO == retro
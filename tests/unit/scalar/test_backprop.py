@@ -1,7 +1,9 @@
 import math
 
+import pytest
+
 from helpers import numeric_grad, constants
-from scalar import Scalar
+from scalar import Scalar, gradient, hvp, no_grad
 
 TOL = constants.get("TOL")
 
@@ -69,3 +71,185 @@ class TestScalarBackprop:
         for param in (x, y):
             num = numeric_grad(expr, param)
             assert math.isclose(param.derivata, num, rel_tol=1e-3, abs_tol=1e-3)
+
+    # Lanț foarte adânc: ordonarea iterativă nu atinge limita de recursivitate
+    def test_deep_chain_no_recursion_limit(self):
+        x = Scalar(1.0)
+        f = x
+        for _ in range(5000):
+            f = f + x
+        f.retroprop()
+        assert math.isclose(x.derivata, 5001.0, rel_tol=TOL, abs_tol=TOL)
+
+    # Ordinea topologică: fiecare părinte apare înaintea copiilor săi
+    def test_topological_order_parents_first(self):
+        a, b = Scalar(2.0), Scalar(-1.0)
+        f = (a * b + a).tanh()
+        ordine = f.ordine_topologica()
+        pozitie = {id(n): i for i, n in enumerate(ordine)}
+        assert ordine[-1] is f
+        for nod in ordine:
+            assert all(pozitie[id(p)] < pozitie[id(nod)] for p in nod._parinti)
+
+    # Ordinea calculată o singură dată se refolosește, gradientele rămân corecte
+    def test_cached_order_reused(self, monkeypatch):
+        x = Scalar(0.5)
+        f = (x * 3 + 1) ** 2
+        ordine = f.ordine_topologica()
+        f.retroprop(ordine)
+        grad1 = x.derivata
+
+        x.derivata = 0.0
+        monkeypatch.setattr(Scalar, "ordine_topologica", None)
+        f.retroprop(ordine)
+        assert math.isclose(x.derivata, grad1, rel_tol=TOL, abs_tol=TOL)
+
+    # Nodul nu reține ordinea: fără ciclu de referințe, fără slot suplimentar
+    def test_order_not_stored_on_node(self):
+        f = Scalar(0.5) * 3
+        f.retroprop(f.ordine_topologica())
+        assert not hasattr(f, "_ordine")
+
+    # Același operand de două ori (a*a, a+a): părinții sunt tuple, gradientul se cumulează
+    def test_repeated_operand_accumulates(self):
+        a = Scalar(3.0)
+        (a * a + a).retroprop()
+        assert math.isclose(a.derivata, 2 * 3.0 + 1, rel_tol=TOL, abs_tol=TOL)
+
+    # Nodul compact: fără __dict__, derivare prin codul operației
+    def test_compact_node_layout(self):
+        x = Scalar(2.0)
+        y = x ** 3
+        assert not hasattr(y, '__dict__')
+        assert y._parinti == (x,) and y._operatie == '**' and y._arg == 3
+        y._retro(1.0)
+        assert math.isclose(x.derivata, 3 * 2.0 ** 2, rel_tol=TOL, abs_tol=TOL)
+
+    # Σ ca nod n-ar: un singur nod, gradient 1 pentru fiecare termen (cu repetiții)
+    def test_nary_sum(self):
+        xs = [Scalar(float(i)) for i in range(1, 6)]
+        f = Scalar.sum([*xs, xs[0], 2.5])
+        assert f._operatie == 'sum'
+        assert math.isclose(f.valoare, 15.0 + 1.0 + 2.5, rel_tol=TOL)
+        f.retroprop()
+        assert [x.derivata for x in xs] == [2.0, 1.0, 1.0, 1.0, 1.0]
+
+    # Produs scalar n-ar: gradient autograd ≈ numeric pe ponderi și intrări
+    def test_nary_dot(self):
+        ws = [Scalar(0.5), Scalar(-1.5), Scalar(2.0)]
+        xs = [Scalar(1.0), Scalar(0.25), Scalar(-0.75)]
+
+        def expr():
+            return Scalar.dot(ws, xs).tanh()
+
+        expr().retroprop()
+        for p in ws + xs:
+            assert math.isclose(p.derivata, numeric_grad(expr, p), rel_tol=1e-3, abs_tol=1e-3)
+
+    # Vectori de lungimi diferite → ValueError, și la nodul fuzionat
+    def test_nary_dot_length_mismatch(self):
+        with pytest.raises(ValueError):
+            Scalar.dot([Scalar(1.0)], [Scalar(1.0), Scalar(2.0)])
+        with pytest.raises(ValueError, match="lungimi 2 și 1"):
+            Scalar.dot_tanh([Scalar(1.0), Scalar(2.0)], [Scalar(1.0)], Scalar(0.5))
+
+    # no_grad(): valorile se calculează, dar nodurile nu rețin părinți
+    def test_no_grad_builds_no_graph(self):
+        x = Scalar(0.5)
+        with no_grad():
+            f = ((x * 3) + 2).tanh()
+        assert math.isclose(f.valoare, math.tanh(3.5), rel_tol=TOL)
+        assert f._parinti == () and f._operatie == ''
+        f.retroprop()
+        assert x.derivata == 0.0
+
+        g = x * 3  # după ieșirea din context graful se construiește din nou
+        assert g._parinti[0] is x and g._operatie == "*"
+
+    # Implicit graful se eliberează: nodurile interne pierd părinții după retroprop
+    def test_graph_released_after_backward(self):
+        x = Scalar(0.5)
+        mijloc = x * 3
+        f = (mijloc + 1).tanh()
+        f.retroprop()
+        expected = 3 * (1 - math.tanh(2.5) ** 2)
+        assert math.isclose(x.derivata, expected, rel_tol=TOL, abs_tol=TOL)
+        assert mijloc._parinti == () and f._parinti == ()
+        assert mijloc.valoare == 1.5  # valorile rămân disponibile
+
+    # retain_graph=True păstrează graful: a doua retropropagare cumulează din nou
+    def test_retain_graph_allows_second_backward(self):
+        x = Scalar(2.0)
+        f = x * x
+        f.retroprop(retain_graph=True)
+        assert f._parinti == (x, x)
+        f.retroprop()
+        assert math.isclose(x.derivata, 2 * 4.0, rel_tol=TOL, abs_tol=TOL)
+
+    # Nodurile interne nu cumulează între parcurgeri: (x·x)·1 de două ori dă 2 · 4, nu 12
+    def test_retained_backward_resets_inner_gradients(self):
+        x = Scalar(2.0)
+        f = (x * x) * 1.0
+        f.retroprop(retain_graph=True)
+        f.retroprop(retain_graph=True)
+        assert math.isclose(x.derivata, 2 * 4.0, rel_tol=TOL, abs_tol=TOL)
+
+    # Un graf deja eliberat nu mai poate fi parcurs: RuntimeError, nu gradiente nule
+    @pytest.mark.parametrize(
+        "parcurgere",
+        [
+            lambda y, x: y.retroprop(),
+            lambda y, x: ((y - 1.0) ** 2).retroprop(),
+            lambda y, x: gradient(y, [x]),
+        ],
+        ids=["same_root", "new_loss_on_freed_node", "gradient"],
+    )
+    def test_freed_graph_raises(self, parcurgere):
+        x = Scalar(1.5)
+        y = (x * x).tanh()
+        (y * 2.0).retroprop()
+        with pytest.raises(RuntimeError):
+            parcurgere(y, x)
+
+    # Ordine refolosită fără retain_graph → ValueError
+    def test_cache_requires_retained_graph(self):
+        with pytest.raises(ValueError):
+            f = Scalar(1.0) * 2
+            f.retroprop(f.ordine_topologica(), retain_graph=False)
+
+
+class TestOrdinSuperior:
+    # gradient() dă aceleași valori ca retroprop, fără a atinge `derivata`
+    def test_gradient_matches_retroprop(self):
+        x, y = Scalar(0.7), Scalar(-1.3)
+        f = Scalar.dot_tanh([x, y], [y, x], x) * (x ** 3) + (y * 0.5).relu() - x / y
+        gx, gy = gradient(f, [x, y])
+        assert x.derivata == y.derivata == 0.0
+        f.retroprop()
+        assert math.isclose(gx.valoare, x.derivata, rel_tol=TOL, abs_tol=TOL)
+        assert math.isclose(gy.valoare, y.derivata, rel_tol=TOL, abs_tol=TOL)
+
+    # Derivata a doua prin dublă retropropagare: f = x³·tanh(x)
+    def test_second_derivative(self):
+        x0 = 0.8
+        x = Scalar(x0)
+        dx, = gradient(x ** 3 * x.tanh(), [x])
+        d2x, = gradient(dx, [x])
+        t = math.tanh(x0)
+        s = 1 - t * t
+        asteptat = 6 * x0 * t + 6 * x0 ** 2 * s - 2 * x0 ** 3 * t * s
+        assert math.isclose(d2x.valoare, asteptat, rel_tol=TOL, abs_tol=TOL)
+
+    # H·v pentru f(x, y) = x²·y + y³: H = [[2y, 2x], [2x, 6y]]
+    def test_hvp_quadratic_form(self):
+        x, y = Scalar(1.5), Scalar(-0.5)
+        f = x ** 2 * y + y ** 3
+        v = [0.3, -2.0]
+        H = [[2 * -0.5, 2 * 1.5], [2 * 1.5, 6 * -0.5]]
+        assert hvp(f, [x, y], v) == pytest.approx([sum(h * vi for h, vi in zip(r, v)) for r in H], abs=TOL)
+
+    # Nodurile fără legătură cu ieșirea au gradient 0
+    def test_gradient_unrelated_node(self):
+        x, z = Scalar(2.0), Scalar(5.0)
+        gx, gz = gradient(x * x, [x, z])
+        assert gx.valoare == 4.0 and gz.valoare == 0.0
@@ -2,7 +2,7 @@ import math
 import operator
 import pytest
 
-from scalar import Scalar
+from scalar import AnomalieNumerica, Scalar, detectie_anomalii, mod_rapid
 from helpers import constants
 
 TOL = constants.get("TOL")
@@ -57,3 +57,57 @@ class TestScalarRobustness:
     def test_repr_contains_keywords(self, val):
         rep = repr(Scalar(val))
         assert "valoare=" in rep and "deriv=" in rep
+
+
+class TestModuriVerificare:
+    # mod_rapid(): NaN/inf se propagă fără eroare; la ieșire verificarea revine
+    def test_fast_mode_skips_checks(self):
+        with mod_rapid():
+            y = Scalar(1e308) * Scalar(10.0) + 1.0
+        assert math.isinf(y.valoare)
+        with pytest.raises(ValueError):
+            Scalar(float("nan"))
+
+    # Anomalie la forward: operația, locul creării și părinții
+    def test_anomaly_reports_forward_operation(self):
+        with detectie_anomalii():
+            a = Scalar(1e307)
+            b = a * 2.0
+            with pytest.raises(AnomalieNumerica) as info:
+                _ = b * 10.0
+        e = info.value
+        assert isinstance(e, ValueError)
+        assert e.operatie == "*"
+        assert "test_robustness.py" in str(e)
+        assert any("'*'" in linie for linie in e.lant)  # părintele b = a * 2.0
+
+    # Anomalie la retropropagare: gradientul inf apare în '*' cu 1e300
+    def test_anomaly_reports_backward_operation(self):
+        with detectie_anomalii():
+            x = Scalar(1.0)
+            y = ((x * 1e-300) * 1e300) * 1e300
+            with pytest.raises(AnomalieNumerica) as info:
+                y.retroprop()
+        assert info.value.operatie == "*"
+        assert "Gradientul inf" in str(info.value)
+
+    # Un graf construit în mod rapid este verificat la retroprop în modul anomalii
+    def test_anomaly_checks_values_built_in_fast_mode(self):
+        with mod_rapid():
+            y = (Scalar(1e308) * Scalar(10.0)).tanh()
+        with detectie_anomalii():
+            with pytest.raises(AnomalieNumerica, match="non-finită"):
+                y.retroprop()
+
+    # Fără anomalii, modul de depanare dă aceleași gradiente
+    def test_anomaly_mode_same_gradients(self):
+        def f(x, w):
+            return (Scalar.dot_tanh([w], [x], w) - 0.3) ** 2
+
+        x, w = Scalar(0.5), Scalar(-1.2)
+        f(x, w).retroprop()
+        asteptat = (x.derivata, w.derivata)
+        x.derivata = w.derivata = 0.0
+        with detectie_anomalii():
+            f(x, w).retroprop()
+        assert (x.derivata, w.derivata) == asteptat